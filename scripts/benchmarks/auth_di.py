@@ -0,0 +1,177 @@
+"""Benchmark the per-request overhead of API key authentication.
+
+Compares resolving ``AuthenticateApiKeyInteractor`` from the application
+container (the current path) against building it in the request container
+together with a request-scoped repository and ``AsyncSession`` (the
+previous path). The key is warm in the authentication cache, so neither
+path touches the database and the difference is the cost of the DI graph.
+
+Usage:
+    python -m scripts.benchmarks.auth_di --iterations 20000
+"""
+
+import argparse
+import asyncio
+import time
+from uuid import UUID
+
+from dishka import Provider
+from dishka import Scope
+from dishka import make_async_container
+from dishka import provide
+from redis.asyncio import Redis as RedisEngine
+from rich import get_console
+from rich.table import Table
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.application.interactors.auth.authenticate import AuthenticateApiKeyInteractor
+from src.application.interactors.auth.authenticate import AuthenticateApiKeyRequestModel
+from src.application.interfaces.repositories.api_key import (
+    IGetPrincipalByApiKeyRepository,
+)
+from src.application.interfaces.services.auth_cache import IAuthCache
+from src.application.interfaces.services.hashers import IHasher
+from src.application.ioc import ApplicationProvider
+from src.domain.entities.auth.principal import Principal
+from src.infrastructure.database.base import BaseAlchemyRepository
+from src.infrastructure.database.engine import get_alchemy_engine
+from src.infrastructure.database.repositories.auth.principal import PrincipalRepository
+from src.infrastructure.ioc import InfrastructureProvider
+from src.infrastructure.redis.engine import get_redis_engine
+from src.infrastructure.vault.client import IVaultClient
+from src.infrastructure.vault.engine import get_vault_engine
+from src.main.config.settings import DatabaseSettings
+from src.main.config.settings import Settings
+from src.main.config.settings import VaultSettings
+
+API_KEY = "0191a4b4-8c33-7a4e-9f2a-5b0c8f1d2e3a"
+USER_ID = UUID("3165d5df-17a7-4562-b5f5-5f4bd16c97f3")
+API_KEY_ID = UUID("0191a4b4-8c33-7a4e-9f2a-5b0c8f1d2e3a")
+
+
+class RequestScopedPrincipalRepository(
+    BaseAlchemyRepository,
+    IGetPrincipalByApiKeyRepository,
+):
+    """Principal lookup as it was resolved for every request."""
+
+    async def get_principal_by_api_key_hash(
+        self,
+        api_key_hashed: bytes,
+        api_key_id: UUID | None = None,
+    ) -> Principal | None:
+        """Get principal by API key."""
+        result = await self._session.execute(
+            PrincipalRepository.principal_by_api_key_hash_statement,
+            {"api_key_hashed": api_key_hashed},
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return Principal(user_id=row.user_id, api_key_id=row.id)
+
+
+class RequestScopedAuthProvider(Provider):
+    """Register authentication in the request scope."""
+
+    principal_repository = provide(
+        source=RequestScopedPrincipalRepository,
+        scope=Scope.REQUEST,
+        provides=IGetPrincipalByApiKeyRepository,
+    )
+
+    authenticate_api_key_interactor = provide(
+        source=AuthenticateApiKeyInteractor,
+        scope=Scope.REQUEST,
+    )
+
+
+def make_container(settings: Settings, *, request_scoped: bool):
+    """Make a container wired like the API application."""
+    providers = [InfrastructureProvider(), ApplicationProvider()]
+    if request_scoped:
+        providers.append(RequestScopedAuthProvider())
+
+    return make_async_container(
+        *providers,
+        context={
+            Settings: settings,
+            AsyncEngine: get_alchemy_engine(db_settings=settings.db),
+            RedisEngine: get_redis_engine(redis_settings=settings.redis),
+            IVaultClient: get_vault_engine(vault_settings=settings.vault),
+        },
+    )
+
+
+async def warm_cache(container) -> None:
+    """Put the benchmark key into the authentication cache."""
+    hasher = await container.get(IHasher)
+    auth_cache = await container.get(IAuthCache)
+    auth_cache.set(
+        hasher.digest(API_KEY.encode()),
+        Principal(user_id=USER_ID, api_key_id=API_KEY_ID),
+    )
+
+
+async def run_request_scoped(container, iterations: int) -> float:
+    """Authenticate resolving the interactor in the request container."""
+    request_model = AuthenticateApiKeyRequestModel(api_key=API_KEY)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        async with container() as request_container:
+            interactor = await request_container.get(AuthenticateApiKeyInteractor)
+            await interactor(request_model)
+    return time.perf_counter() - started
+
+
+async def run_app_scoped(container, iterations: int) -> float:
+    """Authenticate resolving the interactor in the application container."""
+    request_model = AuthenticateApiKeyRequestModel(api_key=API_KEY)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        async with container():
+            interactor = await container.get(AuthenticateApiKeyInteractor)
+            await interactor(request_model)
+    return time.perf_counter() - started
+
+
+async def main(iterations: int) -> None:
+    """Run the benchmark."""
+    # engines are created but never connect, the key is always served warm
+    settings = Settings(
+        vault=VaultSettings(TOKEN="benchmark"),  # noqa: S106
+        db=DatabaseSettings(
+            USER="benchmark",
+            PASSWORD="benchmark",  # noqa: S106
+            DB="benchmark",
+        ),
+    )
+
+    results: dict[str, float] = {}
+    for name, request_scoped, run in (
+        ("request scope (previous)", True, run_request_scoped),
+        ("app scope (current)", False, run_app_scoped),
+    ):
+        container = make_container(settings, request_scoped=request_scoped)
+        await warm_cache(container)
+        await run(container, iterations // 10)
+        results[name] = await run(container, iterations)
+        await container.close()
+
+    table = Table(title=f"API key authentication, {iterations} warm requests")
+    table.add_column("path")
+    table.add_column("µs / request", justify="right")
+    table.add_column("requests / s", justify="right")
+    for name, elapsed in results.items():
+        table.add_row(
+            name,
+            f"{elapsed / iterations * 1e6:.1f}",
+            f"{iterations / elapsed:,.0f}",
+        )
+    get_console().print(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    asyncio.run(main(parser.parse_args().iterations))
@@ -0,0 +1,141 @@
+"""Benchmark the CPU cost of the authentication query.
+
+Compares the prebuilt column projection of ``PrincipalRepository`` against
+loading the full ``User`` entity, with the statement built on every call,
+both executed directly and through advanced_alchemy's ``get_one_or_none``
+(the original path). The query runs against an in-memory SQLite database, so
+the I/O is negligible and the difference is statement construction, cache
+key generation, ORM loading and the repository overhead.
+
+Usage:
+    python -m scripts.benchmarks.auth_statement --iterations 5000
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from uuid import uuid4
+
+from advanced_alchemy.base import orm_registry
+from rich import get_console
+from rich.table import Table
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.application.services.core.stage_timings import StageTimings
+from src.domain.entities.auth.api_key import ApiKey
+from src.domain.entities.auth.principal import Principal
+from src.domain.entities.users.user import User
+from src.infrastructure.database.base import AlchemyRepository
+from src.infrastructure.database.base import GenericAlchemyRepository
+from src.infrastructure.database.repositories.auth.principal import PrincipalRepository
+from src.infrastructure.database.tables import api_key_table
+from src.infrastructure.database.tables import user_table
+from src.main.config.settings import AuthSettings
+
+API_KEY_HASHED = bytes(16)
+
+
+class UserByApiKeyRepository(AlchemyRepository[User]):
+    """User lookup as it was done by ``UserRepository``."""
+
+    entity_type = User
+    repository_type = GenericAlchemyRepository[User]
+
+    async def get_user_by_api_key_hash(self, api_key_hashed: bytes) -> User | None:
+        """Get user by API key."""
+        return await self._repository.get_one_or_none(
+            statement=select(User)
+            .join(api_key_table)
+            .where(api_key_table.c.key_hashed == api_key_hashed),
+        )
+
+
+async def seed(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    """Add a user with an API key."""
+    async with session_maker() as session:
+        user = User(id=uuid4(), email="bench@example.com")
+        session.add(user)
+        session.add(ApiKey(key_hashed=API_KEY_HASHED, user_id=user.id))
+        await session.commit()
+
+
+def make_lookups(
+    session_maker: async_sessionmaker[AsyncSession],
+) -> dict[str, Callable[[], Awaitable[object | None]]]:
+    """Make the compared lookups."""
+
+    async def get_one_or_none() -> User | None:
+        async with session_maker() as session:
+            repository = UserByApiKeyRepository(session=session)
+            return await repository.get_user_by_api_key_hash(API_KEY_HASHED)
+
+    async def built_per_call() -> User | None:
+        async with session_maker() as session:
+            return await session.scalar(
+                select(User)
+                .join(api_key_table)
+                .where(api_key_table.c.key_hashed == API_KEY_HASHED),
+            )
+
+    repository = PrincipalRepository(
+        session_maker=session_maker,
+        stage_timings=StageTimings(auth_settings=AuthSettings()),
+    )
+
+    async def principal() -> Principal | None:
+        return await repository.get_principal_by_api_key_hash(API_KEY_HASHED)
+
+    return {
+        "User, get_one_or_none (original)": get_one_or_none,
+        "User, statement built per call": built_per_call,
+        "Principal, prebuilt projection (current)": principal,
+    }
+
+
+async def main(iterations: int) -> None:
+    """Run the benchmark."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(
+            orm_registry.metadata.create_all,
+            tables=[user_table, api_key_table],
+        )
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    results: dict[str, float] = {}
+    try:
+        await seed(session_maker)
+        for name, lookup in make_lookups(session_maker).items():
+            for _ in range(iterations // 10):
+                assert await lookup() is not None  # noqa: S101
+            started = time.process_time()
+            for _ in range(iterations):
+                await lookup()
+            results[name] = time.process_time() - started
+    finally:
+        await engine.dispose()
+
+    table = Table(title=f"Authentication by API key hash, {iterations} lookups")
+    table.add_column("query")
+    table.add_column("CPU µs / call", justify="right")
+    table.add_column("saved µs / call", justify="right")
+    baseline = next(iter(results.values()))
+    for name, elapsed in results.items():
+        table.add_row(
+            name,
+            f"{elapsed / iterations * 1e6:.1f}",
+            f"{(baseline - elapsed) / iterations * 1e6:.1f}",
+        )
+    get_console().print(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5_000)
+    asyncio.run(main(parser.parse_args().iterations))
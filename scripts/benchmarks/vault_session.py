@@ -0,0 +1,196 @@
+"""Benchmark units of work of ``VaultSession`` against an in-memory Vault.
+
+Each unit of work adds API keys of new users with ``ApiKeyVaultRepository``,
+one key per path as ``CreateApiKeyInteractor`` does, and is either committed
+or flushed and rolled back. Vault is served by ``InMemoryVaultTransport``
+through ``AsyncVaultClient``, with the given latency per request and rate of
+injected 503 errors, so the results show the round trips and concurrency of
+the session rather than the speed of a Vault server. The mount point is not
+provisioned, the first units create it.
+
+Usage:
+    python -m scripts.benchmarks.vault_session --units 200 --latency 2
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from uuid import uuid4
+
+from hvac.exceptions import VaultError
+from rich import get_console
+from rich.table import Table
+
+from scripts.benchmarks.vault_transport import InMemoryVaultTransport
+from src.infrastructure.vault.cache import InMemoryVaultSecretCache
+from src.infrastructure.vault.client import AsyncVaultClient
+from src.infrastructure.vault.repositories.api_key import ApiKeyVaultRepository
+from src.infrastructure.vault.session import VaultMountCache
+from src.infrastructure.vault.session import VaultSession
+from src.main.config.settings import VaultSettings
+
+SIZES = (1, 10, 100)
+
+
+class Bench:
+    """Sessions sharing one client, as the requests of a process do."""
+
+    def __init__(self, transport: InMemoryVaultTransport, settings: VaultSettings):
+        """Initialize benchmark."""
+        self.transport = transport
+        self.settings = settings
+        self.client = AsyncVaultClient(
+            url="http://vault.invalid",
+            token=settings.TOKEN,
+            transport=transport,
+        )
+        self.mount_cache = VaultMountCache(ttl=settings.MOUNT_CACHE_TTL)
+        self.secret_cache = InMemoryVaultSecretCache(
+            max_size=settings.READ_CACHE_MAX_SIZE,
+        )
+
+    def session(self) -> VaultSession:
+        """Make a session."""
+        return VaultSession(
+            vault_client=self.client,
+            mount_cache=self.mount_cache,
+            secret_cache=self.secret_cache,
+            flush_concurrency=self.settings.FLUSH_CONCURRENCY,
+            read_cache_ttl=self.settings.READ_CACHE_TTL,
+        )
+
+    async def add_keys(self, session: VaultSession, size: int) -> None:
+        """Add the API keys of ``size`` new users."""
+        repository = ApiKeyVaultRepository(
+            session=session,
+            vault_settings=self.settings,
+        )
+        for _ in range(size):
+            await repository.add_api_key(
+                user_id=uuid4(),
+                api_key_id=str(uuid4()),
+                api_key=str(uuid4()),
+            )
+
+    async def commit(self, size: int) -> dict[str, float]:
+        """Commit a unit of work."""
+        session = self.session()
+        await self.add_keys(session, size)
+        started = time.perf_counter()
+        await session.commit()
+        return {"commit": time.perf_counter() - started}
+
+    async def flush_and_rollback(self, size: int) -> dict[str, float]:
+        """Flush a unit of work, then roll it back."""
+        session = self.session()
+        await self.add_keys(session, size)
+        started = time.perf_counter()
+        try:
+            await session.flush()
+        finally:
+            flushed = time.perf_counter()
+            await session.rollback()
+        return {"flush": flushed - started, "rollback": time.perf_counter() - flushed}
+
+
+async def run_units(
+    unit: Callable[[], Awaitable[dict[str, float]]],
+    units: int,
+    concurrency: int,
+) -> tuple[float, dict[str, list[float]], int]:
+    """Run units of work concurrently, get the time, timings and failures."""
+    limit = asyncio.Semaphore(concurrency)
+    timings: dict[str, list[float]] = {}
+    failed = 0
+
+    async def run() -> None:
+        nonlocal failed
+        async with limit:
+            try:
+                result = await unit()
+            except VaultError:
+                failed += 1
+                return
+        for name, elapsed in result.items():
+            timings.setdefault(name, []).append(elapsed)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run() for _ in range(units)))
+    return time.perf_counter() - started, timings, failed
+
+
+def percentiles(values: list[float]) -> str:
+    """Format the median and 95th percentile in milliseconds."""
+    if len(values) < 2:  # noqa: PLR2004
+        return "-" if not values else f"{values[0] * 1e3:.1f}"
+    quantiles = statistics.quantiles(values, n=20)
+    return f"{statistics.median(values) * 1e3:.1f} / {quantiles[18] * 1e3:.1f}"
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    settings = VaultSettings(TOKEN="benchmark")  # noqa: S106
+    transport = InMemoryVaultTransport(
+        latency=args.latency / 1e3,
+        error_rate=args.error_rate,
+        seed=0,
+    )
+    bench = Bench(transport, settings)
+    # failed units are counted, not logged
+    logging.getLogger(VaultSession.__module__).setLevel(logging.CRITICAL)
+
+    table = Table(
+        title=(
+            f"VaultSession, {args.units} units of work, {args.concurrency} at once, "
+            f"{args.latency} ms per request, {args.error_rate:.0%} errors"
+        ),
+    )
+    table.add_column("ops / unit", justify="right")
+    table.add_column("commits / s", justify="right")
+    table.add_column("commit ms p50 / p95", justify="right")
+    table.add_column("flush ms p50 / p95", justify="right")
+    table.add_column("rollback ms p50 / p95", justify="right")
+    table.add_column("requests / commit", justify="right")
+    table.add_column("failed", justify="right")
+
+    try:
+        for size in SIZES:
+            transport.requests.clear()
+            elapsed, commits, commit_failures = await run_units(
+                lambda size=size: bench.commit(size),
+                args.units,
+                args.concurrency,
+            )
+            requests = sum(transport.requests.values())
+            _, rollbacks, rollback_failures = await run_units(
+                lambda size=size: bench.flush_and_rollback(size),
+                args.units,
+                args.concurrency,
+            )
+            committed = len(commits.get("commit", []))
+            table.add_row(
+                str(size),
+                f"{committed / elapsed:.0f}",
+                percentiles(commits.get("commit", [])),
+                percentiles(rollbacks.get("flush", [])),
+                percentiles(rollbacks.get("rollback", [])),
+                f"{requests / args.units:.1f}",
+                str(commit_failures + rollback_failures),
+            )
+    finally:
+        await bench.client.close()
+
+    get_console().print(table)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--units", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=2.0, help="ms per request")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,196 @@
+"""In-process stand-in for the Vault HTTP API, for benchmarks and tests."""
+
+import asyncio
+import json
+import random
+from collections import Counter
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+
+import httpx
+
+
+class InMemoryVaultTransport(httpx.AsyncBaseTransport):
+    """Vault HTTP API kept in memory, for ``AsyncVaultClient``.
+
+    Serves the endpoints the application uses: ``sys/mounts`` and the KV v2
+    ``data``, ``metadata`` and ``destroy`` paths, including check-and-set
+    and merge patches. Every request waits ``latency`` seconds, and fails
+    with a 503 at ``error_rate``, so load tests can run without a Vault.
+    Requests are counted by method and endpoint in ``requests``.
+    """
+
+    cas_mismatch_message = "check-and-set parameter did not match the current version"
+    injected_error_message = "injected failure"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+    ):
+        """Initialize transport."""
+        self.latency = latency
+        self.error_rate = error_rate
+        self.requests: Counter[str] = Counter()
+        self._random = random.Random(seed)  # noqa: S311
+        # versions of secrets by mount point and path, oldest first
+        self._mounts: dict[str, dict[str, list[dict[str, Any]]]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request to the Vault API."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.url.path.removeprefix("/v1/").strip("/")
+        body = json.loads(request.content) if request.content else {}
+        # mount point, then the KV endpoint, then the secret path
+        endpoint = (
+            "sys/mounts"
+            if path.startswith("sys/mounts")
+            else path.partition("/")[2].partition("/")[0]
+        )
+        self.requests[f"{request.method} {endpoint}"] += 1
+
+        if self._random.random() < self.error_rate:
+            return self._error(503, self.injected_error_message)
+        if path == "sys/mounts":
+            return self._list_mounts()
+        if path.startswith("sys/mounts/"):
+            return self._enable_mount(path.removeprefix("sys/mounts/"), body)
+        return self._handle_kv(request.method, path, body)
+
+    def _list_mounts(self) -> httpx.Response:
+        """List mounted KV engines."""
+        mounts = {
+            f"{mount_point}/": {"type": "kv", "options": {"version": "2"}}
+            for mount_point in self._mounts
+        }
+        return httpx.Response(200, json={**mounts, "data": mounts})
+
+    def _enable_mount(self, mount_point: str, body: dict[str, Any]) -> httpx.Response:
+        """Mount a KV engine."""
+        if body.get("type") != "kv":
+            return self._error(400, "only kv engines are supported")
+        if mount_point in self._mounts:
+            return self._error(400, f"path is already in use at {mount_point}/")
+        self._mounts[mount_point] = {}
+        return httpx.Response(204)
+
+    def _handle_kv(  # noqa: PLR0911
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any],
+    ) -> httpx.Response:
+        """Answer a request to a KV v2 engine."""
+        mount_point, _, rest = path.partition("/")
+        kind, _, secret_path = rest.partition("/")
+        secrets = self._mounts.get(mount_point)
+        if secrets is None or not secret_path:
+            return self._error(404, f"no handler for route '{path}'")
+        versions = secrets.setdefault(secret_path, [])
+
+        match (method, kind):
+            case ("GET", "data"):
+                return self._read(versions)
+            case ("POST", "data"):
+                return self._write(versions, body, body.get("data", {}))
+            case ("PATCH", "data"):
+                if not self._is_readable(versions):
+                    return self._error(404, "")
+                data = {**versions[-1]["data"], **body.get("data", {})}
+                return self._write(
+                    versions,
+                    body,
+                    {key: value for key, value in data.items() if value is not None},
+                )
+            case ("GET", "metadata"):
+                return self._read_metadata(versions)
+            case ("POST", "destroy"):
+                for version in body.get("versions", []):
+                    if 0 < version <= len(versions):
+                        versions[version - 1]["destroyed"] = True
+                        versions[version - 1]["data"] = None
+                return httpx.Response(204)
+        return self._error(405, f"unsupported operation {method} {kind}")
+
+    def _read(self, versions: list[dict[str, Any]]) -> httpx.Response:
+        """Read the latest version of a secret."""
+        if not self._is_readable(versions):
+            return self._error(404, "")
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "data": versions[-1]["data"],
+                    "metadata": self._version_metadata(versions, len(versions)),
+                },
+            },
+        )
+
+    def _write(
+        self,
+        versions: list[dict[str, Any]],
+        body: dict[str, Any],
+        data: dict[str, Any],
+    ) -> httpx.Response:
+        """Write a new version of a secret, checking ``cas`` if given."""
+        cas = body.get("options", {}).get("cas")
+        if cas is not None and cas != len(versions):
+            return self._error(400, self.cas_mismatch_message)
+        versions.append(
+            {
+                "data": data,
+                "created_time": datetime.now(UTC).isoformat(),
+                "destroyed": False,
+            },
+        )
+        return httpx.Response(
+            200,
+            json={"data": self._version_metadata(versions, len(versions))},
+        )
+
+    def _read_metadata(self, versions: list[dict[str, Any]]) -> httpx.Response:
+        """Read the metadata of a secret."""
+        if not versions:
+            return self._error(404, "")
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "current_version": len(versions),
+                    "versions": {
+                        str(version): self._version_metadata(versions, version)
+                        for version in range(1, len(versions) + 1)
+                    },
+                },
+            },
+        )
+
+    @staticmethod
+    def _is_readable(versions: list[dict[str, Any]]) -> bool:
+        """Check if the latest version of a secret has data."""
+        return bool(versions) and not versions[-1]["destroyed"]
+
+    @staticmethod
+    def _version_metadata(
+        versions: list[dict[str, Any]],
+        version: int,
+    ) -> dict[str, Any]:
+        """Get the metadata of a secret version."""
+        return {
+            "version": version,
+            "created_time": versions[version - 1]["created_time"],
+            "deletion_time": "",
+            "destroyed": versions[version - 1]["destroyed"],
+        }
+
+    @staticmethod
+    def _error(status_code: int, message: str) -> httpx.Response:
+        """Get an error response in the format of Vault."""
+        return httpx.Response(
+            status_code,
+            json={"errors": [message] if message else []},
+        )
@@ -1,14 +1,26 @@
 """AuthenticateApiKeyInteractor module."""
 
 from dataclasses import dataclass
+from uuid import UUID
 
 from litestar.exceptions import NotAuthorizedException
 
 from src.application.common.interactor import Interactor
-from src.application.interfaces.repositories.api_key import IGetUserByApiKeyRepository
+from src.application.interfaces.repositories.api_key import (
+    IGetPrincipalByApiKeyRepository,
+)
+from src.application.interfaces.repositories.api_key_filter import (
+    IApiKeyFilterRepository,
+)
+from src.application.interfaces.repositories.auth_index import IAuthIndexRepository
+from src.application.interfaces.services.auth_cache import IAuthCache
 from src.application.interfaces.services.hashers import IHasher
+from src.application.interfaces.services.single_flight import ISingleFlight
+from src.application.interfaces.services.stage_timings import IStageTimings
 from src.application.interfaces.services.uuid import IGenerateUUID7Service
-from src.domain.entities.users.user import User
+from src.domain.entities.auth.principal import Principal
+from src.domain.value_objects.api_key_token import ApiKeyToken
+from src.main.config.settings import AppSettings
 
 
 @dataclass
@@ -19,35 +31,126 @@ class AuthenticateApiKeyRequestModel:
 
 
 class AuthenticateApiKeyInteractor(
-    Interactor[AuthenticateApiKeyRequestModel, User],
+    Interactor[AuthenticateApiKeyRequestModel, Principal],
 ):
     """AuthenticateApiKeyInteractor."""
 
     def __init__(
         self,
-        user_repository: IGetUserByApiKeyRepository,
+        principal_repository: IGetPrincipalByApiKeyRepository,
         generate_uuid7_service: IGenerateUUID7Service,
         hash_service: IHasher,
+        auth_cache: IAuthCache,
+        single_flight: ISingleFlight,
+        api_key_filter_repository: IApiKeyFilterRepository,
+        auth_index_repository: IAuthIndexRepository,
+        app_settings: AppSettings,
+        stage_timings: IStageTimings,
     ):
         """Initialize interactor."""
-        self._user_repository = user_repository
+        self._principal_repository = principal_repository
         self._generate_uuid7_service = generate_uuid7_service
         self._hash_service = hash_service
+        self._auth_cache = auth_cache
+        self._single_flight = single_flight
+        self._api_key_filter_repository = api_key_filter_repository
+        self._auth_index_repository = auth_index_repository
+        self._api_key_prefixes = {
+            app_settings.API_KEY_PREFIX,
+            *app_settings.API_KEY_PREVIOUS_PREFIXES,
+        }
+        self._stage_timings = stage_timings
 
     async def __call__(
         self,
         request_model: AuthenticateApiKeyRequestModel,
-    ) -> User:
+    ) -> Principal:
         """Authenticate an API key."""
+        principal = await self.resolve(request_model.api_key)
+        if not principal:
+            raise NotAuthorizedException
+
+        return principal
+
+    async def resolve(self, api_key: str) -> Principal | None:
+        """Get the principal of an API key, None if it is not valid.
+
+        Other interactors deciding whether a key is valid use it, so they
+        decide the same way as authentication.
+        """
+        # malformed keys are rejected without any I/O
+        try:
+            api_key_id: UUID | None = self._get_api_key_id(api_key)
+        except NotAuthorizedException:
+            return None
+
         # get api key hash
-        api_key_hashed: str = self._hash_service.hash(request_model.api_key.encode())
+        with self._stage_timings.measure("auth-hash"):
+            api_key_hashed: bytes = self._hash_service.digest(api_key.encode())
 
-        # get user by api key hash
-        user: User | None = await self._user_repository.get_user_by_api_key_hash(
-            api_key_hashed=api_key_hashed,
-        )
+        # warm keys are served from the cache
+        with self._stage_timings.measure("auth-cache"):
+            principal: Principal | None = self._auth_cache.get(api_key_hashed)
+        if principal:
+            return principal
 
-        if not user:
-            raise NotAuthorizedException
+        # concurrent lookups of the same key share a single query
+        with self._stage_timings.measure("auth-load"):
+            return await self._single_flight.do(
+                api_key_hashed,
+                lambda: self._load_principal(api_key_hashed, api_key_id),
+            )
+
+    def _get_api_key_id(self, api_key: str) -> UUID | None:
+        """Get the key id of a token, or None for a legacy UUID key.
+
+        Tokens with the current prefix or a previous one are accepted, so
+        changing the prefix does not invalidate keys already issued.
+        """
+        prefix, separator, _ = api_key.partition(ApiKeyToken.separator)
+        try:
+            if separator:
+                if prefix not in self._api_key_prefixes:
+                    raise NotAuthorizedException
+                return ApiKeyToken.parse(api_key, prefix=prefix).key_id
+
+            # legacy keys are bare UUIDs, looked up by hash
+            UUID(api_key)
+        except ValueError:
+            raise NotAuthorizedException from None
+
+        return None
+
+    async def _load_principal(
+        self,
+        api_key_hashed: bytes,
+        api_key_id: UUID | None,
+    ) -> Principal | None:
+        """Get principal by api key hash and cache it.
+
+        The Redis index is read first, the database is queried only for keys
+        missing from it, and those are added back to the index.
+        """
+        with self._stage_timings.measure("auth-index"):
+            principal = await self._auth_index_repository.get(api_key_hashed)
+
+        if not principal:
+            # unknown keys are rejected without querying the database
+            with self._stage_timings.measure("auth-filter"):
+                might_contain = await self._api_key_filter_repository.might_contain(
+                    api_key_hashed,
+                )
+            if not might_contain:
+                return None
+
+            principal = await self._principal_repository.get_principal_by_api_key_hash(
+                api_key_hashed=api_key_hashed,
+                api_key_id=api_key_id,
+            )
+            if principal:
+                await self._auth_index_repository.set(api_key_hashed, principal)
+
+        if principal:
+            self._auth_cache.set(api_key_hashed, principal)
 
-        return user
+        return principal
@@ -0,0 +1,48 @@
+"""AuthenticateAccessTokenInteractor module."""
+
+from dataclasses import dataclass
+
+from litestar.exceptions import NotAuthorizedException
+
+from src.application.common.interactor import Interactor
+from src.application.interfaces.repositories.access_token_deny_list import (
+    IAccessTokenDenyListRepository,
+)
+from src.application.interfaces.services.access_tokens import IAccessTokenService
+from src.domain.entities.auth.principal import Principal
+
+
+@dataclass
+class AuthenticateAccessTokenRequestModel:
+    """Authenticate an access token request model."""
+
+    access_token: str
+
+
+class AuthenticateAccessTokenInteractor(
+    Interactor[AuthenticateAccessTokenRequestModel, Principal],
+):
+    """Authenticate an access token in-process, without any I/O."""
+
+    def __init__(
+        self,
+        access_token_service: IAccessTokenService,
+        access_token_deny_list_repository: IAccessTokenDenyListRepository,
+    ):
+        """Initialize interactor."""
+        self._access_token_service = access_token_service
+        self._access_token_deny_list_repository = access_token_deny_list_repository
+
+    async def __call__(
+        self,
+        request_model: AuthenticateAccessTokenRequestModel,
+    ) -> Principal:
+        """Authenticate an access token."""
+        claims = self._access_token_service.verify(request_model.access_token)
+        if claims is None or self._access_token_deny_list_repository.is_revoked(
+            claims.principal.api_key_id,
+            claims.issued_at,
+        ):
+            raise NotAuthorizedException
+
+        return claims.principal
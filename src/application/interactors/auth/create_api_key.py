@@ -6,12 +6,19 @@ from uuid import UUID
 
 from src.application.common.interactor import Interactor
 from src.application.interfaces.repositories.api_key import ICreateApiKeyRepository
+from src.application.interfaces.repositories.api_key_filter import (
+    IApiKeyFilterRepository,
+)
+from src.application.interfaces.repositories.auth_index import IAuthIndexRepository
 from src.application.interfaces.services.api_key import ICreateAPIKeyVaultRepository
 from src.application.interfaces.services.hashers import IHasher
 from src.application.interfaces.services.uuid import IGenerateUUID7Service
 from src.domain.entities.auth.api_key import ApiKey
+from src.domain.entities.auth.principal import Principal
+from src.domain.value_objects.api_key_token import ApiKeyToken
 from src.infrastructure.common.interfaces import IDatabaseSession
 from src.infrastructure.common.interfaces import IVaultSession
+from src.main.config.settings import AppSettings
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +30,7 @@ class CreateApiKeyRequestModel:
     user_id: UUID
 
 
-class CreateApiKeyInteractor(Interactor[CreateApiKeyRequestModel, UUID]):
+class CreateApiKeyInteractor(Interactor[CreateApiKeyRequestModel, str]):
     """Create api key interactor."""
 
     def __init__(
@@ -34,6 +41,9 @@ class CreateApiKeyInteractor(Interactor[CreateApiKeyRequestModel, UUID]):
         uuid7_generator_service: IGenerateUUID7Service,
         hasher_service: IHasher,
         vault_repository: ICreateAPIKeyVaultRepository,
+        api_key_filter_repository: IApiKeyFilterRepository,
+        auth_index_repository: IAuthIndexRepository,
+        app_settings: AppSettings,
     ):
         """Initialize interactor."""
         self._db_session = db_session
@@ -42,24 +52,31 @@ class CreateApiKeyInteractor(Interactor[CreateApiKeyRequestModel, UUID]):
         self._uuid7_generator_service = uuid7_generator_service
         self._hasher_service = hasher_service
         self._vault_service = vault_repository
+        self._api_key_filter_repository = api_key_filter_repository
+        self._auth_index_repository = auth_index_repository
+        self._api_key_prefix = app_settings.API_KEY_PREFIX
 
     async def __call__(
         self,
         request_model: CreateApiKeyRequestModel,
-    ) -> UUID:
+    ) -> str:
         """Create an api key."""
         # TODO: limit API keys to N per user.
         #  prevent race condition with rate limit or FOR UPDATE
 
-        # generate UUID7 key
-        api_key_value: UUID = self._uuid7_generator_service.generate_uuid7()
+        # generate a key carrying its own id
+        api_key_id: UUID = self._uuid7_generator_service.generate_uuid7()
+        api_key_value: str = str(
+            ApiKeyToken.generate(prefix=self._api_key_prefix, key_id=api_key_id),
+        )
 
         # hash key
-        key_hashed: str = self._hasher_service.hash(str(api_key_value).encode())
+        key_hashed: bytes = self._hasher_service.digest(api_key_value.encode())
 
         # create one
         api_key: ApiKey = await self._create_api_key_repository.create_one(
             ApiKey(
+                id=api_key_id,
                 user_id=request_model.user_id,
                 key_hashed=key_hashed,
             ),
@@ -72,9 +89,21 @@ class CreateApiKeyInteractor(Interactor[CreateApiKeyRequestModel, UUID]):
             api_key=api_key_value,
         )
 
-        # save changes
+        # add to the filter before the key becomes valid,
+        # so it is never rejected as unknown, a failed add aborts the creation
+        await self._api_key_filter_repository.add(key_hashed)
+
+        # save changes, with the outbox enabled the key is written to Vault
+        # by its dispatcher and the Vault session has nothing to flush
         await self._vault_session.flush()
         await self._db_session.commit()
         await self._vault_session.commit()
 
+        # index the key once it is committed, a failed write is repaired
+        # by the first authentication with it
+        await self._auth_index_repository.set(
+            key_hashed,
+            Principal(user_id=request_model.user_id, api_key_id=api_key_id),
+        )
+
         return api_key_value
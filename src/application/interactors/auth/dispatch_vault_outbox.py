@@ -0,0 +1,38 @@
+"""Dispatch Vault outbox interactor."""
+
+from src.application.common.interactor import Interactor
+from src.application.interfaces.services.vault_outbox import IVaultOutboxDispatcher
+from src.application.interfaces.services.vault_outbox import OutboxDispatchResult
+
+
+class DispatchVaultOutboxInteractor(Interactor[None, OutboxDispatchResult]):
+    """Write the API keys waiting in the outbox to Vault."""
+
+    def __init__(
+        self,
+        vault_outbox_dispatcher: IVaultOutboxDispatcher,
+    ):
+        """Initialize interactor."""
+        self._vault_outbox_dispatcher = vault_outbox_dispatcher
+
+    async def __call__(
+        self,
+        request_model: None = None,
+    ) -> OutboxDispatchResult:
+        """Write due entries batch by batch, until none is left.
+
+        Failed entries become due again after a backoff, so they are not
+        retried within the same call.
+        """
+        written = failed = dead_lettered = 0
+        while True:
+            result = await self._vault_outbox_dispatcher.dispatch()
+            if not result.written and not result.failed and not result.dead_lettered:
+                return OutboxDispatchResult(
+                    written=written,
+                    failed=failed,
+                    dead_lettered=dead_lettered,
+                )
+            written += result.written
+            failed += result.failed
+            dead_lettered += result.dead_lettered
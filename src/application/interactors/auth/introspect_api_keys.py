@@ -0,0 +1,111 @@
+"""Introspect API keys interactor."""
+
+import asyncio
+from dataclasses import dataclass
+from uuid import UUID
+
+from litestar.exceptions import ClientException
+from litestar.exceptions import PermissionDeniedException
+
+from src.application.common.interactor import Interactor
+from src.application.interactors.auth.authenticate import AuthenticateApiKeyInteractor
+from src.domain.entities.auth.principal import Principal
+from src.main.config.settings import AuthSettings
+
+
+@dataclass
+class IntrospectApiKeysRequestModel:
+    """Introspect API keys request model."""
+
+    user_id: UUID
+    api_keys: list[str]
+
+
+@dataclass
+class ApiKeyIntrospection:
+    """Validity and principal of an API key."""
+
+    valid: bool
+    user_id: UUID | None = None
+    api_key_id: UUID | None = None
+
+
+@dataclass
+class IntrospectApiKeysResponseModel:
+    """Introspect API keys response model."""
+
+    results: list[ApiKeyIntrospection]
+    max_age: int
+
+
+class IntrospectApiKeysInteractor(
+    Interactor[IntrospectApiKeysRequestModel, IntrospectApiKeysResponseModel],
+):
+    """Check many API keys of any user at once, for gateways validating keys.
+
+    Only the users configured as gateways may introspect keys. Keys are
+    resolved the same way as in authentication, through the cache, the
+    index, the filter and the key id lookup, so a key is valid here exactly
+    when it authenticates.
+    """
+
+    def __init__(
+        self,
+        authenticate_api_key_interactor: AuthenticateApiKeyInteractor,
+        auth_settings: AuthSettings,
+    ):
+        """Initialize interactor."""
+        self._authenticate_api_key_interactor = authenticate_api_key_interactor
+        self._gateway_user_ids = set(auth_settings.INTROSPECT_GATEWAY_USER_IDS)
+        self._max_keys = auth_settings.INTROSPECT_MAX_KEYS
+        self._max_age = auth_settings.INTROSPECT_MAX_AGE
+        self._concurrency = auth_settings.INTROSPECT_CONCURRENCY
+        self._message_not_a_gateway = "Only gateways can introspect API keys."
+        self._message_too_many_keys = (
+            f"At most {self._max_keys} API keys can be introspected at once."
+        )
+
+    async def __call__(
+        self,
+        request_model: IntrospectApiKeysRequestModel,
+    ) -> IntrospectApiKeysResponseModel:
+        """Introspect API keys.
+
+        Results are in the order of the request. Each distinct key is
+        resolved once, at most ``INTROSPECT_CONCURRENCY`` at a time.
+        """
+        if request_model.user_id not in self._gateway_user_ids:
+            raise PermissionDeniedException(detail=self._message_not_a_gateway)
+
+        if len(request_model.api_keys) > self._max_keys:
+            raise ClientException(detail=self._message_too_many_keys)
+
+        limit = asyncio.Semaphore(self._concurrency)
+
+        async def resolve(api_key: str) -> Principal | None:
+            async with limit:
+                return await self._authenticate_api_key_interactor.resolve(api_key)
+
+        api_keys = list(dict.fromkeys(request_model.api_keys))
+        principals = dict(
+            zip(
+                api_keys,
+                await asyncio.gather(*(resolve(api_key) for api_key in api_keys)),
+                strict=True,
+            ),
+        )
+
+        results: list[ApiKeyIntrospection] = []
+        for api_key in request_model.api_keys:
+            principal = principals[api_key]
+            results.append(
+                ApiKeyIntrospection(
+                    valid=True,
+                    user_id=principal.user_id,
+                    api_key_id=principal.api_key_id,
+                )
+                if principal
+                else ApiKeyIntrospection(valid=False),
+            )
+
+        return IntrospectApiKeysResponseModel(results=results, max_age=self._max_age)
@@ -0,0 +1,52 @@
+"""Issue access token interactor."""
+
+from dataclasses import dataclass
+
+from src.application.common.interactor import Interactor
+from src.application.interactors.auth.authenticate import AuthenticateApiKeyInteractor
+from src.application.interactors.auth.authenticate import AuthenticateApiKeyRequestModel
+from src.application.interfaces.services.access_tokens import IAccessTokenService
+
+
+@dataclass
+class IssueAccessTokenRequestModel:
+    """Issue access token request model."""
+
+    api_key: str
+
+
+@dataclass
+class IssueAccessTokenResponseModel:
+    """Issue access token response model."""
+
+    access_token: str
+    expires_in: int
+    token_type: str = "bearer"
+
+
+class IssueAccessTokenInteractor(
+    Interactor[IssueAccessTokenRequestModel, IssueAccessTokenResponseModel],
+):
+    """Exchange an API key for a short-lived access token."""
+
+    def __init__(
+        self,
+        authenticate_api_key_interactor: AuthenticateApiKeyInteractor,
+        access_token_service: IAccessTokenService,
+    ):
+        """Initialize interactor."""
+        self._authenticate_api_key_interactor = authenticate_api_key_interactor
+        self._access_token_service = access_token_service
+
+    async def __call__(
+        self,
+        request_model: IssueAccessTokenRequestModel,
+    ) -> IssueAccessTokenResponseModel:
+        """Issue an access token for the principal of an API key."""
+        principal = await self._authenticate_api_key_interactor(
+            AuthenticateApiKeyRequestModel(api_key=request_model.api_key),
+        )
+        return IssueAccessTokenResponseModel(
+            access_token=self._access_token_service.issue(principal),
+            expires_in=self._access_token_service.lifetime,
+        )
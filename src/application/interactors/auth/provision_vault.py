@@ -0,0 +1,29 @@
+"""Provision Vault interactor."""
+
+from src.application.common.interactor import Interactor
+from src.application.interfaces.services.api_key import IProvisionVaultRepository
+
+
+class ProvisionVaultInteractor(Interactor[None, list[str]]):
+    """Create the Vault mount points used by the application."""
+
+    def __init__(
+        self,
+        api_key_vault_repository: IProvisionVaultRepository,
+    ):
+        """Initialize interactor."""
+        self._vault_repositories = [api_key_vault_repository]
+
+    async def __call__(
+        self,
+        request_model: None = None,
+    ) -> list[str]:
+        """Provision Vault.
+
+        Returns the mount points, which are then cached as existing, so
+        request-time flushes do not list the mounts.
+        """
+        return [
+            await vault_repository.provision()
+            for vault_repository in self._vault_repositories
+        ]
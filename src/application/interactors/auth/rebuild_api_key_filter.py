@@ -0,0 +1,54 @@
+"""Rebuild API key filter interactor."""
+
+import logging
+from dataclasses import dataclass
+
+from src.application.common.interactor import Interactor
+from src.application.interfaces.repositories.api_key import IGetApiKeyHashesRepository
+from src.application.interfaces.repositories.api_key_filter import (
+    IApiKeyFilterRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RebuildApiKeyFilterRequestModel:
+    """Rebuild API key filter request model."""
+
+    only_if_missing: bool = False
+
+
+class RebuildApiKeyFilterInteractor(
+    Interactor[RebuildApiKeyFilterRequestModel, int],
+):
+    """Rebuild the filter of issued API keys from the database."""
+
+    def __init__(
+        self,
+        api_key_repository: IGetApiKeyHashesRepository,
+        api_key_filter_repository: IApiKeyFilterRepository,
+    ):
+        """Initialize interactor."""
+        self._api_key_repository = api_key_repository
+        self._api_key_filter_repository = api_key_filter_repository
+        self._message_already_built = "API key filter already built. Skipping."
+
+    async def __call__(
+        self,
+        request_model: RebuildApiKeyFilterRequestModel,
+    ) -> int:
+        """Rebuild the API key filter.
+
+        Returns the number of API keys added to the filter.
+        """
+        if (
+            request_model.only_if_missing
+            and await self._api_key_filter_repository.exists()
+        ):
+            logger.info(self._message_already_built)
+            return 0
+
+        return await self._api_key_filter_repository.rebuild(
+            self._api_key_repository.stream_api_key_hashes(),
+        )
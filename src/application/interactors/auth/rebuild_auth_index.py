@@ -0,0 +1,32 @@
+"""Rebuild authentication index interactor."""
+
+from src.application.common.interactor import Interactor
+from src.application.interfaces.repositories.api_key import (
+    IGetApiKeyPrincipalsRepository,
+)
+from src.application.interfaces.repositories.auth_index import IAuthIndexRepository
+
+
+class RebuildAuthIndexInteractor(Interactor[None, int]):
+    """Rebuild the index of principals by API key from the database."""
+
+    def __init__(
+        self,
+        api_key_repository: IGetApiKeyPrincipalsRepository,
+        auth_index_repository: IAuthIndexRepository,
+    ):
+        """Initialize interactor."""
+        self._api_key_repository = api_key_repository
+        self._auth_index_repository = auth_index_repository
+
+    async def __call__(
+        self,
+        request_model: None = None,
+    ) -> int:
+        """Rebuild the authentication index.
+
+        Returns the number of API keys indexed.
+        """
+        return await self._auth_index_repository.rebuild(
+            self._api_key_repository.stream_api_key_principals(),
+        )
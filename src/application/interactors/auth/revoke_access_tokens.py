@@ -0,0 +1,39 @@
+"""Revoke access tokens interactor."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.common.interactor import Interactor
+from src.application.interfaces.repositories.access_token_deny_list import (
+    IAccessTokenDenyListRepository,
+)
+
+
+@dataclass
+class RevokeAccessTokensRequestModel:
+    """Revoke access tokens request model."""
+
+    api_key_id: UUID
+
+
+class RevokeAccessTokensInteractor(
+    Interactor[RevokeAccessTokensRequestModel, None],
+):
+    """Revoke all access tokens issued so far for an API key."""
+
+    def __init__(
+        self,
+        access_token_deny_list_repository: IAccessTokenDenyListRepository,
+    ):
+        """Initialize interactor."""
+        self._access_token_deny_list_repository = access_token_deny_list_repository
+
+    async def __call__(
+        self,
+        request_model: RevokeAccessTokensRequestModel,
+    ) -> None:
+        """Revoke access tokens of an API key.
+
+        Other processes reject the tokens once they refresh the deny-list.
+        """
+        await self._access_token_deny_list_repository.revoke(request_model.api_key_id)
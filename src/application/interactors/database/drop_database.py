@@ -3,6 +3,7 @@
 from litestar.exceptions import InternalServerException
 
 from src.application.common.interactor import Interactor
+from src.application.interfaces.repositories.auth_index import IAuthIndexRepository
 from src.application.interfaces.repositories.database import (
     IDropDatabaseTablesRepository,
 )
@@ -18,11 +19,13 @@ class DropDatabaseInteractor(Interactor[None, None]):
         session: IDatabaseSession,
         app_settings: AppSettings,
         drop_database_tables_repository: IDropDatabaseTablesRepository,
+        auth_index_repository: IAuthIndexRepository,
     ):
         """Initialize interactor."""
         self._session = session
         self._debug: bool = app_settings.DEBUG
         self._drop_database_tables_repository = drop_database_tables_repository
+        self._auth_index_repository = auth_index_repository
         self._message_can_not_drop = "Cannot drop database in production."
 
     async def __call__(
@@ -39,3 +42,6 @@ class DropDatabaseInteractor(Interactor[None, None]):
 
         # commit the transaction
         await self._session.commit()
+
+        # the dropped keys must not authenticate through the index
+        await self._auth_index_repository.clear()
@@ -0,0 +1,27 @@
+"""Interfaces for the deny-list of access tokens."""
+
+from abc import abstractmethod
+from typing import Protocol
+from uuid import UUID
+
+
+class IAccessTokenDenyListRepository(Protocol):
+    """API keys whose access tokens issued until some time are revoked.
+
+    Checks are answered from memory, the list is shared through ``refresh``.
+    """
+
+    @abstractmethod
+    def is_revoked(self, api_key_id: UUID, issued_at: float) -> bool:
+        """Check if a token issued for an API key at a time is revoked."""
+        ...
+
+    @abstractmethod
+    async def revoke(self, api_key_id: UUID) -> None:
+        """Revoke all tokens issued so far for an API key."""
+        ...
+
+    @abstractmethod
+    async def refresh(self) -> None:
+        """Load revocations made by other processes."""
+        ...
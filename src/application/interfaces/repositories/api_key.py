@@ -1,11 +1,13 @@
 """Interfaces for repositories in auth feature."""
 
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from collections.abc import Sequence
 from typing import Protocol
 from uuid import UUID
 
 from src.domain.entities.auth.api_key import ApiKey
-from src.domain.entities.users.user import User
+from src.domain.entities.auth.principal import Principal
 
 
 class ICreateApiKeyRepository(Protocol):
@@ -17,12 +19,32 @@ class ICreateApiKeyRepository(Protocol):
         ...
 
 
-class IGetUserByApiKeyRepository(Protocol):
-    """Interface for getting user by API key."""
+class IGetPrincipalByApiKeyRepository(Protocol):
+    """Interface for getting principal by API key."""
 
     @abstractmethod
-    async def get_user_by_api_key_hash(self, api_key_hashed: str) -> User | None:
-        """Get user by API key."""
+    async def get_principal_by_api_key_hash(
+        self,
+        api_key_hashed: bytes,
+        api_key_id: UUID | None = None,
+    ) -> Principal | None:
+        """Get principal by API key.
+
+        When the key id is known, the key is fetched by its primary key and
+        the hash is verified, otherwise it is looked up by the hash.
+        """
+        ...
+
+
+class IGetPrincipalsByApiKeyHashesRepository(Protocol):
+    """Interface for getting principals by many API keys at once."""
+
+    @abstractmethod
+    async def get_principals_by_api_key_hashes(
+        self,
+        api_keys_hashed: Sequence[bytes],
+    ) -> dict[bytes, Principal]:
+        """Get principals by API keys, mapped by API key hash."""
         ...
 
 
@@ -33,3 +55,21 @@ class IGetAPIKeysAlchemyRepository(Protocol):
     async def get_api_keys(self, user_id: UUID) -> list[ApiKey]:
         """Get API keys for user."""
         ...
+
+
+class IGetApiKeyHashesRepository(Protocol):
+    """Interface for streaming hashes of all API keys."""
+
+    @abstractmethod
+    def stream_api_key_hashes(self) -> AsyncIterator[bytes]:
+        """Stream hashes of all API keys."""
+        ...
+
+
+class IGetApiKeyPrincipalsRepository(Protocol):
+    """Interface for streaming principals of all API keys."""
+
+    @abstractmethod
+    def stream_api_key_principals(self) -> AsyncIterator[tuple[bytes, Principal]]:
+        """Stream principals of all API keys with their hashes."""
+        ...
@@ -0,0 +1,35 @@
+"""Interfaces for the API key membership filter."""
+
+from abc import abstractmethod
+from collections.abc import AsyncIterable
+from typing import Protocol
+
+
+class IApiKeyFilterRepository(Protocol):
+    """Probabilistic set of issued API key hashes.
+
+    A negative answer is definite, a positive answer may be a false positive.
+    """
+
+    @abstractmethod
+    async def might_contain(self, api_key_hashed: bytes) -> bool:
+        """Check if the API key hash may have been issued."""
+        ...
+
+    @abstractmethod
+    async def add(self, api_key_hashed: bytes) -> None:
+        """Add an issued API key hash."""
+        ...
+
+    @abstractmethod
+    async def exists(self) -> bool:
+        """Check if the filter has been built."""
+        ...
+
+    @abstractmethod
+    async def rebuild(self, api_keys_hashed: AsyncIterable[bytes]) -> int:
+        """Build the filter from all issued API key hashes.
+
+        Returns the number of hashes added.
+        """
+        ...
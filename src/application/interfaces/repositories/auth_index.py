@@ -0,0 +1,50 @@
+"""Interfaces for the index of principals by API key."""
+
+from abc import abstractmethod
+from collections.abc import AsyncIterable
+from typing import Protocol
+
+from src.domain.entities.auth.principal import Principal
+
+
+class IAuthIndexRepository(Protocol):
+    """Principals by API key hash, shared by all nodes.
+
+    The index may lag behind the database, a missing entry is not a denial.
+    """
+
+    @abstractmethod
+    async def get(self, api_key_hashed: bytes) -> Principal | None:
+        """Get an indexed principal by API key hash."""
+        ...
+
+    @abstractmethod
+    async def set(self, api_key_hashed: bytes, principal: Principal) -> None:
+        """Index a principal by API key hash."""
+        ...
+
+    @abstractmethod
+    async def delete(self, api_key_hashed: bytes) -> None:
+        """Remove an API key hash from the index, when its key is deleted."""
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every API key hash from the index, when all keys are deleted."""
+        ...
+
+    @abstractmethod
+    async def exists(self) -> bool:
+        """Check if the index has been built."""
+        ...
+
+    @abstractmethod
+    async def rebuild(
+        self,
+        principals: AsyncIterable[tuple[bytes, Principal]],
+    ) -> int:
+        """Build the index from principals of all issued API keys.
+
+        Returns the number of principals indexed.
+        """
+        ...
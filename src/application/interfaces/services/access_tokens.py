@@ -0,0 +1,36 @@
+"""Interfaces for signed access tokens."""
+
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.domain.entities.auth.principal import Principal
+
+
+@dataclass(frozen=True, slots=True)
+class AccessTokenClaims:
+    """Verified claims of an access token."""
+
+    principal: Principal
+    issued_at: float
+    expires_at: int
+
+
+class IAccessTokenService(Protocol):
+    """Short-lived signed tokens carrying a principal."""
+
+    @property
+    @abstractmethod
+    def lifetime(self) -> int:
+        """Lifetime of issued tokens in seconds."""
+        ...
+
+    @abstractmethod
+    def issue(self, principal: Principal) -> str:
+        """Issue a signed token for a principal."""
+        ...
+
+    @abstractmethod
+    def verify(self, token: str) -> AccessTokenClaims | None:
+        """Verify a token, None if it is invalid or expired."""
+        ...
@@ -18,6 +18,15 @@ class ICreateAPIKeyVaultRepository(Protocol):
     """IAddAPIKey."""
 
     @abstractmethod
-    async def add_api_key(self, user_id: UUID, api_key_id: str, api_key: UUID) -> None:
+    async def add_api_key(self, user_id: UUID, api_key_id: str, api_key: str) -> None:
         """Add api key."""
         ...
+
+
+class IProvisionVaultRepository(Protocol):
+    """IProvisionVault."""
+
+    @abstractmethod
+    async def provision(self) -> str:
+        """Ensure the storage of the repository exists, return its mount point."""
+        ...
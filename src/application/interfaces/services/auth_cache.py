@@ -0,0 +1,42 @@
+"""Interfaces for authentication caches."""
+
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.domain.entities.auth.principal import Principal
+
+
+@dataclass
+class CacheStats:
+    """Cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+
+class IAuthCache(Protocol):
+    """Cache of authenticated principals keyed by API key hash."""
+
+    @abstractmethod
+    def get(self, api_key_hashed: bytes) -> Principal | None:
+        """Get a cached principal by API key hash."""
+        ...
+
+    @abstractmethod
+    def set(self, api_key_hashed: bytes, principal: Principal) -> None:
+        """Cache a principal by API key hash."""
+        ...
+
+    @abstractmethod
+    def invalidate(self, api_key_hashed: bytes) -> None:
+        """Drop a cached principal by API key hash."""
+        ...
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Get cache counters."""
+        ...
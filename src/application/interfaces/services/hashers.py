@@ -1,6 +1,7 @@
 """Interfaces for hashers."""
 
 from abc import abstractmethod
+from collections.abc import Iterable
 from typing import Protocol
 
 
@@ -14,6 +15,27 @@ class IHasher(Protocol):
     ) -> str:
         """Hash data."""
 
+    @abstractmethod
+    def hash_many(
+        self,
+        data: Iterable[bytes],
+    ) -> list[str]:
+        """Hash many items, in order."""
+
+    @abstractmethod
+    def digest(
+        self,
+        data: bytes,
+    ) -> bytes:
+        """Hash data to a raw digest."""
+
+    @abstractmethod
+    def digest_many(
+        self,
+        data: Iterable[bytes],
+    ) -> list[bytes]:
+        """Hash many items to raw digests, in order."""
+
 
 class IHashVerifier(Protocol):
     """Hash verifier interface."""
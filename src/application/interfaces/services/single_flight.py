@@ -0,0 +1,23 @@
+"""Interfaces for call coalescing."""
+
+from abc import abstractmethod
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import Protocol
+from typing import TypeVar
+
+ResultT = TypeVar("ResultT")
+
+
+class ISingleFlight(Protocol):
+    """Single-flight interface."""
+
+    @abstractmethod
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Run a call once for all concurrent callers with the same key."""
+        ...
@@ -0,0 +1,30 @@
+"""Interfaces for per-request stage timings."""
+
+from abc import abstractmethod
+from contextlib import AbstractContextManager
+from typing import Protocol
+
+
+class IStageTimings(Protocol):
+    """Timings of named stages of the current request."""
+
+    @property
+    @abstractmethod
+    def enabled(self) -> bool:
+        """Check if stages are measured."""
+        ...
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start collecting timings for the current context."""
+        ...
+
+    @abstractmethod
+    def measure(self, stage: str) -> AbstractContextManager[None]:
+        """Measure a stage, repeated stages are summed."""
+        ...
+
+    @abstractmethod
+    def collected(self) -> dict[str, float]:
+        """Get timings of the current context in milliseconds."""
+        ...
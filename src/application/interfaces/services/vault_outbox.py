@@ -0,0 +1,26 @@
+"""Interfaces for the outbox of Vault writes."""
+
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxDispatchResult:
+    """Number of outbox entries written, failed and given up on."""
+
+    written: int
+    failed: int
+    dead_lettered: int = 0
+
+
+class IVaultOutboxDispatcher(Protocol):
+    """Writes the keys waiting in the outbox to Vault."""
+
+    @abstractmethod
+    async def dispatch(self) -> OutboxDispatchResult:
+        """Write one batch of due entries, failed ones are retried later.
+
+        Entries that cannot be decrypted are dead-lettered.
+        """
+        ...
@@ -7,14 +7,42 @@ from dishka import provide
 
 from src.application.interactors.admin.get_dashboard import GetDashboardInteractor
 from src.application.interactors.auth.authenticate import AuthenticateApiKeyInteractor
+from src.application.interactors.auth.authenticate_access_token import (
+    AuthenticateAccessTokenInteractor,
+)
 from src.application.interactors.auth.create_api_key import CreateApiKeyInteractor
+from src.application.interactors.auth.dispatch_vault_outbox import (
+    DispatchVaultOutboxInteractor,
+)
 from src.application.interactors.auth.get_user_api_keys import GetUserApiKeysInteractor
+from src.application.interactors.auth.introspect_api_keys import (
+    IntrospectApiKeysInteractor,
+)
+from src.application.interactors.auth.issue_access_token import (
+    IssueAccessTokenInteractor,
+)
+from src.application.interactors.auth.provision_vault import ProvisionVaultInteractor
+from src.application.interactors.auth.rebuild_api_key_filter import (
+    RebuildApiKeyFilterInteractor,
+)
+from src.application.interactors.auth.rebuild_auth_index import (
+    RebuildAuthIndexInteractor,
+)
+from src.application.interactors.auth.revoke_access_tokens import (
+    RevokeAccessTokensInteractor,
+)
 from src.application.interactors.database.drop_database import DropDatabaseInteractor
 from src.application.interactors.database.seed_database import SeedDatabaseInteractor
+from src.application.interfaces.services.access_tokens import IAccessTokenService
 from src.application.interfaces.services.hashers import IHasher
 from src.application.interfaces.services.hashers import IHashVerifier
+from src.application.interfaces.services.single_flight import ISingleFlight
+from src.application.interfaces.services.stage_timings import IStageTimings
 from src.application.interfaces.services.uuid import IGenerateUUID7Service
+from src.application.services.auth.access_token_jose import JoseAccessTokenService
 from src.application.services.auth.hasher_blake2b import HasherBlake2b
+from src.application.services.core.single_flight import SingleFlight
+from src.application.services.core.stage_timings import StageTimings
 from src.application.services.core.uuid_generator import UUIDGeneratorService
 
 
@@ -38,9 +66,29 @@ class ApplicationProvider(Provider):
 
     authenticate_api_key_interactor = provide(
         source=AuthenticateApiKeyInteractor,
+        scope=Scope.APP,
+    )
+
+    authenticate_access_token_interactor = provide(
+        source=AuthenticateAccessTokenInteractor,
+        scope=Scope.APP,
+    )
+
+    issue_access_token_interactor = provide(
+        source=IssueAccessTokenInteractor,
+        scope=Scope.APP,
+    )
+
+    revoke_access_tokens_interactor = provide(
+        source=RevokeAccessTokensInteractor,
         scope=Scope.REQUEST,
     )
 
+    introspect_api_keys_interactor = provide(
+        source=IntrospectApiKeysInteractor,
+        scope=Scope.APP,
+    )
+
     create_api_key_interactor = provide(
         source=CreateApiKeyInteractor,
         scope=Scope.REQUEST,
@@ -51,14 +99,52 @@ class ApplicationProvider(Provider):
         scope=Scope.REQUEST,
     )
 
+    rebuild_api_key_filter_interactor = provide(
+        source=RebuildApiKeyFilterInteractor,
+        scope=Scope.REQUEST,
+    )
+
+    rebuild_auth_index_interactor = provide(
+        source=RebuildAuthIndexInteractor,
+        scope=Scope.REQUEST,
+    )
+
+    provision_vault_interactor = provide(
+        source=ProvisionVaultInteractor,
+        scope=Scope.REQUEST,
+    )
+
+    dispatch_vault_outbox_interactor = provide(
+        source=DispatchVaultOutboxInteractor,
+        scope=Scope.APP,
+    )
+
     hasher_service = provide(
         source=HasherBlake2b,
         scope=Scope.APP,
         provides=AnyOf[IHasher, IHashVerifier],
     )
 
+    access_token_service = provide(
+        source=JoseAccessTokenService,
+        scope=Scope.APP,
+        provides=IAccessTokenService,
+    )
+
     uuid_generator_service = provide(
         source=UUIDGeneratorService,
         scope=Scope.APP,
         provides=IGenerateUUID7Service,
     )
+
+    single_flight_service = provide(
+        source=SingleFlight,
+        scope=Scope.APP,
+        provides=ISingleFlight,
+    )
+
+    stage_timings_service = provide(
+        source=StageTimings,
+        scope=Scope.APP,
+        provides=IStageTimings,
+    )
@@ -1,6 +1,7 @@
 """Hasher using Blake-2b algorithm."""
 
 import hashlib
+from collections.abc import Iterable
 
 from src.application.common.service import Service
 from src.application.interfaces.services.hashers import IHasher
@@ -9,7 +10,11 @@ from src.main.config.settings import AppSettings
 
 
 class HasherBlake2b(Service, IHasher, IHashVerifier):
-    """Hasher using Blake-2b algorithm."""
+    """Hasher using Blake-2b algorithm.
+
+    Keying blake2b costs a full compression block, so a keyed template is
+    built once per ``person`` value and copied for every hash.
+    """
 
     def __init__(
         self,
@@ -19,17 +24,53 @@ class HasherBlake2b(Service, IHasher, IHashVerifier):
         self._key: bytes = app_settings.SECRET_KEY.encode()
         self._digest_size: int = app_settings.API_KEY_DIGEST_SIZE
         self._salt: bytes = b""
+        self._templates: dict[bytes, hashlib.blake2b] = {}
 
     def hash(self, data: bytes, person: bytes = b"") -> str:
         """Hash data."""
-        return hashlib.blake2b(
-            data,
-            digest_size=self._digest_size,
-            key=self._key,
-            salt=self._salt,
-            person=person,
-        ).hexdigest()
+        hasher = self._get_template(person).copy()
+        hasher.update(data)
+        return hasher.hexdigest()
+
+    def hash_many(self, data: Iterable[bytes], person: bytes = b"") -> list[str]:
+        """Hash many items."""
+        template = self._get_template(person)
+        hashes: list[str] = []
+        for item in data:
+            hasher = template.copy()
+            hasher.update(item)
+            hashes.append(hasher.hexdigest())
+        return hashes
+
+    def digest(self, data: bytes, person: bytes = b"") -> bytes:
+        """Hash data to a raw digest."""
+        hasher = self._get_template(person).copy()
+        hasher.update(data)
+        return hasher.digest()
+
+    def digest_many(self, data: Iterable[bytes], person: bytes = b"") -> list[bytes]:
+        """Hash many items to raw digests."""
+        template = self._get_template(person)
+        digests: list[bytes] = []
+        for item in data:
+            hasher = template.copy()
+            hasher.update(item)
+            digests.append(hasher.digest())
+        return digests
 
     def verify(self, data: bytes, expected_hash: str, person: bytes = b"") -> bool:
         """Verify hash."""
         return self.hash(data, person) == expected_hash
+
+    def _get_template(self, person: bytes) -> hashlib.blake2b:
+        """Get the keyed hasher for a person value."""
+        template = self._templates.get(person)
+        if template is None:
+            template = hashlib.blake2b(
+                digest_size=self._digest_size,
+                key=self._key,
+                salt=self._salt,
+                person=person,
+            )
+            self._templates[person] = template
+        return template
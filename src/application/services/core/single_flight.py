@@ -0,0 +1,65 @@
+"""Single-flight service."""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import Any
+from typing import TypeVar
+
+from src.application.common.service import Service
+from src.application.interfaces.services.single_flight import ISingleFlight
+
+ResultT = TypeVar("ResultT")
+
+
+class SingleFlight(Service, ISingleFlight):
+    """Coalesce concurrent calls sharing the same key.
+
+    The first caller for a key runs the call, callers arriving while it is
+    in flight await the same future. Failures are propagated to every waiter.
+    If the leading caller is cancelled, waiters retry and one of them leads.
+    """
+
+    def __init__(self):
+        """Initialize service."""
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Run a call once for all concurrent callers with the same key."""
+        while (future := self._calls.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if future.cancelled() and not (task and task.cancelling()):
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(self._retrieve_exception)
+        self._calls[key] = future
+
+        try:
+            result = await func()
+        except Exception as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+            # the leader was cancelled, let the waiters retry
+            if not future.done():
+                future.cancel()
+
+    @staticmethod
+    def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+        """Mark the exception as retrieved, there may be no waiters."""
+        if not future.cancelled():
+            future.exception()
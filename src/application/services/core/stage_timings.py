@@ -0,0 +1,76 @@
+"""Stage timings service."""
+
+import time
+from contextlib import AbstractContextManager
+from contextlib import nullcontext
+from contextvars import ContextVar
+from types import TracebackType
+
+from src.application.common.service import Service
+from src.application.interfaces.services.stage_timings import IStageTimings
+from src.main.config.settings import AuthSettings
+
+_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "stage_timings",
+    default=None,
+)
+_not_measured = nullcontext()
+
+
+class _StageTimer(AbstractContextManager[None]):
+    """Add the duration of a block to a stage."""
+
+    __slots__ = ("_stage", "_started", "_timings")
+
+    def __init__(self, timings: dict[str, float], stage: str):
+        """Initialize timer."""
+        self._timings = timings
+        self._stage = stage
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        """Start timer."""
+        self._started = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop timer and add the duration in milliseconds."""
+        elapsed = (time.perf_counter() - self._started) * 1000
+        self._timings[self._stage] = self._timings.get(self._stage, 0.0) + elapsed
+
+
+class StageTimings(Service, IStageTimings):
+    """Stage timings kept in a context variable.
+
+    Timings are only collected after ``start`` in the same context, and
+    ``measure`` is a shared no-op context manager otherwise.
+    """
+
+    def __init__(self, auth_settings: AuthSettings):
+        """Initialize service."""
+        self._enabled = auth_settings.TIMING_ENABLED
+
+    @property
+    def enabled(self) -> bool:
+        """Check if stages are measured."""
+        return self._enabled
+
+    def start(self) -> None:
+        """Start collecting timings for the current context."""
+        if self._enabled:
+            _timings.set({})
+
+    def measure(self, stage: str) -> AbstractContextManager[None]:
+        """Measure a stage, repeated stages are summed."""
+        timings = _timings.get()
+        if timings is None:
+            return _not_measured
+        return _StageTimer(timings, stage)
+
+    def collected(self) -> dict[str, float]:
+        """Get timings of the current context in milliseconds."""
+        return dict(_timings.get() or {})
@@ -11,7 +11,7 @@ class ApiKey(UUIDAuditEntity):
     """API key entity."""
 
     user_id: UUID
-    key_hashed: str
+    key_hashed: bytes
     key_original: UUID | None = None
 
     def __post_init__(self):
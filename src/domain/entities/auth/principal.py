@@ -0,0 +1,16 @@
+"""Principal entity."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Authenticated caller of the API.
+
+    Holds only what authentication needs and is not mapped to a table.
+    Load the ``User`` explicitly where the full entity is needed.
+    """
+
+    user_id: UUID
+    api_key_id: UUID
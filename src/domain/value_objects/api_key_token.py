@@ -0,0 +1,74 @@
+"""API key token value object."""
+
+import secrets
+import zlib
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.common.value_object import BaseValueObject
+
+
+@dataclass(frozen=True)
+class ApiKeyToken(BaseValueObject):
+    """Self-describing API key.
+
+    Formatted as ``<prefix>_<key id>_<secret>_<checksum>``. The key id is the
+    primary key of the API key, so it is fetched without the hash index.
+    The checksum is a CRC32 of everything before it and lets malformed keys
+    be rejected without any I/O. It is not a secret, only the hash of the
+    whole token authenticates it.
+    """
+
+    prefix: str
+    key_id: UUID
+    secret: str
+
+    secret_size = 16
+    separator = "_"
+
+    @classmethod
+    def generate(cls, prefix: str, key_id: UUID) -> "ApiKeyToken":
+        """Generate a token with a random secret."""
+        return cls(
+            prefix=prefix,
+            key_id=key_id,
+            secret=secrets.token_hex(cls.secret_size),
+        )
+
+    @classmethod
+    def parse(cls, value: str, prefix: str) -> "ApiKeyToken":
+        """Parse a token and verify its checksum.
+
+        Raises:
+            ValueError: If the token is malformed or the checksum is wrong.
+        """
+        body, _, checksum = value.rpartition(cls.separator)
+        parts = body.split(cls.separator)
+        if len(parts) != 3 or parts[0] != prefix:  # noqa: PLR2004
+            msg = "Malformed API key token."
+            raise ValueError(msg)
+
+        if checksum != cls._checksum(body):
+            msg = "Wrong API key token checksum."
+            raise ValueError(msg)
+
+        return cls(prefix=prefix, key_id=UUID(hex=parts[1]), secret=parts[2])
+
+    def __str__(self) -> str:
+        """Format the token."""
+        body = self.separator.join((self.prefix, self.key_id.hex, self.secret))
+        return f"{body}{self.separator}{self._checksum(body)}"
+
+    def _validate(self) -> None:
+        """Validate token parts."""
+        if not self.prefix or self.separator in self.prefix:
+            msg = f"API key prefix must be non-empty and without {self.separator!r}."
+            raise ValueError(msg)
+        if len(self.secret) != self.secret_size * 2 or self.separator in self.secret:
+            msg = "Malformed API key secret."
+            raise ValueError(msg)
+
+    @staticmethod
+    def _checksum(body: str) -> str:
+        """Get the checksum of the token body."""
+        return f"{zlib.crc32(body.encode()):08x}"
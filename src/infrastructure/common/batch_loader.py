@@ -0,0 +1,87 @@
+"""Batch loader."""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Mapping
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class BatchLoader(Generic[KeyT, ValueT]):
+    """Collect loads arriving within a short window and resolve them together.
+
+    Keys passed to ``load`` are queued until ``max_batch_size`` keys are
+    pending or ``window`` seconds have passed since the first one. Then all
+    pending keys are passed to ``batch_load`` at once, and each caller gets
+    the value of its own key, or ``None`` if it was not found. A failed batch
+    raises the error in every caller of that batch.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[KeyT]], Awaitable[Mapping[KeyT, ValueT]]],
+        window: float,
+        max_batch_size: int,
+    ):
+        """Initialize the loader."""
+        self._batch_load = batch_load
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending: dict[KeyT, asyncio.Future[ValueT | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: KeyT) -> ValueT | None:
+        """Load a value in the next batch."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            future.add_done_callback(self._retrieve_exception)
+            self._pending[key] = future
+
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window, self._dispatch)
+
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Start loading all pending keys."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._resolve(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: dict[KeyT, asyncio.Future[ValueT | None]]) -> None:
+        """Load a batch and resolve its futures."""
+        try:
+            values = await self._batch_load(list(batch))
+        except Exception as error:  # noqa: BLE001
+            for future in batch.values():
+                future.set_exception(error)
+        else:
+            for key, future in batch.items():
+                future.set_result(values.get(key))
+        finally:
+            # the load was cancelled, do not leave the callers waiting
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+
+    @staticmethod
+    def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+        """Mark the exception as retrieved, all callers may be gone."""
+        if not future.cancelled():
+            future.exception()
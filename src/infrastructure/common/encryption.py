@@ -0,0 +1,23 @@
+"""Encryption of values stored outside of Vault."""
+
+import base64
+import hashlib
+
+from cryptography.fernet import Fernet
+
+
+def get_fernet(secret_key: str, person: bytes) -> Fernet:
+    """Get a Fernet cipher keyed by the application secret key.
+
+    A separate key is derived for each ``person`` value, so ciphertexts of
+    one store cannot be decrypted with the key of another.
+    """
+    return Fernet(
+        base64.urlsafe_b64encode(
+            hashlib.blake2b(
+                secret_key.encode(),
+                digest_size=32,
+                person=person,
+            ).digest(),
+        ),
+    )
@@ -9,6 +9,7 @@ from advanced_alchemy.repository import SQLAlchemyAsyncSlugRepository
 from advanced_alchemy.repository import SQLAlchemyAsyncSlugRepositoryProtocol
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from src.domain.common.types import EntityT
 from src.infrastructure.common.interfaces import IRepository
@@ -40,6 +41,22 @@ class BaseAlchemyRepository(IRepository):
         self._session: AsyncSession = session
 
 
+class SessionMakerAlchemyRepository:
+    """Base repository class for APP-scoped repositories.
+
+    A short-lived session is opened for each operation instead of holding
+    a request-scoped one, so a pooled connection is only checked out when
+    a query actually runs.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """Configure the repository object."""
+        self._session_maker = session_maker
+
+
 class ModelEntityProtocol(Protocol[EntityT]):
     """Model-Entity protocol."""
 
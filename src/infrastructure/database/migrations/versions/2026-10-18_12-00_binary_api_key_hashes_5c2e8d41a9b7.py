@@ -0,0 +1,78 @@
+# type: ignore
+"""binary api key hashes
+
+Revision ID: 5c2e8d41a9b7
+Revises: 1fe5866398e4
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from advanced_alchemy.types import EncryptedString, EncryptedText, GUID, ORA_JSONB, DateTimeUTC
+from sqlalchemy import Text  # noqa: F401
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = ["downgrade", "upgrade", "schema_upgrades", "schema_downgrades", "data_upgrades", "data_downgrades"]
+
+sa.GUID = GUID
+sa.DateTimeUTC = DateTimeUTC
+sa.ORA_JSONB = ORA_JSONB
+sa.EncryptedString = EncryptedString
+sa.EncryptedText = EncryptedText
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8d41a9b7'
+down_revision = '1fe5866398e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        with op.get_context().autocommit_block():
+            schema_upgrades()
+            data_upgrades()
+
+def downgrade() -> None:
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning)
+        with op.get_context().autocommit_block():
+            data_downgrades()
+            schema_downgrades()
+
+def schema_upgrades() -> None:
+    """schema upgrade migrations go here."""
+    # existing hex digests are decoded in place, the unique index is rebuilt
+    with op.batch_alter_table('api_keys', schema=None) as batch_op:
+        batch_op.alter_column(
+            'key_hashed',
+            existing_type=sa.String(length=128),
+            type_=sa.LargeBinary(),
+            existing_nullable=False,
+            postgresql_using="decode(key_hashed, 'hex')",
+        )
+
+def schema_downgrades() -> None:
+    """schema downgrade migrations go here."""
+    with op.batch_alter_table('api_keys', schema=None) as batch_op:
+        batch_op.alter_column(
+            'key_hashed',
+            existing_type=sa.LargeBinary(),
+            type_=sa.String(length=128),
+            existing_nullable=False,
+            postgresql_using="encode(key_hashed, 'hex')",
+        )
+
+def data_upgrades() -> None:
+    """Add any optional data upgrade migrations here!"""
+
+def data_downgrades() -> None:
+    """Add any optional data downgrade migrations here!"""
@@ -1,23 +1,36 @@
 """Repository for ApiKeys feature."""
 
+from collections.abc import AsyncIterator
 from uuid import UUID
 
+from sqlalchemy import select
+
 from src.application.interfaces.repositories.api_key import ICreateApiKeyRepository
+from src.application.interfaces.repositories.api_key import IGetApiKeyHashesRepository
+from src.application.interfaces.repositories.api_key import (
+    IGetApiKeyPrincipalsRepository,
+)
 from src.application.interfaces.repositories.api_key import IGetAPIKeysAlchemyRepository
 from src.domain.entities.auth.api_key import ApiKey
+from src.domain.entities.auth.principal import Principal
 from src.infrastructure.database.base import AlchemyRepository
 from src.infrastructure.database.base import GenericAlchemyRepository
+from src.infrastructure.database.tables import api_key_table
+from src.infrastructure.database.tables import user_table
 
 
 class ApiKeyRepository(
     AlchemyRepository[ApiKey],
     ICreateApiKeyRepository,
     IGetAPIKeysAlchemyRepository,
+    IGetApiKeyHashesRepository,
+    IGetApiKeyPrincipalsRepository,
 ):
     """ApiKey repository."""
 
     entity_type = ApiKey
     repository_type = GenericAlchemyRepository[ApiKey]
+    stream_chunk_size = 10_000
 
     async def create_one(self, data: ApiKey) -> ApiKey:
         """Delete all entries."""
@@ -26,3 +39,29 @@ class ApiKeyRepository(
     async def get_api_keys(self, user_id: UUID) -> list[ApiKey]:
         """Get API keys for user."""
         return await self._repository.list(user_id=user_id)
+
+    async def stream_api_key_hashes(self) -> AsyncIterator[bytes]:
+        """Stream hashes of all API keys using a server-side cursor."""
+        key_hashes = await self._session.stream_scalars(
+            select(api_key_table.c.key_hashed).execution_options(
+                yield_per=self.stream_chunk_size,
+            ),
+        )
+        async for key_hashed in key_hashes:
+            yield key_hashed
+
+    async def stream_api_key_principals(
+        self,
+    ) -> AsyncIterator[tuple[bytes, Principal]]:
+        """Stream principals of all API keys of existing users."""
+        rows = await self._session.stream(
+            select(
+                api_key_table.c.key_hashed,
+                api_key_table.c.user_id,
+                api_key_table.c.id,
+            )
+            .join(user_table, user_table.c.id == api_key_table.c.user_id)
+            .execution_options(yield_per=self.stream_chunk_size),
+        )
+        async for key_hashed, user_id, api_key_id in rows:
+            yield key_hashed, Principal(user_id=user_id, api_key_id=api_key_id)
@@ -0,0 +1,178 @@
+"""Repository for authentication principals."""
+
+import hmac
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Executable
+from sqlalchemy import Row
+from sqlalchemy import any_
+from sqlalchemy import bindparam
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.types import LargeBinary
+
+from src.application.interfaces.repositories.api_key import (
+    IGetPrincipalByApiKeyRepository,
+)
+from src.application.interfaces.repositories.api_key import (
+    IGetPrincipalsByApiKeyHashesRepository,
+)
+from src.application.interfaces.services.stage_timings import IStageTimings
+from src.domain.entities.auth.principal import Principal
+from src.infrastructure.common.batch_loader import BatchLoader
+from src.infrastructure.database.base import SessionMakerAlchemyRepository
+from src.infrastructure.database.tables import api_key_table
+
+
+class PrincipalRepository(
+    SessionMakerAlchemyRepository,
+    IGetPrincipalByApiKeyRepository,
+    IGetPrincipalsByApiKeyHashesRepository,
+):
+    """Authentication lookups of principals by API key hash.
+
+    Only the needed columns of ``api_keys`` are selected, no ORM entities are
+    loaded into the session.
+    """
+
+    # the statements are built once, so every call reuses their cache key and
+    # compiled SQL, and asyncpg reuses the statement it prepared for it
+    principal_by_api_key_id_statement = select(
+        api_key_table.c.user_id,
+        api_key_table.c.key_hashed,
+    ).where(api_key_table.c.id == bindparam("api_key_id"))
+    principal_by_api_key_hash_statement = select(
+        api_key_table.c.user_id,
+        api_key_table.c.id,
+    ).where(api_key_table.c.key_hashed == bindparam("api_key_hashed"))
+    principals_by_api_key_hashes_statement = select(
+        api_key_table.c.key_hashed,
+        api_key_table.c.user_id,
+        api_key_table.c.id,
+    ).where(
+        api_key_table.c.key_hashed
+        == any_(bindparam("api_keys_hashed", type_=ARRAY(LargeBinary))),
+    )
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        stage_timings: IStageTimings,
+    ) -> None:
+        """Configure the repository object."""
+        super().__init__(session_maker=session_maker)
+        self._stage_timings = stage_timings
+
+    async def get_principal_by_api_key_hash(
+        self,
+        api_key_hashed: bytes,
+        api_key_id: UUID | None = None,
+    ) -> Principal | None:
+        """Get principal by API key.
+
+        When the key id is known, the key is fetched by its primary key and
+        the hash is verified, otherwise it is looked up by the hash.
+        """
+        if api_key_id is not None:
+            return await self._get_principal_by_api_key_id(api_key_id, api_key_hashed)
+
+        rows = await self._fetch(
+            self.principal_by_api_key_hash_statement,
+            {"api_key_hashed": api_key_hashed},
+        )
+        if not rows:
+            return None
+        row = rows[0]
+        return Principal(user_id=row.user_id, api_key_id=row.id)
+
+    async def _get_principal_by_api_key_id(
+        self,
+        api_key_id: UUID,
+        api_key_hashed: bytes,
+    ) -> Principal | None:
+        """Get principal by API key id, verifying the hash in constant time."""
+        rows = await self._fetch(
+            self.principal_by_api_key_id_statement,
+            {"api_key_id": api_key_id},
+        )
+        if not rows or not hmac.compare_digest(rows[0].key_hashed, api_key_hashed):
+            return None
+        return Principal(user_id=rows[0].user_id, api_key_id=api_key_id)
+
+    async def get_principals_by_api_key_hashes(
+        self,
+        api_keys_hashed: Sequence[bytes],
+    ) -> dict[bytes, Principal]:
+        """Get principals by API keys, mapped by API key hash."""
+        rows = await self._fetch(
+            self.principals_by_api_key_hashes_statement,
+            {"api_keys_hashed": list(api_keys_hashed)},
+        )
+        return {
+            key_hashed: Principal(user_id=user_id, api_key_id=api_key_id)
+            for key_hashed, user_id, api_key_id in rows
+        }
+
+    async def _fetch(
+        self,
+        statement: Executable,
+        parameters: dict[str, Any],
+    ) -> Sequence[Row[Any]]:
+        """Run a query, timing the connection checkout and the query."""
+        async with self._session_maker() as session:
+            with self._stage_timings.measure("auth-db-pool"):
+                await session.connection()
+            with self._stage_timings.measure("auth-db-query"):
+                result = await session.execute(statement, parameters)
+                return result.all()
+
+
+class BatchingPrincipalRepository(
+    IGetPrincipalByApiKeyRepository,
+    IGetPrincipalsByApiKeyHashesRepository,
+):
+    """Lookups of principals by API key hash, batched across requests.
+
+    Lookups arriving within a short window are resolved together with one
+    ``key_hashed = ANY(:api_keys_hashed)`` query, which saves connections and
+    round trips when many requests authenticate at the same time.
+    """
+
+    def __init__(
+        self,
+        repository: IGetPrincipalsByApiKeyHashesRepository,
+        window: float,
+        max_batch_size: int,
+    ):
+        """Initialize repository."""
+        self._repository = repository
+        self._loader: BatchLoader[bytes, Principal] = BatchLoader(
+            batch_load=repository.get_principals_by_api_key_hashes,
+            window=window,
+            max_batch_size=max_batch_size,
+        )
+
+    async def get_principal_by_api_key_hash(
+        self,
+        api_key_hashed: bytes,
+        api_key_id: UUID | None = None,
+    ) -> Principal | None:
+        """Get principal by API key.
+
+        Batches are always resolved by hash, the result is the same with or
+        without the key id.
+        """
+        return await self._loader.load(api_key_hashed)
+
+    async def get_principals_by_api_key_hashes(
+        self,
+        api_keys_hashed: Sequence[bytes],
+    ) -> dict[bytes, Principal]:
+        """Get principals by API keys, mapped by API key hash."""
+        return await self._repository.get_principals_by_api_key_hashes(
+            api_keys_hashed,
+        )
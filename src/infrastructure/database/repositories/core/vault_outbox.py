@@ -0,0 +1,175 @@
+"""Repository of the Vault outbox."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from uuid import UUID
+
+from cryptography.fernet import InvalidToken
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.common.encryption import get_fernet
+from src.infrastructure.database.base import BaseAlchemyRepository
+from src.infrastructure.database.tables import vault_outbox_table
+from src.main.config.settings import AppSettings
+
+
+@dataclass(frozen=True, slots=True)
+class VaultOutboxEntry:
+    """Key waiting to be written to Vault.
+
+    The value is None if it cannot be decrypted with the current secret key.
+    """
+
+    id: UUID
+    mount_point: str
+    path: str
+    key: str
+    value: str | None
+    attempts: int
+
+
+class VaultOutboxRepository(BaseAlchemyRepository):
+    """Keys waiting to be written to Vault.
+
+    Entries are added in the transaction of the session, so they are
+    committed together with the rows they belong to. Values are encrypted,
+    the database never holds them in the clear. Entries that gave up are
+    kept as dead letters, they are never claimed again.
+    """
+
+    def __init__(self, session: AsyncSession, app_settings: AppSettings):
+        """Initialize repository."""
+        super().__init__(session=session)
+        self._fernet = get_fernet(app_settings.SECRET_KEY, person=b"vault-outbox")
+
+    async def add(self, mount_point: str, path: str, key: str, value: str) -> None:
+        """Add a key to write to a Vault secret."""
+        await self._session.execute(
+            insert(vault_outbox_table).values(
+                mount_point=mount_point,
+                path=path,
+                key=key,
+                value_encrypted=self._fernet.encrypt(value.encode()),
+            ),
+        )
+
+    async def get_pending(self, mount_point: str, path: str) -> dict[str, str]:
+        """Get the keys of a secret not written yet, the latest value of each.
+
+        Dead-lettered entries cannot be decrypted, so they are left out.
+        """
+        rows = await self._session.execute(
+            select(vault_outbox_table.c.key, vault_outbox_table.c.value_encrypted)
+            .where(
+                vault_outbox_table.c.mount_point == mount_point,
+                vault_outbox_table.c.path == path,
+                vault_outbox_table.c.dead_lettered_at.is_(None),
+            )
+            .order_by(vault_outbox_table.c.id),
+        )
+        pending: dict[str, str] = {}
+        for key, value_encrypted in rows:
+            value = self._decrypt(value_encrypted)
+            if value is not None:
+                pending[key] = value
+        return pending
+
+    async def claim(self, limit: int, lease: float) -> list[VaultOutboxEntry]:
+        """Lease due entries for some seconds, oldest first.
+
+        Entries locked by another claim are skipped, and leased ones are not
+        due until the lease runs out, so the caller may commit the claim and
+        write the entries without holding a transaction. If it stops before
+        it deletes or reschedules them, they are claimed again.
+        """
+        now = datetime.now(UTC)
+        rows = (
+            await self._session.execute(
+                select(
+                    vault_outbox_table.c.id,
+                    vault_outbox_table.c.mount_point,
+                    vault_outbox_table.c.path,
+                    vault_outbox_table.c.key,
+                    vault_outbox_table.c.value_encrypted,
+                    vault_outbox_table.c.attempts,
+                )
+                .where(
+                    vault_outbox_table.c.available_at <= now,
+                    vault_outbox_table.c.dead_lettered_at.is_(None),
+                )
+                .order_by(vault_outbox_table.c.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True),
+            )
+        ).all()
+        if rows:
+            await self._session.execute(
+                update(vault_outbox_table)
+                .where(vault_outbox_table.c.id.in_([row.id for row in rows]))
+                .values(available_at=now + timedelta(seconds=lease)),
+            )
+        return [
+            VaultOutboxEntry(
+                id=entry_id,
+                mount_point=mount_point,
+                path=path,
+                key=key,
+                value=self._decrypt(value_encrypted),
+                attempts=attempts,
+            )
+            for entry_id, mount_point, path, key, value_encrypted, attempts in rows
+        ]
+
+    async def delete(self, entry_ids: Sequence[UUID]) -> None:
+        """Delete written entries."""
+        if entry_ids:
+            await self._session.execute(
+                delete(vault_outbox_table).where(
+                    vault_outbox_table.c.id.in_(entry_ids),
+                ),
+            )
+
+    async def reschedule(
+        self,
+        entry_ids: Sequence[UUID],
+        error: str,
+        delay: float,
+    ) -> None:
+        """Count a failed attempt and make entries due again after a delay."""
+        if entry_ids:
+            await self._session.execute(
+                update(vault_outbox_table)
+                .where(vault_outbox_table.c.id.in_(entry_ids))
+                .values(
+                    attempts=vault_outbox_table.c.attempts + 1,
+                    available_at=datetime.now(UTC) + timedelta(seconds=delay),
+                    last_error=error,
+                ),
+            )
+
+    async def dead_letter(self, entry_ids: Sequence[UUID], error: str) -> None:
+        """Count a failed attempt and stop retrying entries."""
+        if entry_ids:
+            await self._session.execute(
+                update(vault_outbox_table)
+                .where(vault_outbox_table.c.id.in_(entry_ids))
+                .values(
+                    attempts=vault_outbox_table.c.attempts + 1,
+                    dead_lettered_at=datetime.now(UTC),
+                    last_error=error,
+                ),
+            )
+
+    def _decrypt(self, value_encrypted: bytes) -> str | None:
+        """Decrypt a value, None if it was encrypted with another key."""
+        try:
+            return self._fernet.decrypt(value_encrypted).decode()
+        except InvalidToken:
+            return None
@@ -1,6 +1,7 @@
 """Database tables module."""
 
 from .auth import api_key_table
+from .outbox import vault_outbox_table
 from .subscriptions import subscription_plan_table
 from .users import user_table
 
@@ -8,4 +9,5 @@ __all__ = [
     "api_key_table",
     "subscription_plan_table",
     "user_table",
+    "vault_outbox_table",
 ]
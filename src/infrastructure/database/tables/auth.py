@@ -8,7 +8,7 @@ from advanced_alchemy.types import DateTimeUTC
 from sqlalchemy import UUID
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
-from sqlalchemy import String
+from sqlalchemy import LargeBinary
 from sqlalchemy import Table
 from sqlalchemy.orm import relationship
 from uuid_utils import uuid7
@@ -24,8 +24,8 @@ api_key_table = Table(
     orm_registry.metadata,
     # Unique identifier for the user.
     Column("id", UUID, default=uuid7, primary_key=True, autoincrement=False),
-    # Hash of the API key. Used for authentication.
-    Column("key_hashed", String(128), nullable=False, unique=True, index=True),
+    # Raw digest of the API key. Used for authentication.
+    Column("key_hashed", LargeBinary, nullable=False, unique=True, index=True),
     # Foreign key to the user the API key belongs to.
     Column("user_id", UUID, ForeignKey("users.id"), nullable=False, index=True),
     # Date/time of instance creation.
@@ -0,0 +1,56 @@
+"""Persistence models for the outbox of writes to other stores."""
+
+from datetime import UTC
+from datetime import datetime
+
+from advanced_alchemy.base import orm_registry
+from advanced_alchemy.types import DateTimeUTC
+from sqlalchemy import UUID
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import Text
+from uuid_utils.compat import uuid7
+
+# Define the table for keys waiting to be written to Vault,
+# it is not mapped, entries are read and written as rows
+vault_outbox_table = Table(
+    # Table name
+    "vault_outbox",
+    # Metadata
+    orm_registry.metadata,
+    # Unique identifier of the entry, ordered by creation.
+    Column("id", UUID, default=uuid7, primary_key=True, autoincrement=False),
+    # Vault mount point of the secret.
+    Column("mount_point", String(255), nullable=False),
+    # Path of the secret in the mount point.
+    Column("path", String(255), nullable=False),
+    # Key to set in the secret.
+    Column("key", String(255), nullable=False),
+    # Value to set, encrypted with a key derived from the app secret key.
+    Column("value_encrypted", LargeBinary, nullable=False),
+    # Number of failed attempts to write the entry.
+    Column("attempts", Integer, default=0, nullable=False),
+    # Date/time after which the entry may be claimed: when it is added,
+    # after a retry backoff, or once the lease of its last claim ran out.
+    Column(
+        "available_at",
+        DateTimeUTC(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+        index=True,
+    ),
+    # Error of the last failed attempt.
+    Column("last_error", Text, nullable=True),
+    # Date/time the entry gave up, it is kept for inspection and not retried.
+    Column("dead_lettered_at", DateTimeUTC(timezone=True), nullable=True),
+    # Date/time of instance creation.
+    Column(
+        "created_at",
+        DateTimeUTC(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    ),
+)
@@ -5,8 +5,15 @@ from typing import Any
 
 from src.application.interactors.auth.authenticate import AuthenticateApiKeyInteractor
 from src.application.interactors.auth.authenticate import AuthenticateApiKeyRequestModel
-from src.domain.entities.users.user import User
-from src.infrastructure.security.api_key.config import ApiKeyAuth
+from src.application.interactors.auth.authenticate_access_token import (
+    AuthenticateAccessTokenInteractor,
+)
+from src.application.interactors.auth.authenticate_access_token import (
+    AuthenticateAccessTokenRequestModel,
+)
+from src.application.interfaces.services.stage_timings import IStageTimings
+from src.domain.entities.auth.principal import Principal
+from src.infrastructure.framework.security.api_key.config import ApiKeyAuth
 
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection
@@ -15,17 +22,43 @@ if TYPE_CHECKING:
 async def retrieve_user_handler(
     api_key: str,
     connection: "ASGIConnection[Any, Any, Any, Any]",
-) -> User:
-    """Retrieve a user from the token."""
-    interactor: AuthenticateApiKeyInteractor = (
-        await connection.state.dishka_container.get(AuthenticateApiKeyInteractor)
-    )
+) -> Principal:
+    """Retrieve the principal of an API key.
+
+    The interactor is APP-scoped, it is resolved from the application container
+    so no request-scoped dependencies are built to authenticate a request.
+    """
+    container = connection.app.state.dishka_container
+    stage_timings: IStageTimings = await container.get(IStageTimings)
+    with stage_timings.measure("auth-di"):
+        interactor: AuthenticateApiKeyInteractor = await container.get(
+            AuthenticateApiKeyInteractor,
+        )
     return await interactor(
         request_model=AuthenticateApiKeyRequestModel(api_key=api_key),
     )
 
 
-api_key_auth = ApiKeyAuth[User](
+async def retrieve_token_user_handler(
+    access_token: str,
+    connection: "ASGIConnection[Any, Any, Any, Any]",
+) -> Principal:
+    """Retrieve the principal of an access token.
+
+    The token is verified in-process, no database, Redis or Vault is queried.
+    """
+    interactor: AuthenticateAccessTokenInteractor = (
+        await connection.app.state.dishka_container.get(
+            AuthenticateAccessTokenInteractor,
+        )
+    )
+    return await interactor(
+        request_model=AuthenticateAccessTokenRequestModel(access_token=access_token),
+    )
+
+
+api_key_auth = ApiKeyAuth[Principal](
     retrieve_user_handler=retrieve_user_handler,
+    retrieve_token_user_handler=retrieve_token_user_handler,
     exclude=["/docs"],
 )
@@ -16,8 +16,8 @@ from litestar.openapi.spec import SecurityRequirement
 from litestar.openapi.spec import SecurityScheme
 from litestar.security.base import AbstractSecurityConfig
 
-from src.domain.entities.users.user import User
-from src.infrastructure.security.api_key.middleware import ApiKeyMiddleware
+from src.domain.entities.auth.principal import Principal
+from src.infrastructure.framework.security.api_key.middleware import ApiKeyMiddleware
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -33,7 +33,7 @@ if TYPE_CHECKING:
     from litestar.types import SyncOrAsyncUnion
     from litestar.types import TypeEncodersMap
 
-UserType = TypeVar("UserType", bound=User)
+UserType = TypeVar("UserType", bound=Principal)
 
 __all__ = ("ApiKeyAuth",)
 
@@ -89,6 +89,20 @@ class ApiKeyAuth(Generic[UserType], AbstractSecurityConfig[UserType, str]):
     Request header key from which to retrieve the token.
     """
 
+    retrieve_token_user_handler: (
+        Callable[[Any, ASGIConnection], SyncOrAsyncUnion[Any | None]] | None
+    ) = field(default=None)
+    """Callable that receives a bearer access token and returns a ``user`` value.
+    Access tokens are not accepted if it is not set."""
+
+    token_header: str = field(default="Authorization")
+    """
+    Request header key from which to retrieve a bearer access token.
+    """
+
+    token_openapi_security_scheme_name: str = field(default="AccessTokenAuth")
+    """The value to use for the OpenAPI security scheme of access tokens."""
+
     openapi_security_scheme_name: str = field(default="ApiKeyAuth")
     """The value to use for the OpenAPI security scheme and security requirements."""
 
@@ -106,6 +120,8 @@ class ApiKeyAuth(Generic[UserType], AbstractSecurityConfig[UserType, str]):
             exclude_http_methods=self.exclude_http_methods,
             retrieve_user_handler=self.retrieve_user_handler,
             scopes=self.scopes,
+            token_header=self.token_header,
+            retrieve_token_user_handler=self.retrieve_token_user_handler,
         )
 
     @property
@@ -123,6 +139,12 @@ class ApiKeyAuth(Generic[UserType], AbstractSecurityConfig[UserType, str]):
                     security_scheme_in="header",
                     description="Header API key authentication.",
                 ),
+                self.token_openapi_security_scheme_name: SecurityScheme(
+                    type="http",
+                    scheme="bearer",
+                    bearer_format="JWT",
+                    description="Access token exchanged for an API key.",
+                ),
             },
         )
 
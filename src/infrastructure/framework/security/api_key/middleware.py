@@ -6,11 +6,15 @@ from typing import TYPE_CHECKING
 from typing import Any
 from typing import Generic
 
+import structlog
+from litestar.datastructures import MutableScopeHeaders
 from litestar.exceptions import NotAuthorizedException
 from litestar.middleware import AbstractAuthenticationMiddleware
 from litestar.middleware import AuthenticationResult
 from litestar.middleware.session.base import BaseSessionBackendT
 
+from src.application.interfaces.services.stage_timings import IStageTimings
+
 if TYPE_CHECKING:
     from collections.abc import Awaitable
     from collections.abc import Callable
@@ -18,10 +22,14 @@ if TYPE_CHECKING:
 
     from litestar.connection import ASGIConnection
     from litestar.types import ASGIApp
+    from litestar.types import Message
     from litestar.types import Method
+    from litestar.types import Receive
+    from litestar.types import Scope
     from litestar.types import Scopes
+    from litestar.types import Send
 
-    from src.domain.entities.users.user import User
+    from src.domain.entities.auth.principal import Principal
 
 
 class ApiKeyMiddleware(AbstractAuthenticationMiddleware, Generic[BaseSessionBackendT]):
@@ -39,6 +47,12 @@ class ApiKeyMiddleware(AbstractAuthenticationMiddleware, Generic[BaseSessionBack
             Awaitable[Any],
         ],
         scopes: Scopes,
+        token_header: str,
+        retrieve_token_user_handler: Callable[
+            [str, ASGIConnection[Any, Any, Any, Any]],
+            Awaitable[Any],
+        ]
+        | None,
     ) -> None:
         """Check incoming requests for an api key in the auth header.
 
@@ -58,6 +72,10 @@ class ApiKeyMiddleware(AbstractAuthenticationMiddleware, Generic[BaseSessionBack
             `Token <.security.jwt.Token>`
             and returns a user, which can be any arbitrary value.
             scopes: ASGI scopes processed by the authentication middleware.
+            token_header: Request header key from which to retrieve a bearer
+            access token when no api key is sent.
+            retrieve_token_user_handler: A function that receives an access
+            token and returns a user. Access tokens are refused without it.
         """
         super().__init__(
             app=app,
@@ -68,7 +86,44 @@ class ApiKeyMiddleware(AbstractAuthenticationMiddleware, Generic[BaseSessionBack
         )
         self.auth_header = auth_header
         self.retrieve_user_handler = retrieve_user_handler
-        self._exception_no_auth_header = "No API key found in request header"
+        self.token_header = token_header
+        self.retrieve_token_user_handler = retrieve_token_user_handler
+        self._exception_no_auth_header = (
+            "No API key or access token found in request header"
+        )
+        self._stage_timings: IStageTimings | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Authenticate the request, reporting stage timings if enabled."""
+        stage_timings = await self._get_stage_timings(scope)
+        if not stage_timings.enabled:
+            await super().__call__(scope, receive, send)
+            return
+
+        stage_timings.start()
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and (
+                timings := stage_timings.collected()
+            ):
+                MutableScopeHeaders.from_message(message).add(
+                    "Server-Timing",
+                    ", ".join(
+                        f"{stage};dur={duration:.3f}"
+                        for stage, duration in timings.items()
+                    ),
+                )
+            await send(message)
+
+        await super().__call__(scope, receive, send_with_server_timing)
+
+    async def _get_stage_timings(self, scope: Scope) -> IStageTimings:
+        """Get the APP-scoped stage timings service once."""
+        if self._stage_timings is None:
+            self._stage_timings = await scope["app"].state.dishka_container.get(
+                IStageTimings,
+            )
+        return self._stage_timings
 
     async def authenticate_request(
         self,
@@ -84,13 +139,61 @@ class ApiKeyMiddleware(AbstractAuthenticationMiddleware, Generic[BaseSessionBack
         Raises:
             NotAuthorizedException: If token is invalid or user is not found.
 
+        Returns:
+            AuthenticationResult
+        """
+        stage_timings = await self._get_stage_timings(connection.scope)
+        if not stage_timings.enabled:
+            return await self.authenticate_credentials(connection)
+
+        try:
+            with stage_timings.measure("auth"):
+                return await self.authenticate_credentials(connection)
+        finally:
+            # the request is logged before authentication, so only the
+            # response log line of the logging middleware picks them up
+            structlog.contextvars.bind_contextvars(
+                auth_timings=stage_timings.collected(),
+            )
+
+    async def authenticate_credentials(
+        self,
+        connection: ASGIConnection[Any, Any, Any, Any],
+    ) -> AuthenticationResult:
+        """Authenticate the api key header, or else a bearer access token.
+
+        Args:
+            connection: An ASGI connection instance.
+
+        Raises:
+            NotAuthorizedException: If no credentials are sent or they are invalid.
+
         Returns:
             AuthenticationResult
         """
         api_key = connection.headers.get(self.auth_header)
-        if not api_key:
-            raise NotAuthorizedException(self._exception_no_auth_header)
-        return await self.authenticate_api_key(api_key=api_key, connection=connection)
+        if api_key:
+            return await self.authenticate_api_key(
+                api_key=api_key,
+                connection=connection,
+            )
+
+        scheme, _, access_token = connection.headers.get(
+            self.token_header,
+            "",
+        ).partition(" ")
+        if (
+            self.retrieve_token_user_handler is not None
+            and scheme.lower() == "bearer"
+            and access_token
+        ):
+            user: Principal = await self.retrieve_token_user_handler(
+                access_token,
+                connection,
+            )
+            return AuthenticationResult(user=user, auth=access_token)
+
+        raise NotAuthorizedException(self._exception_no_auth_header)
 
     async def authenticate_api_key(
         self,
@@ -109,5 +212,5 @@ class ApiKeyMiddleware(AbstractAuthenticationMiddleware, Generic[BaseSessionBack
         Returns:
             AuthenticationResult
         """
-        user: User = await self.retrieve_user_handler(api_key, connection)
+        user: Principal = await self.retrieve_user_handler(api_key, connection)
         return AuthenticationResult(user=user, auth=api_key)
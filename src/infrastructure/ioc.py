@@ -1,21 +1,38 @@
 """Subscription provider (DI)."""
 
+import logging
 from collections.abc import AsyncIterable
+from collections.abc import Iterable
 
 from dishka import AnyOf
 from dishka import Scope
 from dishka import from_context
 from dishka import provide
 from dishka.provider import Provider
-from hvac import Client as VaultEngine
 from redis.asyncio import Redis as RedisEngine
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from src.application.interfaces.repositories.access_token_deny_list import (
+    IAccessTokenDenyListRepository,
+)
 from src.application.interfaces.repositories.api_key import ICreateApiKeyRepository
+from src.application.interfaces.repositories.api_key import IGetApiKeyHashesRepository
+from src.application.interfaces.repositories.api_key import (
+    IGetApiKeyPrincipalsRepository,
+)
 from src.application.interfaces.repositories.api_key import IGetAPIKeysAlchemyRepository
-from src.application.interfaces.repositories.api_key import IGetUserByApiKeyRepository
+from src.application.interfaces.repositories.api_key import (
+    IGetPrincipalByApiKeyRepository,
+)
+from src.application.interfaces.repositories.api_key import (
+    IGetPrincipalsByApiKeyHashesRepository,
+)
+from src.application.interfaces.repositories.api_key_filter import (
+    IApiKeyFilterRepository,
+)
+from src.application.interfaces.repositories.auth_index import IAuthIndexRepository
 from src.application.interfaces.repositories.database import (
     IDropDatabaseTablesRepository,
 )
@@ -25,14 +42,24 @@ from src.application.interfaces.repositories.fixture_loaders import (
 from src.application.interfaces.repositories.seed import ISeedRepository
 from src.application.interfaces.services.api_key import ICreateAPIKeyVaultRepository
 from src.application.interfaces.services.api_key import IGetAPIKeysVaultRepository
+from src.application.interfaces.services.api_key import IProvisionVaultRepository
+from src.application.interfaces.services.auth_cache import IAuthCache
+from src.application.interfaces.services.vault_outbox import IVaultOutboxDispatcher
 from src.domain.entities.subscriptions import SubscriptionPlan
 from src.domain.entities.users import User
 from src.infrastructure.common.interfaces import IDatabaseSession
 from src.infrastructure.common.interfaces import IVaultSession
 from src.infrastructure.database.repositories.auth.api_key import ApiKeyRepository
+from src.infrastructure.database.repositories.auth.principal import (
+    BatchingPrincipalRepository,
+)
+from src.infrastructure.database.repositories.auth.principal import PrincipalRepository
 from src.infrastructure.database.repositories.core.drop_database_tables import (
     DropDatabaseTablesRepository,
 )
+from src.infrastructure.database.repositories.core.vault_outbox import (
+    VaultOutboxRepository,
+)
 from src.infrastructure.database.repositories.subscriptions.subscription_plan import (
     SubscriptionPlanRepository,
 )
@@ -41,20 +68,43 @@ from src.infrastructure.disk.repositories.fixture_loaders import (
     SubscriptionPlanFixtureRepository,
 )
 from src.infrastructure.disk.repositories.fixture_loaders import UserFixtureRepository
+from src.infrastructure.memory.auth_cache import InMemoryAuthCache
+from src.infrastructure.memory.shared_auth_cache import SharedMemoryAuthCache
+from src.infrastructure.redis.repositories.access_token_deny_list import (
+    AccessTokenDenyListRepository,
+)
+from src.infrastructure.redis.repositories.api_key_filter import ApiKeyFilterRepository
+from src.infrastructure.redis.repositories.auth_index import AuthIndexRepository
+from src.infrastructure.vault.cache import InMemoryVaultSecretCache
+from src.infrastructure.vault.cache import IVaultSecretCache
+from src.infrastructure.vault.cache import RedisVaultSecretCache
+from src.infrastructure.vault.client import IVaultClient
+from src.infrastructure.vault.outbox import VaultOutboxDispatcher
 from src.infrastructure.vault.repositories.api_key import ApiKeyVaultRepository
+from src.infrastructure.vault.repositories.api_key_outbox import (
+    ApiKeyVaultOutboxRepository,
+)
+from src.infrastructure.vault.session import VaultMountCache
 from src.infrastructure.vault.session import VaultSession
 from src.main.config.settings import AppSettings
+from src.main.config.settings import AuthSettings
 from src.main.config.settings import Settings
 from src.main.config.settings import VaultSettings
 
+logger = logging.getLogger(__name__)
+
 
 class InfrastructureProvider(Provider):
     """Subscription provider (DI)."""
 
+    shared_cache_failed_message = (
+        "Shared authentication cache is unavailable, using in-process cache: %s"
+    )
+
     settings = from_context(provides=Settings, scope=Scope.APP)
     async_engine = from_context(provides=AsyncEngine, scope=Scope.APP)
     redis_engine = from_context(provides=RedisEngine, scope=Scope.APP)
-    vault_engine = from_context(provides=VaultEngine, scope=Scope.APP)
+    vault_client = from_context(provides=IVaultClient, scope=Scope.APP)
 
     subscription_plan_fixture_repository = provide(
         source=SubscriptionPlanFixtureRepository,
@@ -71,10 +121,12 @@ class InfrastructureProvider(Provider):
     user_repository = provide(
         source=UserRepository,
         scope=Scope.REQUEST,
-        provides=AnyOf[
-            ISeedRepository[User],
-            IGetUserByApiKeyRepository,
-        ],
+        provides=AnyOf[ISeedRepository[User]],
+    )
+
+    principal_repository = provide(
+        source=PrincipalRepository,
+        scope=Scope.APP,
     )
 
     subscription_plan_repository = provide(
@@ -92,13 +144,55 @@ class InfrastructureProvider(Provider):
     api_key_repository = provide(
         source=ApiKeyRepository,
         scope=Scope.REQUEST,
-        provides=AnyOf[ICreateApiKeyRepository, IGetAPIKeysAlchemyRepository],
+        provides=AnyOf[
+            ICreateApiKeyRepository,
+            IGetAPIKeysAlchemyRepository,
+            IGetApiKeyHashesRepository,
+            IGetApiKeyPrincipalsRepository,
+        ],
+    )
+
+    api_key_filter_repository = provide(
+        source=ApiKeyFilterRepository,
+        scope=Scope.APP,
+        provides=IApiKeyFilterRepository,
+    )
+
+    auth_index_repository = provide(
+        source=AuthIndexRepository,
+        scope=Scope.APP,
+        provides=IAuthIndexRepository,
+    )
+
+    access_token_deny_list_repository = provide(
+        source=AccessTokenDenyListRepository,
+        scope=Scope.APP,
+        provides=IAccessTokenDenyListRepository,
     )
 
     vault_repository = provide(
         source=ApiKeyVaultRepository,
         scope=Scope.REQUEST,
-        provides=AnyOf[ICreateAPIKeyVaultRepository, IGetAPIKeysVaultRepository],
+        provides=AnyOf[
+            ApiKeyVaultRepository,
+            IProvisionVaultRepository,
+        ],
+    )
+
+    vault_outbox_repository = provide(
+        source=VaultOutboxRepository,
+        scope=Scope.REQUEST,
+    )
+
+    api_key_vault_outbox_repository = provide(
+        source=ApiKeyVaultOutboxRepository,
+        scope=Scope.REQUEST,
+    )
+
+    vault_outbox_dispatcher = provide(
+        source=VaultOutboxDispatcher,
+        scope=Scope.APP,
+        provides=IVaultOutboxDispatcher,
     )
 
     @provide(scope=Scope.APP)
@@ -106,6 +200,11 @@ class InfrastructureProvider(Provider):
         """Provide debug app status."""
         return all_settings.app
 
+    @provide(scope=Scope.APP)
+    def get_auth_settings(self, all_settings: Settings) -> AuthSettings:
+        """Provide authentication settings."""
+        return all_settings.auth
+
     @provide(scope=Scope.APP)
     def get_vault_settings(self, all_settings: Settings) -> VaultSettings:
         """Provide debug app status."""
@@ -124,6 +223,52 @@ class InfrastructureProvider(Provider):
             expire_on_commit=False,
         )
 
+    @provide(scope=Scope.APP)
+    def get_auth_cache(self, auth_settings: AuthSettings) -> Iterable[IAuthCache]:
+        """Provide the authentication cache.
+
+        The shared cache falls back to the in-process one if its file cannot
+        be mapped.
+        """
+        if auth_settings.CACHE_ENABLED and auth_settings.CACHE_BACKEND == "shared":
+            # twice the max size, so probe windows rarely fill up
+            slots = auth_settings.CACHE_MAX_SIZE * 2
+            try:
+                shared_cache = SharedMemoryAuthCache(
+                    path=f"{auth_settings.CACHE_SHARED_PATH}-{slots}",
+                    slots=slots,
+                    ttl=auth_settings.CACHE_TTL,
+                )
+            except OSError as error:
+                logger.warning(self.shared_cache_failed_message, error)
+            else:
+                yield shared_cache
+                shared_cache.close()
+                return
+
+        yield InMemoryAuthCache(
+            max_size=auth_settings.CACHE_MAX_SIZE if auth_settings.CACHE_ENABLED else 0,
+            ttl=auth_settings.CACHE_TTL,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_principal_repository(
+        self,
+        auth_settings: AuthSettings,
+        repository: PrincipalRepository,
+    ) -> AnyOf[
+        IGetPrincipalByApiKeyRepository,
+        IGetPrincipalsByApiKeyHashesRepository,
+    ]:
+        """Provide principal lookups by API key, batched if enabled."""
+        if not auth_settings.BATCH_ENABLED:
+            return repository
+        return BatchingPrincipalRepository(
+            repository=repository,
+            window=auth_settings.BATCH_WINDOW,
+            max_batch_size=auth_settings.BATCH_MAX_SIZE,
+        )
+
     @provide(scope=Scope.REQUEST)
     async def get_alchemy_session(
         self,
@@ -133,11 +278,56 @@ class InfrastructureProvider(Provider):
         async with session_maker() as session:
             yield session
 
+    @provide(scope=Scope.APP)
+    def get_vault_mount_cache(self, vault_settings: VaultSettings) -> VaultMountCache:
+        """Provide the mount points known to exist in Vault."""
+        return VaultMountCache(ttl=vault_settings.MOUNT_CACHE_TTL)
+
+    @provide(scope=Scope.REQUEST)
+    def get_api_key_vault_repository(
+        self,
+        vault_settings: VaultSettings,
+        vault_repository: ApiKeyVaultRepository,
+        outbox_repository: ApiKeyVaultOutboxRepository,
+    ) -> AnyOf[ICreateAPIKeyVaultRepository, IGetAPIKeysVaultRepository]:
+        """Provide the API keys in Vault, through the outbox if enabled."""
+        if vault_settings.OUTBOX_ENABLED:
+            return outbox_repository
+        return vault_repository
+
+    @provide(scope=Scope.APP)
+    def get_vault_secret_cache(
+        self,
+        vault_settings: VaultSettings,
+        app_settings: AppSettings,
+        redis_engine: RedisEngine,
+    ) -> IVaultSecretCache:
+        """Provide the cache of secrets read from Vault."""
+        if (
+            vault_settings.READ_CACHE_ENABLED
+            and vault_settings.READ_CACHE_BACKEND == "redis"
+        ):
+            return RedisVaultSecretCache(
+                redis_engine=redis_engine,
+                secret_key=app_settings.SECRET_KEY,
+                max_age=vault_settings.READ_CACHE_MAX_AGE,
+            )
+        return InMemoryVaultSecretCache(max_size=vault_settings.READ_CACHE_MAX_SIZE)
+
     @provide(scope=Scope.REQUEST)
     async def get_vault_session(
         self,
-        vault_engine: VaultEngine,
+        vault_client: IVaultClient,
+        vault_mount_cache: VaultMountCache,
+        vault_secret_cache: IVaultSecretCache,
+        vault_settings: VaultSettings,
     ) -> AsyncIterable[AnyOf[VaultSession, IVaultSession]]:
         """Provide async session."""
-        async with VaultSession(vault_engine=vault_engine).begin() as session:
+        async with VaultSession(
+            vault_client=vault_client,
+            mount_cache=vault_mount_cache,
+            secret_cache=vault_secret_cache,
+            flush_concurrency=vault_settings.FLUSH_CONCURRENCY,
+            read_cache_ttl=vault_settings.READ_CACHE_TTL,
+        ).begin() as session:
             yield session
@@ -0,0 +1 @@
+"""In-process memory storage module."""
@@ -0,0 +1,71 @@
+"""In-process authentication cache."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import replace
+
+from src.application.interfaces.services.auth_cache import CacheStats
+from src.application.interfaces.services.auth_cache import IAuthCache
+from src.domain.entities.auth.principal import Principal
+
+
+class InMemoryAuthCache(IAuthCache):
+    """Per-process TTL/LRU cache of authenticated principals.
+
+    Entries are kept in access order. The least recently used entry is
+    evicted once ``max_size`` is reached, and entries older than ``ttl``
+    seconds are dropped when they are accessed.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize cache."""
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[float, Principal]] = OrderedDict()
+        self._stats = CacheStats()
+
+    def get(self, api_key_hashed: bytes) -> Principal | None:
+        """Get a cached principal by API key hash."""
+        entry = self._entries.get(api_key_hashed)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, principal = entry
+        if expires_at <= self._clock():
+            del self._entries[api_key_hashed]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(api_key_hashed)
+        self._stats.hits += 1
+        return principal
+
+    def set(self, api_key_hashed: bytes, principal: Principal) -> None:
+        """Cache a principal by API key hash."""
+        if self._max_size <= 0:
+            return
+
+        self._entries[api_key_hashed] = (self._clock() + self._ttl, principal)
+        self._entries.move_to_end(api_key_hashed)
+
+        # evict the least recently used entries
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def invalidate(self, api_key_hashed: bytes) -> None:
+        """Drop a cached principal by API key hash."""
+        self._entries.pop(api_key_hashed, None)
+
+    def stats(self) -> CacheStats:
+        """Get cache counters."""
+        return replace(self._stats, size=len(self._entries))
@@ -0,0 +1,237 @@
+"""Authentication cache shared by all worker processes of a host."""
+
+import fcntl
+import mmap
+import os
+import struct
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import replace
+from uuid import UUID
+
+from src.application.interfaces.services.auth_cache import CacheStats
+from src.application.interfaces.services.auth_cache import IAuthCache
+from src.domain.entities.auth.principal import Principal
+
+HEADER = struct.Struct("<8sII")
+SEQUENCE = struct.Struct("<Q")
+# expires at, key length, key, user id and api key id
+RECORD = struct.Struct("<dB64s32s")
+
+MAGIC = b"ERGOAUTH"
+VERSION = 1
+SLOT_SIZE = 128
+KEY_SIZE = 64
+UNUSED = 0.0
+REMOVED = -1.0
+
+
+class SharedMemoryAuthCache(IAuthCache):
+    """Fixed-size hash table of authenticated principals in a shared memory file.
+
+    Every worker maps the same file, so a key authenticated by one worker is
+    warm in all of them and is stored once per host. Each slot is guarded by
+    a sequence number: writers serialize on ``flock`` and make the sequence
+    odd while they write, readers take no lock and retry when the sequence
+    was odd or changed during the read. Keys are placed by open addressing
+    within ``probe_length`` slots, and the entry closest to expiry is evicted
+    when all of them are taken. Counters are per process.
+    """
+
+    probe_length = 8
+    read_retries = 4
+    foreign_file_message = "Cache file {path} is owned by another user."
+
+    def __init__(
+        self,
+        path: str,
+        slots: int,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Map the cache file, creating it if needed."""
+        self._slots = slots
+        self._ttl = ttl
+        self._clock = clock
+        self._stats = CacheStats()
+        # decoded principals by their stored bytes, building UUIDs is slow
+        self._principals: dict[bytes, Principal] = {}
+
+        size = HEADER.size + slots * SLOT_SIZE
+        self._fd = self._open(path)
+        try:
+            with self._locked():
+                if os.fstat(self._fd).st_size != size:
+                    os.ftruncate(self._fd, size)
+                self._buffer = mmap.mmap(self._fd, size)
+                magic, version, stored_slots = HEADER.unpack_from(self._buffer)
+                if (magic, version, stored_slots) != (MAGIC, VERSION, slots):
+                    self._buffer[:] = bytes(size)
+                    HEADER.pack_into(self._buffer, 0, MAGIC, VERSION, slots)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def get(self, api_key_hashed: bytes) -> Principal | None:
+        """Get a cached principal by API key hash."""
+        if len(api_key_hashed) <= KEY_SIZE:
+            now = self._clock()
+            for offset in self._probe(api_key_hashed):
+                record = self._read(offset)
+                if record is None:
+                    break
+                expires_at, key_size, key, principal_bytes = record
+                if expires_at == UNUSED:
+                    break
+                if key[:key_size] != api_key_hashed:
+                    continue
+                if expires_at <= now:
+                    self._stats.expirations += 1
+                    break
+                self._stats.hits += 1
+                return self._decode(principal_bytes)
+
+        self._stats.misses += 1
+        return None
+
+    def set(self, api_key_hashed: bytes, principal: Principal) -> None:
+        """Cache a principal by API key hash."""
+        if len(api_key_hashed) > KEY_SIZE:
+            return
+
+        with self._locked():
+            now = self._clock()
+            # the slot of the same key, else the first free one,
+            # else the one closest to expiry
+            target: int | None = None
+            free: int | None = None
+            oldest: tuple[float, int] | None = None
+            for offset in self._probe(api_key_hashed):
+                expires_at, key_size, key, _ = RECORD.unpack_from(
+                    self._buffer,
+                    offset + SEQUENCE.size,
+                )
+                if expires_at > now and key[:key_size] == api_key_hashed:
+                    target = offset
+                    break
+                if expires_at <= now:
+                    if free is None:
+                        free = offset
+                elif oldest is None or expires_at < oldest[0]:
+                    oldest = (expires_at, offset)
+
+            if target is None:
+                target = free
+            if target is None and oldest is not None:
+                target = oldest[1]
+                self._stats.evictions += 1
+
+            if target is not None:
+                self._write(
+                    target,
+                    now + self._ttl,
+                    api_key_hashed,
+                    principal.user_id.bytes + principal.api_key_id.bytes,
+                )
+
+    def invalidate(self, api_key_hashed: bytes) -> None:
+        """Drop a cached principal by API key hash."""
+        with self._locked():
+            for offset in self._probe(api_key_hashed):
+                expires_at, key_size, key, _ = RECORD.unpack_from(
+                    self._buffer,
+                    offset + SEQUENCE.size,
+                )
+                if expires_at == UNUSED:
+                    return
+                if key[:key_size] == api_key_hashed:
+                    # keep the slot marked as used, so probing goes past it
+                    self._write(offset, REMOVED, b"", bytes(32))
+
+    def stats(self) -> CacheStats:
+        """Get cache counters, the size is counted over the whole table."""
+        now = self._clock()
+        size = sum(
+            RECORD.unpack_from(self._buffer, offset + SEQUENCE.size)[0] > now
+            for offset in range(HEADER.size, len(self._buffer), SLOT_SIZE)
+        )
+        return replace(self._stats, size=size)
+
+    def close(self) -> None:
+        """Unmap the cache file."""
+        self._buffer.close()
+        os.close(self._fd)
+
+    @classmethod
+    def _open(cls, path: str) -> int:
+        """Open the cache file, refusing links and files of other users."""
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        # the file may live in a world-writable directory
+        if os.fstat(fd).st_uid != os.getuid():
+            os.close(fd)
+            raise PermissionError(cls.foreign_file_message.format(path=path))
+        return fd
+
+    def _decode(self, principal_bytes: bytes) -> Principal:
+        """Get the principal stored as bytes."""
+        principal = self._principals.get(principal_bytes)
+        if principal is None:
+            if len(self._principals) >= self._slots:
+                self._principals.clear()
+            principal = Principal(
+                user_id=UUID(bytes=principal_bytes[:16]),
+                api_key_id=UUID(bytes=principal_bytes[16:]),
+            )
+            self._principals[principal_bytes] = principal
+        return principal
+
+    def _probe(self, api_key_hashed: bytes) -> Iterator[int]:
+        """Get offsets of the slots a key may occupy."""
+        start = int.from_bytes(api_key_hashed[:8], "little") % self._slots
+        for index in range(start, start + self.probe_length):
+            yield HEADER.size + index % self._slots * SLOT_SIZE
+
+    def _read(
+        self,
+        offset: int,
+    ) -> tuple[float, int, bytes, bytes] | None:
+        """Read a slot consistently, or None if it kept changing."""
+        for _ in range(self.read_retries):
+            (sequence,) = SEQUENCE.unpack_from(self._buffer, offset)
+            if sequence & 1:
+                continue
+            record = RECORD.unpack_from(self._buffer, offset + SEQUENCE.size)
+            if SEQUENCE.unpack_from(self._buffer, offset)[0] == sequence:
+                return record
+        return None
+
+    def _write(
+        self,
+        offset: int,
+        expires_at: float,
+        api_key_hashed: bytes,
+        principal: bytes,
+    ) -> None:
+        """Write a slot, the caller holds the lock."""
+        (sequence,) = SEQUENCE.unpack_from(self._buffer, offset)
+        SEQUENCE.pack_into(self._buffer, offset, sequence + 1)
+        RECORD.pack_into(
+            self._buffer,
+            offset + SEQUENCE.size,
+            expires_at,
+            len(api_key_hashed),
+            api_key_hashed,
+            principal,
+        )
+        SEQUENCE.pack_into(self._buffer, offset, sequence + 2)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the exclusive write lock of the cache file."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
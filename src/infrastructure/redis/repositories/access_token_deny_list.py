@@ -0,0 +1,68 @@
+"""Deny-list of access tokens stored in Redis."""
+
+import time
+from uuid import UUID
+
+from redis.asyncio import Redis as RedisEngine
+
+from src.application.interfaces.repositories.access_token_deny_list import (
+    IAccessTokenDenyListRepository,
+)
+from src.main.config.settings import AuthSettings
+
+
+class AccessTokenDenyListRepository(IAccessTokenDenyListRepository):
+    """Revocation times of API keys in a Redis sorted set, mirrored in memory.
+
+    Members are API key ids scored by their revocation time. A revocation
+    outlives every token it covers by the token lifetime, then it is dropped,
+    so the list only holds keys revoked within the last lifetime. Refreshes
+    are merged into the mirror, so a local revocation racing with a refresh
+    is kept.
+    """
+
+    key = "auth:access-token-deny-list"
+
+    def __init__(
+        self,
+        redis_engine: RedisEngine,
+        auth_settings: AuthSettings,
+    ):
+        """Initialize repository."""
+        self._redis = redis_engine
+        self._lifetime = auth_settings.ACCESS_TOKEN_TTL
+        self._revoked: dict[UUID, float] = {}
+
+    def is_revoked(self, api_key_id: UUID, issued_at: float) -> bool:
+        """Check if a token issued for an API key at a time is revoked.
+
+        Both times have sub-second precision, so a token issued in the same
+        second but after the revocation is not revoked.
+        """
+        revoked_at = self._revoked.get(api_key_id)
+        return revoked_at is not None and issued_at <= revoked_at
+
+    async def revoke(self, api_key_id: UUID) -> None:
+        """Revoke all tokens issued so far for an API key."""
+        revoked_at = time.time()
+        await self._redis.zadd(self.key, {api_key_id.bytes: revoked_at})
+        self._revoked[api_key_id] = revoked_at
+
+    async def refresh(self) -> None:
+        """Load revocations made by other processes."""
+        expired_before = time.time() - self._lifetime
+        async with self._redis.pipeline(transaction=True) as pipeline:
+            pipeline.zremrangebyscore(self.key, "-inf", expired_before)
+            pipeline.zrange(self.key, 0, -1, withscores=True)
+            _, revocations = await pipeline.execute()
+
+        # keep the latest revocation of a key, from either side
+        revoked = {
+            api_key_id: revoked_at
+            for api_key_id, revoked_at in self._revoked.items()
+            if revoked_at > expired_before
+        }
+        for api_key_id_bytes, revoked_at in revocations:
+            api_key_id = UUID(bytes=api_key_id_bytes)
+            revoked[api_key_id] = max(revoked_at, revoked.get(api_key_id, revoked_at))
+        self._revoked = revoked
@@ -0,0 +1,156 @@
+"""Bloom filter of issued API keys stored in Redis."""
+
+import hashlib
+import logging
+import math
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+
+from redis.asyncio import Redis as RedisEngine
+from redis.exceptions import RedisError
+
+from src.application.interfaces.repositories.api_key_filter import (
+    IApiKeyFilterRepository,
+)
+from src.main.config.settings import AuthSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BloomFilterParameters:
+    """Bloom filter size and number of hash functions."""
+
+    size: int
+    hash_count: int
+
+    @classmethod
+    def from_capacity(
+        cls,
+        capacity: int,
+        false_positive_rate: float,
+    ) -> "BloomFilterParameters":
+        """Get optimal parameters for an expected number of items."""
+        size = math.ceil(
+            -capacity * math.log(false_positive_rate) / math.log(2) ** 2,
+        )
+        hash_count = max(1, round(size / capacity * math.log(2)))
+        return cls(size=size, hash_count=hash_count)
+
+    def offsets(self, item: bytes) -> list[int]:
+        """Get bit offsets of an item.
+
+        Offsets start at 1, bit 0 marks a built filter.
+        """
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first = int.from_bytes(digest[:8])
+        second = int.from_bytes(digest[8:]) | 1
+        return [
+            1 + (first + index * second) % self.size for index in range(self.hash_count)
+        ]
+
+
+class ApiKeyFilterRepository(IApiKeyFilterRepository):
+    """Bloom filter of issued API key hashes stored as a Redis bitmap.
+
+    The bitmap is shared by all workers. The filter parameters are part of
+    the key, so processes with different settings never read each other's
+    bits. Lookups fail open: a missing filter or a Redis error means
+    "might contain". A failed add raises, so the key is not committed:
+    once the filter is built, a key missing from it is rejected on every
+    request and nothing would add it again.
+    """
+
+    lookup_failed_message = "API key filter lookup failed: %s"
+    filter_built_message = "API key filter built with %s keys"
+    over_capacity_message = (
+        "API key filter holds %s keys, more than its capacity of %s. "
+        "Increase AUTH_KEY_FILTER_CAPACITY to keep the false positive rate."
+    )
+
+    def __init__(
+        self,
+        redis_engine: RedisEngine,
+        auth_settings: AuthSettings,
+    ):
+        """Initialize repository."""
+        self._redis = redis_engine
+        self._enabled = auth_settings.KEY_FILTER_ENABLED
+        self._capacity = auth_settings.KEY_FILTER_CAPACITY
+        self._parameters = BloomFilterParameters.from_capacity(
+            capacity=self._capacity,
+            false_positive_rate=auth_settings.KEY_FILTER_FALSE_POSITIVE_RATE,
+        )
+        self._key = (
+            f"auth:api-key-digest-filter:"
+            f"{self._parameters.size}:{self._parameters.hash_count}"
+        )
+
+    async def might_contain(self, api_key_hashed: bytes) -> bool:
+        """Check if the API key hash may have been issued."""
+        if not self._enabled:
+            return True
+
+        offsets = self._parameters.offsets(api_key_hashed)
+        try:
+            is_built, *bits = await self._redis.bitfield_ro(
+                self._key,
+                "u1",
+                0,
+                items=[("u1", offset) for offset in offsets],
+            )
+        except RedisError as error:
+            logger.warning(self.lookup_failed_message, error)
+            return True
+
+        return not is_built or all(bits)
+
+    async def add(self, api_key_hashed: bytes) -> None:
+        """Add an issued API key hash.
+
+        Raises:
+            RedisError: if the filter cannot be updated, the key must not
+                be committed.
+        """
+        if not self._enabled:
+            return
+
+        operation = self._redis.bitfield(self._key)
+        for offset in self._parameters.offsets(api_key_hashed):
+            operation.set("u1", offset, 1)
+        await operation.execute()
+
+    async def exists(self) -> bool:
+        """Check if the filter has been built."""
+        return bool(await self._redis.getbit(self._key, 0))
+
+    async def rebuild(self, api_keys_hashed: AsyncIterable[bytes]) -> int:
+        """Build the filter from all issued API key hashes.
+
+        The bitmap is built in memory and merged into the shared one with
+        ``BITOP OR``, so keys added while the rebuild runs are kept.
+        """
+        if not self._enabled:
+            return 0
+
+        bitmap = bytearray(self._parameters.size // 8 + 1)
+        bitmap[0] |= 0x80
+
+        count = 0
+        async for api_key_hashed in api_keys_hashed:
+            for offset in self._parameters.offsets(api_key_hashed):
+                bitmap[offset >> 3] |= 0x80 >> (offset & 7)
+            count += 1
+
+        if count > self._capacity:
+            logger.warning(self.over_capacity_message, count, self._capacity)
+
+        building_key = f"{self._key}:building"
+        async with self._redis.pipeline(transaction=True) as pipeline:
+            pipeline.set(building_key, bytes(bitmap))
+            pipeline.bitop("OR", self._key, self._key, building_key)
+            pipeline.delete(building_key)
+            await pipeline.execute()
+
+        logger.info(self.filter_built_message, count)
+        return count
@@ -0,0 +1,135 @@
+"""Index of principals by API key stored in Redis."""
+
+import logging
+from collections.abc import AsyncIterable
+from uuid import UUID
+
+from redis.asyncio import Redis as RedisEngine
+from redis.exceptions import RedisError
+
+from src.application.interfaces.repositories.auth_index import IAuthIndexRepository
+from src.domain.entities.auth.principal import Principal
+from src.main.config.settings import AuthSettings
+
+logger = logging.getLogger(__name__)
+
+# user id and api key id
+RECORD_SIZE = 32
+
+
+class AuthIndexRepository(IAuthIndexRepository):
+    """Principals by API key hash stored in a Redis hash.
+
+    Each field is an API key hash and its value the 32 bytes of the user id
+    and the API key id. Lookups and writes fail open: a Redis error is a
+    miss, and the caller falls back to the database. Deletes raise instead,
+    a key left in the index would keep authenticating.
+
+    The hash commands of the client are typed for text fields, so binary
+    fields are sent with ``execute_command`` or as a mapping.
+    """
+
+    key = "auth:api-key-index"
+    lookup_failed_message = "Authentication index lookup failed: %s"
+    write_failed_message = "Authentication index write failed: %s"
+    index_built_message = "Authentication index built with %s keys"
+
+    def __init__(
+        self,
+        redis_engine: RedisEngine,
+        auth_settings: AuthSettings,
+    ):
+        """Initialize repository."""
+        self._redis = redis_engine
+        self._enabled = auth_settings.INDEX_ENABLED
+        self._chunk_size = auth_settings.INDEX_CHUNK_SIZE
+
+    async def get(self, api_key_hashed: bytes) -> Principal | None:
+        """Get an indexed principal by API key hash."""
+        if not self._enabled:
+            return None
+
+        try:
+            record = await self._redis.execute_command("HGET", self.key, api_key_hashed)
+        except RedisError as error:
+            logger.warning(self.lookup_failed_message, error)
+            return None
+
+        if record is None or len(record) != RECORD_SIZE:
+            return None
+        return Principal(
+            user_id=UUID(bytes=record[:16]),
+            api_key_id=UUID(bytes=record[16:]),
+        )
+
+    async def set(self, api_key_hashed: bytes, principal: Principal) -> None:
+        """Index a principal by API key hash."""
+        if not self._enabled:
+            return
+
+        try:
+            await self._redis.execute_command(
+                "HSET",
+                self.key,
+                api_key_hashed,
+                principal.user_id.bytes + principal.api_key_id.bytes,
+            )
+        except RedisError as error:
+            logger.warning(self.write_failed_message, error)
+
+    async def delete(self, api_key_hashed: bytes) -> None:
+        """Remove an API key hash from the index."""
+        if not self._enabled:
+            return
+
+        await self._redis.execute_command("HDEL", self.key, api_key_hashed)
+
+    async def clear(self) -> None:
+        """Remove every API key hash from the index."""
+        if not self._enabled:
+            return
+
+        await self._redis.delete(self.key)
+
+    async def exists(self) -> bool:
+        """Check if the index has been built."""
+        return bool(await self._redis.exists(self.key))
+
+    async def rebuild(
+        self,
+        principals: AsyncIterable[tuple[bytes, Principal]],
+    ) -> int:
+        """Build the index from principals of all issued API keys.
+
+        The index is written to a new hash in pipelined chunks and renamed
+        over the live one, so deleted keys are dropped. Keys issued while the
+        rebuild runs may be missing until they are read and repaired.
+        """
+        if not self._enabled:
+            return 0
+
+        building_key = f"{self.key}:building"
+        await self._redis.delete(building_key)
+
+        count = 0
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            async for api_key_hashed, principal in principals:
+                pipeline.hset(
+                    building_key,
+                    mapping={
+                        api_key_hashed: principal.user_id.bytes
+                        + principal.api_key_id.bytes,
+                    },
+                )
+                count += 1
+                if count % self._chunk_size == 0:
+                    await pipeline.execute()
+            await pipeline.execute()
+
+        if count:
+            await self._redis.rename(building_key, self.key)
+        else:
+            await self._redis.delete(self.key)
+
+        logger.info(self.index_built_message, count)
+        return count
@@ -0,0 +1,13 @@
+"""Read caches of Vault secrets."""
+
+from .base import CachedVaultSecret
+from .base import IVaultSecretCache
+from .memory_cache import InMemoryVaultSecretCache
+from .redis_cache import RedisVaultSecretCache
+
+__all__ = [
+    "CachedVaultSecret",
+    "IVaultSecretCache",
+    "InMemoryVaultSecretCache",
+    "RedisVaultSecretCache",
+]
@@ -0,0 +1,37 @@
+"""Vault secret cache interface."""
+
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Any
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class CachedVaultSecret:
+    """Data of a KV v2 secret, its version and when it was last checked."""
+
+    data: dict[str, Any]
+    version: int
+    checked_at: float
+
+
+class IVaultSecretCache(Protocol):
+    """Cache of KV v2 secrets read from Vault, by mount point and path.
+
+    Implementations fail open: an entry that cannot be read is a miss.
+    """
+
+    @abstractmethod
+    async def get(self, mount_point: str, path: str) -> CachedVaultSecret | None:
+        """Get a cached secret."""
+        ...
+
+    @abstractmethod
+    async def set(self, mount_point: str, path: str, secret: CachedVaultSecret) -> None:
+        """Cache a secret."""
+        ...
+
+    @abstractmethod
+    async def invalidate(self, mount_point: str, path: str) -> None:
+        """Drop a cached secret."""
+        ...
@@ -0,0 +1,40 @@
+"""In-process Vault secret cache."""
+
+from collections import OrderedDict
+
+from src.infrastructure.vault.cache.base import CachedVaultSecret
+from src.infrastructure.vault.cache.base import IVaultSecretCache
+
+
+class InMemoryVaultSecretCache(IVaultSecretCache):
+    """Per-process LRU cache of Vault secrets.
+
+    The least recently used entry is evicted once ``max_size`` is reached,
+    nothing is cached when it is 0.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize cache."""
+        self._max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], CachedVaultSecret] = OrderedDict()
+
+    async def get(self, mount_point: str, path: str) -> CachedVaultSecret | None:
+        """Get a cached secret."""
+        secret = self._entries.get((mount_point, path))
+        if secret is not None:
+            self._entries.move_to_end((mount_point, path))
+        return secret
+
+    async def set(self, mount_point: str, path: str, secret: CachedVaultSecret) -> None:
+        """Cache a secret."""
+        if self._max_size <= 0:
+            return
+
+        self._entries[(mount_point, path)] = secret
+        self._entries.move_to_end((mount_point, path))
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, mount_point: str, path: str) -> None:
+        """Drop a cached secret."""
+        self._entries.pop((mount_point, path), None)
@@ -0,0 +1,91 @@
+"""Vault secret cache stored in Redis."""
+
+import hashlib
+import json
+import logging
+
+from cryptography.fernet import InvalidToken
+from redis.asyncio import Redis as RedisEngine
+from redis.exceptions import RedisError
+
+from src.infrastructure.common.encryption import get_fernet
+from src.infrastructure.vault.cache.base import CachedVaultSecret
+from src.infrastructure.vault.cache.base import IVaultSecretCache
+
+logger = logging.getLogger(__name__)
+
+
+class RedisVaultSecretCache(IVaultSecretCache):
+    """Vault secrets cached in Redis, shared by all processes.
+
+    Entries are encrypted with Fernet under a key derived from the
+    application secret key, so Redis never holds secret values in the clear,
+    and they expire after ``max_age`` seconds. Key names are hashes of the
+    mount point and path. Redis errors and entries that cannot be decrypted
+    are misses.
+    """
+
+    key_prefix = "vault:secret:"
+    lookup_failed_message = "Vault secret cache lookup failed: %s"
+    write_failed_message = "Vault secret cache write failed: %s"
+
+    def __init__(self, redis_engine: RedisEngine, secret_key: str, max_age: float):
+        """Initialize cache."""
+        self._redis = redis_engine
+        self._max_age = max(1, int(max_age))
+        self._fernet = get_fernet(secret_key, person=b"vault-cache")
+
+    async def get(self, mount_point: str, path: str) -> CachedVaultSecret | None:
+        """Get a cached secret."""
+        try:
+            token = await self._redis.get(self._key(mount_point, path))
+        except RedisError as error:
+            logger.warning(self.lookup_failed_message, error)
+            return None
+
+        if token is None:
+            return None
+        try:
+            entry = json.loads(self._fernet.decrypt(token))
+        except (InvalidToken, ValueError):
+            return None
+        return CachedVaultSecret(
+            data=entry["data"],
+            version=entry["version"],
+            checked_at=entry["checked_at"],
+        )
+
+    async def set(self, mount_point: str, path: str, secret: CachedVaultSecret) -> None:
+        """Cache a secret."""
+        token = self._fernet.encrypt(
+            json.dumps(
+                {
+                    "data": secret.data,
+                    "version": secret.version,
+                    "checked_at": secret.checked_at,
+                },
+            ).encode(),
+        )
+        try:
+            await self._redis.set(
+                self._key(mount_point, path),
+                token,
+                ex=self._max_age,
+            )
+        except RedisError as error:
+            logger.warning(self.write_failed_message, error)
+
+    async def invalidate(self, mount_point: str, path: str) -> None:
+        """Drop a cached secret."""
+        try:
+            await self._redis.delete(self._key(mount_point, path))
+        except RedisError as error:
+            logger.warning(self.write_failed_message, error)
+
+    def _key(self, mount_point: str, path: str) -> str:
+        """Get the Redis key of a secret."""
+        digest = hashlib.blake2b(
+            f"{mount_point}\0{path}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        return f"{self.key_prefix}{digest}"
@@ -0,0 +1,8 @@
+"""Vault clients."""
+
+from .base import IVaultClient
+from .base import VaultSecret
+from .httpx_client import AsyncVaultClient
+from .hvac_client import HvacVaultClient
+
+__all__ = ["AsyncVaultClient", "HvacVaultClient", "IVaultClient", "VaultSecret"]
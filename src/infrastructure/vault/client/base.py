@@ -0,0 +1,106 @@
+"""Vault client interface."""
+
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Any
+from typing import Protocol
+
+from src.infrastructure.vault.executor import VaultExecutorStats
+
+
+@dataclass(frozen=True, slots=True)
+class VaultSecret:
+    """Data of a KV v2 secret and the version it was read at."""
+
+    data: dict[str, Any]
+    version: int
+
+
+def get_current_version(metadata: dict[str, Any]) -> int | None:
+    """Get the current version from KV v2 secret metadata.
+
+    None if the current version was deleted or destroyed, so it cannot be read.
+    """
+    version = metadata["current_version"]
+    details = metadata.get("versions", {}).get(str(version), {})
+    if details.get("deletion_time") or details.get("destroyed"):
+        return None
+    return version
+
+
+class IVaultClient(Protocol):
+    """Async client of the Vault operations used by the application.
+
+    Errors are raised as ``hvac.exceptions.VaultError`` subclasses by every
+    implementation, e.g. ``InvalidPath`` for a missing secret.
+    """
+
+    @abstractmethod
+    async def read_secret(self, path: str, mount_point: str) -> VaultSecret:
+        """Read the latest version of a KV v2 secret."""
+        ...
+
+    @abstractmethod
+    async def read_secret_version(self, path: str, mount_point: str) -> int | None:
+        """Read the current version of a KV v2 secret from its metadata.
+
+        None if that version was deleted or destroyed.
+        """
+        ...
+
+    @abstractmethod
+    async def patch(self, path: str, secret: dict[str, Any], mount_point: str) -> None:
+        """Merge keys into an existing KV v2 secret."""
+        ...
+
+    @abstractmethod
+    async def create_or_update_secret(
+        self,
+        path: str,
+        secret: dict[str, Any],
+        mount_point: str,
+        cas: int | None = None,
+    ) -> int:
+        """Write a new version of a KV v2 secret and get its number.
+
+        With ``cas``, the write is done only if the current version is
+        ``cas``, 0 meaning that the secret does not exist, and
+        ``InvalidRequest`` is raised otherwise.
+        """
+        ...
+
+    @abstractmethod
+    async def destroy_secret_versions(
+        self,
+        path: str,
+        versions: list[int],
+        mount_point: str,
+    ) -> None:
+        """Permanently delete the data of versions of a KV v2 secret."""
+        ...
+
+    @abstractmethod
+    async def list_mounted_secrets_engines(self) -> dict[str, Any]:
+        """List secrets engines by mount path, e.g. ``"api-keys/"``."""
+        ...
+
+    @abstractmethod
+    async def enable_secrets_engine(
+        self,
+        backend_type: str,
+        path: str,
+        options: dict[str, Any] | None = None,
+        description: str | None = None,
+    ) -> None:
+        """Mount a secrets engine."""
+        ...
+
+    @abstractmethod
+    def executor_stats(self) -> VaultExecutorStats | None:
+        """Get counters of the threads running Vault calls, None without threads."""
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the client."""
+        ...
@@ -0,0 +1,155 @@
+"""Vault client on asyncio with httpx."""
+
+from typing import Any
+
+import httpx
+from hvac.exceptions import VaultDown
+from hvac.utils import raise_for_error
+
+from src.infrastructure.vault.client.base import IVaultClient
+from src.infrastructure.vault.client.base import VaultSecret
+from src.infrastructure.vault.client.base import get_current_version
+from src.infrastructure.vault.executor import VaultExecutorStats
+
+
+class AsyncVaultClient(IVaultClient):
+    """Vault client speaking the HTTP API on the event loop.
+
+    Connections are kept alive in the pool of one ``httpx.AsyncClient``
+    shared by all requests, so no thread is held while waiting for Vault.
+    Error responses are raised as hvac exceptions and connection failures
+    as ``VaultDown``, the same as with hvac.
+    """
+
+    merge_patch_headers = {"Content-Type": "application/merge-patch+json"}
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize client."""
+        self._client = httpx.AsyncClient(
+            base_url=f"{url.rstrip('/')}/v1/",
+            headers={"X-Vault-Token": token},
+            limits=limits or httpx.Limits(),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    async def read_secret(self, path: str, mount_point: str) -> VaultSecret:
+        """Read the latest version of a KV v2 secret."""
+        response = await self._request("GET", f"{mount_point}/data/{path}")
+        return VaultSecret(
+            data=response["data"]["data"],
+            version=response["data"]["metadata"]["version"],
+        )
+
+    async def read_secret_version(self, path: str, mount_point: str) -> int | None:
+        """Read the current version of a KV v2 secret from its metadata."""
+        response = await self._request("GET", f"{mount_point}/metadata/{path}")
+        return get_current_version(response["data"])
+
+    async def patch(self, path: str, secret: dict[str, Any], mount_point: str) -> None:
+        """Merge keys into an existing KV v2 secret."""
+        await self._request(
+            "PATCH",
+            f"{mount_point}/data/{path}",
+            json={"data": secret},
+            headers=self.merge_patch_headers,
+        )
+
+    async def create_or_update_secret(
+        self,
+        path: str,
+        secret: dict[str, Any],
+        mount_point: str,
+        cas: int | None = None,
+    ) -> int:
+        """Write a new version of a KV v2 secret and get its number."""
+        body: dict[str, Any] = {"data": secret}
+        if cas is not None:
+            body["options"] = {"cas": cas}
+        response = await self._request("POST", f"{mount_point}/data/{path}", json=body)
+        return response["data"]["version"]
+
+    async def destroy_secret_versions(
+        self,
+        path: str,
+        versions: list[int],
+        mount_point: str,
+    ) -> None:
+        """Permanently delete the data of versions of a KV v2 secret."""
+        await self._request(
+            "POST",
+            f"{mount_point}/destroy/{path}",
+            json={"versions": versions},
+        )
+
+    async def list_mounted_secrets_engines(self) -> dict[str, Any]:
+        """List secrets engines by mount path, e.g. ``"api-keys/"``."""
+        response = await self._request("GET", "sys/mounts")
+        return response.get("data", response)
+
+    async def enable_secrets_engine(
+        self,
+        backend_type: str,
+        path: str,
+        options: dict[str, Any] | None = None,
+        description: str | None = None,
+    ) -> None:
+        """Mount a secrets engine."""
+        await self._request(
+            "POST",
+            f"sys/mounts/{path}",
+            json={
+                "type": backend_type,
+                "description": description,
+                "options": options,
+            },
+        )
+
+    def executor_stats(self) -> VaultExecutorStats | None:
+        """Get counters of the threads running Vault calls, there are none."""
+        return None
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request to the Vault API, the body is empty for 204."""
+        try:
+            response = await self._client.request(
+                method,
+                url,
+                json=json,
+                headers=headers,
+            )
+        except httpx.TransportError as error:
+            raise VaultDown(str(error), method=method, url=url) from error
+
+        if response.is_error:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            raise_for_error(
+                method,
+                str(response.url),
+                response.status_code,
+                errors=body.get("errors") if isinstance(body, dict) else None,
+                text=response.text,
+                json=body,
+            )
+
+        return response.json() if response.content else {}
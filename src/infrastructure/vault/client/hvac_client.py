@@ -0,0 +1,124 @@
+"""Vault client running hvac in worker threads."""
+
+from typing import Any
+
+from hvac import Client as VaultEngine
+
+from src.infrastructure.vault.client.base import IVaultClient
+from src.infrastructure.vault.client.base import VaultSecret
+from src.infrastructure.vault.client.base import get_current_version
+from src.infrastructure.vault.executor import VaultExecutor
+from src.infrastructure.vault.executor import VaultExecutorStats
+
+
+class HvacVaultClient(IVaultClient):
+    """Vault client running the synchronous hvac client in worker threads.
+
+    Every call takes a thread of the Vault executor for its whole HTTP round
+    trip. The engine's requests session is shared by all requests, so its
+    connection pool is too.
+    """
+
+    def __init__(self, engine: VaultEngine, executor: VaultExecutor):
+        """Initialize client."""
+        self.engine = engine
+        self.executor = executor
+
+    async def read_secret(self, path: str, mount_point: str) -> VaultSecret:
+        """Read the latest version of a KV v2 secret."""
+        response = await self.executor.run(
+            lambda: self.engine.secrets.kv.v2.read_secret(
+                path=path,
+                mount_point=mount_point,
+            ),
+        )
+        return VaultSecret(
+            data=response["data"]["data"],
+            version=response["data"]["metadata"]["version"],
+        )
+
+    async def read_secret_version(self, path: str, mount_point: str) -> int | None:
+        """Read the current version of a KV v2 secret from its metadata."""
+        response = await self.executor.run(
+            lambda: self.engine.secrets.kv.v2.read_secret_metadata(
+                path=path,
+                mount_point=mount_point,
+            ),
+        )
+        return get_current_version(response["data"])
+
+    async def patch(self, path: str, secret: dict[str, Any], mount_point: str) -> None:
+        """Merge keys into an existing KV v2 secret."""
+        await self.executor.run(
+            lambda: self.engine.secrets.kv.v2.patch(
+                path=path,
+                secret=secret,
+                mount_point=mount_point,
+            ),
+        )
+
+    async def create_or_update_secret(
+        self,
+        path: str,
+        secret: dict[str, Any],
+        mount_point: str,
+        cas: int | None = None,
+    ) -> int:
+        """Write a new version of a KV v2 secret and get its number."""
+        response = await self.executor.run(
+            lambda: self.engine.secrets.kv.v2.create_or_update_secret(
+                path=path,
+                secret=secret,
+                cas=cas,
+                mount_point=mount_point,
+            ),
+        )
+        return response["data"]["version"]
+
+    async def destroy_secret_versions(
+        self,
+        path: str,
+        versions: list[int],
+        mount_point: str,
+    ) -> None:
+        """Permanently delete the data of versions of a KV v2 secret."""
+        await self.executor.run(
+            lambda: self.engine.secrets.kv.v2.destroy_secret_versions(
+                path=path,
+                versions=versions,
+                mount_point=mount_point,
+            ),
+        )
+
+    async def list_mounted_secrets_engines(self) -> dict[str, Any]:
+        """List secrets engines by mount path, e.g. ``"api-keys/"``."""
+        response = await self.executor.run(
+            self.engine.sys.list_mounted_secrets_engines,
+        )
+        return response.get("data", response)
+
+    async def enable_secrets_engine(
+        self,
+        backend_type: str,
+        path: str,
+        options: dict[str, Any] | None = None,
+        description: str | None = None,
+    ) -> None:
+        """Mount a secrets engine."""
+        await self.executor.run(
+            lambda: self.engine.sys.enable_secrets_engine(
+                backend_type=backend_type,
+                path=path,
+                options=options,
+                description=description,
+            ),
+        )
+
+    def executor_stats(self) -> VaultExecutorStats:
+        """Get counters of the threads running Vault calls."""
+        return self.executor.stats()
+
+    async def close(self) -> None:
+        """Close pooled connections and stop the threads."""
+        self.engine.adapter.close()
+        self.executor.close()
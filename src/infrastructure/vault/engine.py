@@ -1,16 +1,53 @@
 """Vault configuration."""
 
+import httpx
 from hvac import Client as VaultEngine
+from requests import Session
+from requests.adapters import HTTPAdapter
 
+from src.infrastructure.vault.client import AsyncVaultClient
+from src.infrastructure.vault.client import HvacVaultClient
+from src.infrastructure.vault.client import IVaultClient
+from src.infrastructure.vault.executor import VaultExecutor
 from src.main.config.settings import VaultSettings
 
 
-def get_vault_engine(vault_settings: VaultSettings) -> VaultEngine:
-    """Get redis engine."""
+def get_vault_engine(vault_settings: VaultSettings) -> IVaultClient:
+    """Get the Vault client selected by ``VAULT_CLIENT``.
+
+    The client is APP-scoped and keeps a pool of up to ``VAULT_POOL_SIZE``
+    connections, which every request borrows from.
+    """
+    # TODO: add TLS
+    if vault_settings.CLIENT == "async":
+        return AsyncVaultClient(
+            url=vault_settings.URL,
+            token=vault_settings.TOKEN,
+            limits=httpx.Limits(
+                max_connections=vault_settings.POOL_SIZE,
+                max_keepalive_connections=vault_settings.POOL_SIZE,
+                keepalive_expiry=vault_settings.POOL_KEEPALIVE,
+            ),
+            timeout=httpx.Timeout(
+                vault_settings.TIMEOUT,
+                connect=vault_settings.CONNECT_TIMEOUT,
+            ),
+        )
+
+    # one session for the engine, its pool is shared by the worker threads
+    session = Session()
+    adapter = HTTPAdapter(pool_maxsize=vault_settings.POOL_SIZE, pool_block=True)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     engine = VaultEngine(
         url=vault_settings.URL,
         token=vault_settings.TOKEN,
-        # TODO: add TLS
+        timeout=(vault_settings.CONNECT_TIMEOUT, vault_settings.TIMEOUT),
+        session=session,
+    )
+    executor = VaultExecutor(
+        max_workers=vault_settings.THREADS,
+        queue_size=vault_settings.QUEUE_SIZE,
+        queue_timeout=vault_settings.QUEUE_TIMEOUT,
     )
-    engine.session = None
-    return engine
+    return HvacVaultClient(engine=engine, executor=executor)
@@ -0,0 +1,107 @@
+"""Thread pool running blocking Vault calls."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import replace
+from typing import TypeVar
+
+from hvac.exceptions import VaultDown
+
+T = TypeVar("T")
+
+
+@dataclass
+class VaultExecutorStats:
+    """Executor counters, wait times are in seconds."""
+
+    max_workers: int = 0
+    active: int = 0
+    queued: int = 0
+    completed: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+
+class VaultExecutor:
+    """Bounded thread pool for blocking Vault calls.
+
+    Calls run on ``max_workers`` threads of their own instead of the thread
+    limiter shared by every sync path of the app, so a slow Vault only holds
+    up Vault calls. Up to ``queue_size`` calls wait on the event loop for a
+    thread. Further calls are rejected at once and calls waiting longer than
+    ``queue_timeout`` seconds give up, both with ``VaultDown``. A thread is
+    counted as busy until its call returns, even if the caller was cancelled.
+    """
+
+    queue_full_message = "Vault executor queue is full"
+    queue_timeout_message = "Timed out waiting for a Vault executor thread"
+
+    def __init__(
+        self,
+        max_workers: int,
+        queue_size: int,
+        queue_timeout: float,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """Initialize executor."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="vault",
+        )
+        self._slots = asyncio.Semaphore(max_workers)
+        self._queue_size = queue_size
+        self._queue_timeout = queue_timeout
+        self._clock = clock
+        self._stats = VaultExecutorStats(max_workers=max_workers)
+
+    async def run(self, func: Callable[[], T]) -> T:
+        """Run a blocking call on a Vault thread."""
+        if self._slots.locked() and self._stats.queued >= self._queue_size:
+            self._stats.rejected += 1
+            raise VaultDown(self.queue_full_message)
+
+        started = self._clock()
+        self._stats.queued += 1
+        try:
+            async with asyncio.timeout(self._queue_timeout):
+                await self._slots.acquire()
+        except TimeoutError:
+            self._stats.timed_out += 1
+            raise VaultDown(self.queue_timeout_message) from None
+        finally:
+            self._stats.queued -= 1
+
+        waited = self._clock() - started
+        self._stats.wait_time_total += waited
+        self._stats.wait_time_max = max(self._stats.wait_time_max, waited)
+        self._stats.active += 1
+
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(func)
+        # the slot is freed when the thread is, not when the caller stops waiting
+        future.add_done_callback(lambda _: self._release_from_thread(loop))
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> VaultExecutorStats:
+        """Get executor counters."""
+        return replace(self._stats)
+
+    def close(self) -> None:
+        """Stop the threads, dropping calls that have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _release_from_thread(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Free the slot of a finished call on the event loop."""
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._release)
+
+    def _release(self) -> None:
+        """Free the slot of a finished call."""
+        self._stats.active -= 1
+        self._stats.completed += 1
+        self._slots.release()
@@ -0,0 +1,175 @@
+"""Dispatcher of the Vault outbox."""
+
+import asyncio
+import logging
+from collections import Counter
+from typing import cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.application.interfaces.services.vault_outbox import IVaultOutboxDispatcher
+from src.application.interfaces.services.vault_outbox import OutboxDispatchResult
+from src.infrastructure.database.repositories.core.vault_outbox import VaultOutboxEntry
+from src.infrastructure.database.repositories.core.vault_outbox import (
+    VaultOutboxRepository,
+)
+from src.infrastructure.vault.cache import IVaultSecretCache
+from src.infrastructure.vault.client import IVaultClient
+from src.infrastructure.vault.session import VaultMountCache
+from src.infrastructure.vault.session import VaultSession
+from src.main.config.settings import AppSettings
+from src.main.config.settings import VaultSettings
+
+logger = logging.getLogger(__name__)
+
+
+class VaultOutboxDispatcher(IVaultOutboxDispatcher):
+    """Writes the keys waiting in the outbox to Vault.
+
+    A batch of due entries is leased in a short transaction, with
+    ``FOR UPDATE SKIP LOCKED``, so the dispatchers of all workers can run at
+    once without taking the same entries, and no connection or lock is held
+    while Vault is written. The keys of one secret path are written with one
+    session, as one request, and paths are written concurrently. Then written
+    entries are deleted and failed ones are retried after a backoff that
+    doubles with every attempt, up to ``OUTBOX_RETRY_MAX_BACKOFF``. Vault
+    errors are retried for as long as they last, a key is never given up
+    because Vault was down. Only entries that cannot be decrypted are
+    dead-lettered, they never succeed. Setting a key is idempotent, so an
+    entry written again after a crash or an expired lease leaves the same
+    secret.
+    """
+
+    undecryptable_message = "The value cannot be decrypted with the secret key"
+    write_failed_message = "Failed to write outbox entries to Vault at %s/%s: %s"
+    dead_lettered_message = "Gave up writing %s outbox entries to Vault at %s/%s: %s"
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        vault_client: IVaultClient,
+        vault_mount_cache: VaultMountCache,
+        vault_secret_cache: IVaultSecretCache,
+        vault_settings: VaultSettings,
+        app_settings: AppSettings,
+    ):
+        """Initialize dispatcher."""
+        self._session_maker = session_maker
+        self._vault_client = vault_client
+        self._mount_cache = vault_mount_cache
+        self._secret_cache = vault_secret_cache
+        self._vault_settings = vault_settings
+        self._app_settings = app_settings
+
+    async def dispatch(self) -> OutboxDispatchResult:
+        """Write one batch of due entries, failed ones are retried later.
+
+        Entries that cannot be decrypted are dead-lettered.
+        """
+        async with self._session_maker() as db_session, db_session.begin():
+            entries = await self._make_repository(db_session).claim(
+                limit=self._vault_settings.OUTBOX_BATCH_SIZE,
+                lease=self._vault_settings.OUTBOX_LEASE,
+            )
+        if not entries:
+            return OutboxDispatchResult(written=0, failed=0)
+
+        # entries encrypted with another key never succeed
+        undecryptable = [entry for entry in entries if entry.value is None]
+        paths: dict[tuple[str, str], list[VaultOutboxEntry]] = {}
+        for entry in entries:
+            if entry.value is not None:
+                paths.setdefault((entry.mount_point, entry.path), []).append(entry)
+
+        limit = asyncio.Semaphore(self._vault_settings.FLUSH_CONCURRENCY)
+        errors = await asyncio.gather(
+            *(self._write_path(path_entries, limit) for path_entries in paths.values()),
+        )
+        written: list[VaultOutboxEntry] = []
+        failures: list[tuple[list[VaultOutboxEntry], str]] = []
+        for path_entries, error in zip(paths.values(), errors, strict=True):
+            if error is None:
+                written.extend(path_entries)
+            else:
+                failures.append((path_entries, error))
+
+        async with self._session_maker() as db_session, db_session.begin():
+            repository = self._make_repository(db_session)
+            await repository.delete([entry.id for entry in written])
+            await repository.dead_letter(
+                [entry.id for entry in undecryptable],
+                error=self.undecryptable_message,
+            )
+            for failed_entries, error in failures:
+                await repository.reschedule(
+                    [entry.id for entry in failed_entries],
+                    error=error,
+                    delay=self._get_backoff(
+                        max(entry.attempts for entry in failed_entries),
+                    ),
+                )
+
+        for (mount_point, path), count in Counter(
+            (entry.mount_point, entry.path) for entry in undecryptable
+        ).items():
+            logger.error(
+                self.dead_lettered_message,
+                count,
+                mount_point,
+                path,
+                self.undecryptable_message,
+            )
+
+        return OutboxDispatchResult(
+            written=len(written),
+            failed=sum(len(failed_entries) for failed_entries, _ in failures),
+            dead_lettered=len(undecryptable),
+        )
+
+    async def _write_path(
+        self,
+        entries: list[VaultOutboxEntry],
+        limit: asyncio.Semaphore,
+    ) -> str | None:
+        """Write the keys of one secret path, get the error if it failed."""
+        mount_point, path = entries[0].mount_point, entries[0].path
+        async with limit:
+            try:
+                async with self._make_vault_session().begin() as vault_session:
+                    for entry in entries:
+                        vault_session.create_or_patch(
+                            path=path,
+                            key=entry.key,
+                            value=cast("str", entry.value),
+                            mount_point=mount_point,
+                        )
+                    await vault_session.commit()
+            except Exception as error:  # noqa: BLE001
+                logger.warning(self.write_failed_message, mount_point, path, error)
+                return str(error) or type(error).__name__
+        return None
+
+    def _make_repository(self, db_session: AsyncSession) -> VaultOutboxRepository:
+        """Make an outbox repository on a database session."""
+        return VaultOutboxRepository(
+            session=db_session,
+            app_settings=self._app_settings,
+        )
+
+    def _make_vault_session(self) -> VaultSession:
+        """Make a Vault session for the writes of one path."""
+        return VaultSession(
+            vault_client=self._vault_client,
+            mount_cache=self._mount_cache,
+            secret_cache=self._secret_cache,
+            flush_concurrency=self._vault_settings.FLUSH_CONCURRENCY,
+            read_cache_ttl=self._vault_settings.READ_CACHE_TTL,
+        )
+
+    def _get_backoff(self, attempts: int) -> float:
+        """Get the delay in seconds before the next attempt."""
+        return min(
+            self._vault_settings.OUTBOX_RETRY_BACKOFF * 2**attempts,
+            self._vault_settings.OUTBOX_RETRY_MAX_BACKOFF,
+        )
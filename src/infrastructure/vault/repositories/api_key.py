@@ -4,6 +4,7 @@ from uuid import UUID
 
 from src.application.interfaces.services.api_key import ICreateAPIKeyVaultRepository
 from src.application.interfaces.services.api_key import IGetAPIKeysVaultRepository
+from src.application.interfaces.services.api_key import IProvisionVaultRepository
 from src.infrastructure.vault.interfaces import VaultRepository
 from src.infrastructure.vault.session import VaultSession
 from src.main.config.settings import VaultSettings
@@ -13,6 +14,7 @@ class ApiKeyVaultRepository(
     VaultRepository,
     IGetAPIKeysVaultRepository,
     ICreateAPIKeyVaultRepository,
+    IProvisionVaultRepository,
 ):
     """Vault service."""
 
@@ -38,11 +40,16 @@ class ApiKeyVaultRepository(
 
         return data
 
-    async def add_api_key(self, user_id: UUID, api_key_id: str, api_key: UUID) -> None:
+    async def add_api_key(self, user_id: UUID, api_key_id: str, api_key: str) -> None:
         """Add api key."""
         self._session.create_or_patch(
             path=str(user_id),
             key=api_key_id,
-            value=str(api_key),
+            value=api_key,
             mount_point=self._mount_point,
         )
+
+    async def provision(self) -> str:
+        """Ensure the API keys mount point exists."""
+        await self._session.ensure_mount_point(mount_point=self._mount_point)
+        return self._mount_point
@@ -0,0 +1,62 @@
+"""Vault outbox of API keys."""
+
+from uuid import UUID
+
+from hvac.exceptions import InvalidPath
+
+from src.application.interfaces.services.api_key import ICreateAPIKeyVaultRepository
+from src.application.interfaces.services.api_key import IGetAPIKeysVaultRepository
+from src.infrastructure.database.repositories.core.vault_outbox import (
+    VaultOutboxRepository,
+)
+from src.infrastructure.vault.repositories.api_key import ApiKeyVaultRepository
+from src.main.config.settings import VaultSettings
+
+
+class ApiKeyVaultOutboxRepository(
+    IGetAPIKeysVaultRepository,
+    ICreateAPIKeyVaultRepository,
+):
+    """API keys added to Vault through the outbox.
+
+    Keys are stored in the database transaction of the request and written
+    to Vault by the outbox dispatcher, so creating a key does not wait on
+    Vault. Keys still waiting in the outbox are listed along with the ones
+    read from Vault, a user whose secret is not written yet has none there.
+    """
+
+    def __init__(
+        self,
+        vault_repository: ApiKeyVaultRepository,
+        outbox_repository: VaultOutboxRepository,
+        vault_settings: VaultSettings,
+    ):
+        """Initialize repository."""
+        self._vault_repository = vault_repository
+        self._outbox_repository = outbox_repository
+        self._mount_point = vault_settings.API_KEYS_MOUNT_POINT
+
+    async def get_user_api_keys(self, user_id: UUID) -> dict[str, str]:
+        """Get user api keys as a dictionary, pending ones included.
+
+        Key is the api key id stored in the database.
+        Value is the real api key value.
+        """
+        try:
+            data = await self._vault_repository.get_user_api_keys(user_id=user_id)
+        except InvalidPath:
+            data = {}
+        pending = await self._outbox_repository.get_pending(
+            mount_point=self._mount_point,
+            path=str(user_id),
+        )
+        return {**data, **pending}
+
+    async def add_api_key(self, user_id: UUID, api_key_id: str, api_key: str) -> None:
+        """Add api key."""
+        await self._outbox_repository.add(
+            mount_point=self._mount_point,
+            path=str(user_id),
+            key=api_key_id,
+            value=api_key,
+        )
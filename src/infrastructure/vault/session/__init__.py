@@ -1,5 +1,6 @@
 """Vault session module."""
 
+from .mount_cache import VaultMountCache
 from .session import VaultSession
 
-__all__ = ["VaultSession"]
+__all__ = ["VaultMountCache", "VaultSession"]
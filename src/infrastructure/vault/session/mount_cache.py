@@ -0,0 +1,31 @@
+"""Mount points known to exist in Vault."""
+
+import time
+from collections.abc import Callable
+
+
+class VaultMountCache:
+    """Mount points known to exist, shared by the sessions of a process.
+
+    A mount point is trusted for ``ttl`` seconds after it was checked, or
+    until an operation on it fails with a path error.
+    """
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        """Initialize the cache."""
+        self._ttl = ttl
+        self._clock = clock
+        self._checked_at: dict[str, float] = {}
+
+    def is_known(self, mount_point: str) -> bool:
+        """Check if a mount point was seen recently."""
+        checked_at = self._checked_at.get(mount_point)
+        return checked_at is not None and self._clock() - checked_at < self._ttl
+
+    def add(self, mount_point: str) -> None:
+        """Remember a mount point as existing."""
+        self._checked_at[mount_point] = self._clock()
+
+    def discard(self, mount_point: str) -> None:
+        """Forget a mount point, so it is checked again."""
+        self._checked_at.pop(mount_point, None)
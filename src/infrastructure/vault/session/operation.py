@@ -12,6 +12,7 @@ class VaultOperation:
         execute: Callable[[], Any],
         rollback: Callable[[], Any] | None = None,
         mount_point: str = "secret",
+        path: str | None = None,
     ):
         """Initialize the operation.
 
@@ -19,10 +20,13 @@ class VaultOperation:
             execute: The operation to execute.
             rollback: The operation to roll back the execute operation.
             mount_point: The Vault mount point to use.
+            path: The secret path the operation changes. Operations on
+            different paths may run concurrently.
         """
         self.execute = execute
         self.rollback = rollback
         self.mount_point = mount_point
+        self.path = path
         self.is_executed = False
         self.is_rolled_back = False
 
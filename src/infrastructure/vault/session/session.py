@@ -1,16 +1,21 @@
 """Vault Session."""
 
+import asyncio
 import logging
+import time
 import types
 from collections.abc import Callable
 from typing import Any
 
-from hvac import Client as VaultEngine
 from hvac.exceptions import InvalidPath
-from litestar.concurrency import sync_to_thread
-from requests import Session
+from hvac.exceptions import InvalidRequest
 
 from src.infrastructure.common.interfaces import IVaultSession
+from src.infrastructure.vault.cache import CachedVaultSecret
+from src.infrastructure.vault.cache import IVaultSecretCache
+from src.infrastructure.vault.client import IVaultClient
+from src.infrastructure.vault.client import VaultSecret
+from src.infrastructure.vault.session.mount_cache import VaultMountCache
 from src.infrastructure.vault.session.operation import VaultOperation
 
 logger = logging.getLogger(__name__)
@@ -26,11 +31,33 @@ class VaultSession(IVaultSession):
     creating_kv_engine_message = "Creating KV engine at mount point %s"
     patching_kv_data_message = "Patch KV data at path %s"
     creating_kv_data_message = "Creating KV pair at path %s"
+    rechecking_mount_message = "Path error at mount point %s, checking the mount"
+    cas_conflict_message = "Secret at path %s changed before the write, reading it"
+    rollback_conflict_message = "Secret at path %s changed after the write, kept"
+    # writes of a secret changed by others are retried with its new version
+    cas_attempts = 3
+    # error Vault answers a write with when the cas version is not current
+    cas_mismatch_error = "check-and-set parameter did not match the current version"
 
-    def __init__(self, vault_engine: VaultEngine):
+    def __init__(
+        self,
+        vault_client: IVaultClient,
+        mount_cache: VaultMountCache,
+        secret_cache: IVaultSecretCache,
+        flush_concurrency: int = 8,
+        read_cache_ttl: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
         """Initialize the Vault session."""
-        self.vault_engine = vault_engine
+        self.vault_client = vault_client
+        self.mount_cache = mount_cache
+        self.secret_cache = secret_cache
+        self.flush_concurrency = flush_concurrency
+        self.read_cache_ttl = read_cache_ttl
+        self.clock = clock
         self._operations: list[VaultOperation] = []
+        # pending patches and the keys they write, by mount point and path
+        self._patches: dict[tuple[str, str], tuple[VaultOperation, dict[str, str]]] = {}
         self._committed = False
 
     async def __aenter__(self) -> "VaultSession":
@@ -56,6 +83,7 @@ class VaultSession(IVaultSession):
     def _clear(self) -> None:
         """Clear all operations."""
         self._operations.clear()
+        self._patches.clear()
         self._committed = False
 
     async def close(self) -> None:
@@ -69,9 +97,12 @@ class VaultSession(IVaultSession):
         mount_point,
         execute: Callable[[], Any],
         rollback: Callable[[], Any] | None = None,
-    ) -> None:
+        path: str | None = None,
+    ) -> VaultOperation:
         """Add an operation and its rollback to the unit of work."""
-        self._operations.append(VaultOperation(execute, rollback, mount_point))
+        operation = VaultOperation(execute, rollback, mount_point, path)
+        self._operations.append(operation)
+        return operation
 
     async def commit(self) -> None:
         """Commit all operations."""
@@ -95,29 +126,89 @@ class VaultSession(IVaultSession):
                 logger.warning(self.rollback_failed_message, error)
 
     async def flush(self) -> None:
-        """Execute all operations without committing."""
+        """Execute all operations without committing.
+
+        Mount points are checked only when not cached. Operations on
+        different paths run concurrently, up to ``flush_concurrency`` at a
+        time, and those on the same path run in the order they were added.
+        After a failure no more operations are started, the ones in flight
+        finish so that a rollback sees everything that ran, and the first
+        error is raised.
+        """
         mount_points = {operation.mount_point for operation in self._operations}
         for mount_point in mount_points:
-            await self._check_mount_path(mount_point=mount_point)
+            await self.ensure_mount_point(mount_point=mount_point)
+
+        paths: dict[tuple[str, str | None], list[VaultOperation]] = {}
         for operation in self._operations:
+            paths.setdefault((operation.mount_point, operation.path), []).append(
+                operation,
+            )
+
+        limit = asyncio.Semaphore(self.flush_concurrency)
+        mount_lock = asyncio.Lock()
+        failed = asyncio.Event()
+
+        async def run_path(operations: list[VaultOperation]) -> None:
+            for operation in operations:
+                async with limit:
+                    if failed.is_set():
+                        return
+                    try:
+                        await self._run_operation(operation, mount_lock)
+                    except Exception:
+                        failed.set()
+                        raise
+
+        results = await asyncio.gather(
+            *(run_path(operations) for operations in paths.values()),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _run_operation(
+        self,
+        operation: VaultOperation,
+        mount_lock: asyncio.Lock,
+    ) -> None:
+        """Run an operation, checking its mount point again on a path error."""
+        try:
             await operation.run()
+        except InvalidPath:
+            logger.info(self.rechecking_mount_message, operation.mount_point)
+            # checks are serialized, so a mount is never created twice
+            async with mount_lock:
+                self.mount_cache.discard(operation.mount_point)
+                await self.ensure_mount_point(mount_point=operation.mount_point)
+            await operation.run()
+
+    async def ensure_mount_point(self, mount_point: str) -> None:
+        """Ensure the KV engine exists, unless it is known to exist."""
+        if self.mount_cache.is_known(mount_point):
+            return
+        await self._check_mount_path(mount_point=mount_point)
+        self.mount_cache.add(mount_point)
 
     async def _check_mount_path(self, mount_point: str = "secret") -> None:
         """Ensure the KV engine with the specified mount point exists."""
         # Check if the KV engine with the specified mount point exists
-        mounts = await sync_to_thread(
-            self.vault_engine.sys.list_mounted_secrets_engines,
-        )
+        mounts = await self.vault_client.list_mounted_secrets_engines()
         if f"{mount_point.replace('/', '')}/" not in mounts:
             logger.info(self.creating_kv_engine_message, mount_point)
-            await sync_to_thread(
-                lambda: self.vault_engine.sys.enable_secrets_engine(
+            try:
+                await self.vault_client.enable_secrets_engine(
                     backend_type="kv",
                     path=mount_point,
                     options={"version": "2"},
                     description=f"KV engine for {mount_point}",
-                ),
-            )
+                )
+            except InvalidRequest:
+                # another session may have created it since it was listed
+                mounts = await self.vault_client.list_mounted_secrets_engines()
+                if f"{mount_point.replace('/', '')}/" not in mounts:
+                    raise
 
     def create_or_patch(
         self,
@@ -126,63 +217,187 @@ class VaultSession(IVaultSession):
         value: str,
         mount_point: str,
     ) -> None:
-        """Add an operation to create or update a key in the Vault."""
+        """Add an operation to create or update a key in the Vault.
+
+        Keys added for a path whose operation has not run yet are merged into
+        it, so they are written with one request as one secret version.
+        """
+        pending = self._patches.get((mount_point, path))
+        if pending is not None and not pending[0].is_executed:
+            pending[1][key] = value
+            return
+
+        secret: dict[str, str] = {key: value}
+        # the secret before the write and the version written, set on execute
+        previous: VaultSecret | None = None
+        written_version: int | None = None
 
         async def execute():
             """Execute the operation."""
+            nonlocal previous, written_version
             try:
-                # Try to patch the secret
-                logger.info(self.patching_kv_data_message, path)
-                await sync_to_thread(
-                    lambda: self.vault_engine.secrets.kv.v2.patch(
-                        path=path,
-                        secret={key: value},
-                        mount_point=mount_point,
-                    ),
-                )
-            except InvalidPath:
-                logger.info(self.creating_kv_data_message, path)
-                # If the secret does not exist, create it
-                await sync_to_thread(
-                    lambda: self.vault_engine.secrets.kv.v2.create_or_update_secret(
-                        path=path,
-                        secret={key: value},
-                        mount_point=mount_point,
-                    ),
+                previous, written_version = await self._write_keys(
+                    path=path,
+                    secret=secret,
+                    mount_point=mount_point,
                 )
+            except BaseException:
+                # a failed write may still have been applied
+                await self.secret_cache.invalidate(mount_point, path)
+                raise
 
         async def rollback():
             """Rollback the operation."""
+            if written_version is not None:
+                await self._restore(
+                    path=path,
+                    mount_point=mount_point,
+                    previous=previous,
+                    version=written_version,
+                )
+
+        operation = self.add_operation(mount_point, execute, rollback, path=path)
+        self._patches[(mount_point, path)] = (operation, secret)
+
+    async def _write_keys(
+        self,
+        path: str,
+        secret: dict[str, str],
+        mount_point: str,
+    ) -> tuple[VaultSecret | None, int]:
+        """Merge keys into a secret with a check-and-set write.
+
+        The secret before the write is taken from the read cache, else read
+        from Vault, and read again when the write finds that it changed.
+        Returns it, None if it did not exist, and the written version.
+        """
+        cached = await self.secret_cache.get(mount_point, path)
+        previous = (
+            VaultSecret(data=cached.data, version=cached.version)
+            if cached is not None
+            else await self._read_current(path=path, mount_point=mount_point)
+        )
+        attempt = 1
+        while True:
+            if previous is None:
+                logger.info(self.creating_kv_data_message, path)
+                data = dict(secret)
+                # after a conflict the latest version may exist but be deleted
+                cas = 0 if attempt == 1 else None
+            else:
+                logger.info(self.patching_kv_data_message, path)
+                data = {**previous.data, **secret}
+                cas = previous.version
             try:
-                response = await sync_to_thread(
-                    self.vault_engine.secrets.kv.v2.read_secret,
+                version = await self.vault_client.create_or_update_secret(
                     path=path,
+                    secret=data,
                     mount_point=mount_point,
+                    cas=cas,
                 )
-                current_data = response["data"]["data"]
-            except InvalidPath:
-                return
-            if key in current_data:
-                del current_data[key]
-                await sync_to_thread(
-                    lambda: self.vault_engine.secrets.kv.v2.create_or_update_secret(
-                        path=path,
-                        secret=current_data,
-                        mount_point=mount_point,
-                    ),
+            except InvalidRequest as error:
+                if not self._is_cas_mismatch(error) or attempt >= self.cas_attempts:
+                    raise
+                attempt += 1
+                logger.info(self.cas_conflict_message, path)
+                previous = await self._read_current(path=path, mount_point=mount_point)
+                continue
+
+            await self.secret_cache.set(
+                mount_point,
+                path,
+                CachedVaultSecret(data, version, self.clock()),
+            )
+            return previous, version
+
+    async def _restore(
+        self,
+        path: str,
+        mount_point: str,
+        previous: VaultSecret | None,
+        version: int,
+    ) -> None:
+        """Undo the write of a version with one request.
+
+        The previous data is written back only if the written version is
+        still the current one. A created secret has its written version
+        destroyed, which leaves later versions of other writers intact.
+        """
+        try:
+            if previous is None:
+                await self.vault_client.destroy_secret_versions(
+                    path=path,
+                    versions=[version],
+                    mount_point=mount_point,
                 )
+            else:
+                await self.vault_client.create_or_update_secret(
+                    path=path,
+                    secret=previous.data,
+                    mount_point=mount_point,
+                    cas=version,
+                )
+        except InvalidRequest as error:
+            if not self._is_cas_mismatch(error):
+                raise
+            logger.warning(self.rollback_conflict_message, path)
+        finally:
+            await self.secret_cache.invalidate(mount_point, path)
 
-        self.add_operation(mount_point, execute, rollback)
+    @classmethod
+    def _is_cas_mismatch(cls, error: InvalidRequest) -> bool:
+        """Check if a write was refused because the secret changed."""
+        return cls.cas_mismatch_error in str(error)
 
-    async def read_secret(self, path: str, mount_point: str = "") -> dict:
-        """Add an operation to read a secret from the Vault."""
-        response = await sync_to_thread(
-            lambda: self.vault_engine.secrets.kv.v2.read_secret(
+    async def _read_current(self, path: str, mount_point: str) -> VaultSecret | None:
+        """Read the latest version of a secret, None if it does not exist."""
+        try:
+            return await self.vault_client.read_secret(
                 path=path,
                 mount_point=mount_point,
-            ),
+            )
+        except InvalidPath:
+            return None
+
+    async def read_secret(self, path: str, mount_point: str = "") -> dict:
+        """Read a secret from the Vault through the read cache.
+
+        A cached secret is returned as is for ``read_cache_ttl`` seconds
+        after it was checked. After that its version is compared with the
+        current version in the secret metadata, and the secret is read again
+        only if it changed. Writes of any session invalidate the path.
+        """
+        cached = await self.secret_cache.get(mount_point, path)
+        now = self.clock()
+        if cached is not None:
+            if now - cached.checked_at < self.read_cache_ttl:
+                return dict(cached.data)
+            try:
+                version = await self.vault_client.read_secret_version(
+                    path=path,
+                    mount_point=mount_point,
+                )
+            except InvalidPath:
+                await self.secret_cache.invalidate(mount_point, path)
+                raise
+            if version == cached.version:
+                await self.secret_cache.set(
+                    mount_point,
+                    path,
+                    CachedVaultSecret(cached.data, cached.version, now),
+                )
+                return dict(cached.data)
+
+        secret = await self.vault_client.read_secret(
+            path=path,
+            mount_point=mount_point,
+        )
+        await self.secret_cache.set(
+            mount_point,
+            path,
+            CachedVaultSecret(secret.data, secret.version, now),
         )
-        return response["data"]["data"]
+        return dict(secret.data)
 
 
 class VaultSessionContextManager:
@@ -197,7 +412,6 @@ class VaultSessionContextManager:
     async def __aenter__(self) -> VaultSession:
         """Enter the context manager."""
         await self.vault_session.__aenter__()
-        self.vault_session.vault_engine.session = Session()
         return self.vault_session
 
     async def __aexit__(
@@ -209,4 +423,3 @@ class VaultSessionContextManager:
         """Exit the context manager."""
         await self.vault_session.__aexit__(exc_type, exc_value, traceback)
         await self.vault_session.close()
-        self.vault_session.vault_engine.session.close()
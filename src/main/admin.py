@@ -33,10 +33,11 @@ from src.presentation.routing import admin_router
 
 if TYPE_CHECKING:
     from dishka import AsyncContainer
-    from hvac import Client as VaultEngine
     from redis.asyncio import Redis
     from sqlalchemy.ext.asyncio import AsyncEngine
 
+    from src.infrastructure.vault.client import IVaultClient
+
 
 def create_app() -> Litestar:
     """Create application."""
@@ -50,7 +51,7 @@ def create_app() -> Litestar:
     redis_engine: Redis = get_redis_engine(redis_settings=settings.redis)
 
     # create vault engine
-    vault_engine: VaultEngine = get_vault_engine(vault_settings=settings.vault)
+    vault_engine: IVaultClient = get_vault_engine(vault_settings=settings.vault)
 
     # create dependency container
     container: AsyncContainer = get_async_container(
@@ -106,6 +107,9 @@ def create_app() -> Litestar:
             RepositoryError: repository_alchemy_exception_handler,
         },
         compression_config=get_compression_config(),
+        on_shutdown=[
+            vault_engine.close,
+        ],
     )
 
     # install dishka
@@ -34,15 +34,20 @@ from src.main.exception_handlers.repository_vault import (
     repository_vault_exception_handler,
 )
 from src.main.exception_handlers.server import server_exception_handler
+from src.main.lifespan import build_api_key_filter
+from src.main.lifespan import dispatch_vault_outbox
+from src.main.lifespan import provision_vault
+from src.main.lifespan import refresh_access_token_deny_list
 from src.presentation.routing import auth_router
 from src.presentation.routing import health_router
 
 if TYPE_CHECKING:
     from dishka import AsyncContainer
-    from hvac import Client as VaultEngine
     from redis.asyncio import Redis as RedisEngine
     from sqlalchemy.ext.asyncio import AsyncEngine
 
+    from src.infrastructure.vault.client import IVaultClient
+
 
 def create_app() -> Litestar:
     """Create application."""
@@ -56,7 +61,7 @@ def create_app() -> Litestar:
     redis_engine: RedisEngine = get_redis_engine(redis_settings=settings.redis)
 
     # create vault engine
-    vault_engine: VaultEngine = get_vault_engine(vault_settings=settings.vault)
+    vault_engine: IVaultClient = get_vault_engine(vault_settings=settings.vault)
 
     # initialize cache
     cache.setup(
@@ -111,6 +116,17 @@ def create_app() -> Litestar:
         on_app_init=[
             api_key_auth.on_app_init,
         ],
+        on_startup=[
+            build_api_key_filter,
+            provision_vault,
+        ],
+        lifespan=[
+            refresh_access_token_deny_list,
+            dispatch_vault_outbox,
+        ],
+        on_shutdown=[
+            vault_engine.close,
+        ],
         openapi_config=OpenAPIConfig(
             title="Litestar API",
             version="0.1.0",
@@ -2,12 +2,12 @@
 
 from dishka import AsyncContainer
 from dishka import make_async_container
-from hvac import Client as VaultEngine
 from redis.asyncio import Redis as RedisEngine
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.application.ioc import ApplicationProvider
 from src.infrastructure.ioc import InfrastructureProvider
+from src.infrastructure.vault.client import IVaultClient
 from src.main.config.settings import Settings
 
 
@@ -15,7 +15,7 @@ def get_async_container(
     settings: Settings,
     alchemy_engine: AsyncEngine,
     redis_engine: RedisEngine,
-    vault_engine: VaultEngine,
+    vault_engine: IVaultClient,
 ) -> AsyncContainer:
     """Get dependency container."""
     return make_async_container(
@@ -25,6 +25,6 @@ def get_async_container(
             Settings: settings,
             AsyncEngine: alchemy_engine,
             RedisEngine: redis_engine,
-            VaultEngine: vault_engine,
+            IVaultClient: vault_engine,
         },
     )
@@ -3,6 +3,8 @@
 import binascii
 import os
 from pathlib import Path
+from typing import Literal
+from uuid import UUID
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -153,6 +155,10 @@ class AppSettings(LiteStarSettings):
     )
     """API key hash digest size."""
     API_KEY_DIGEST_SIZE: int = 16
+    """Prefix of issued API keys, without underscores. Names the key format."""
+    API_KEY_PREFIX: str = "ergo1"
+    """Prefixes of keys issued before API_KEY_PREFIX changed, still accepted."""
+    API_KEY_PREVIOUS_PREFIXES: list[str] = []
     """Allowed CORS Origins"""
     ALLOWED_CORS_ORIGINS: list[str] | str = ["*"]
     """CSRF Cookie Name"""
@@ -170,6 +176,59 @@ class AppSettings(LiteStarSettings):
         return f"{BASE_DIR}/src/infrastructure/disk/fixtures"
 
 
+class AuthSettings(LiteStarSettings):
+    """Authentication settings."""
+
+    """Model configuration."""
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="AUTH_",
+        extra="ignore",
+        env_file_encoding="utf-8",
+    )
+
+    """Enable the in-process cache of authenticated API keys."""
+    CACHE_ENABLED: bool = True
+    """Max number of API keys kept in the authentication cache."""
+    CACHE_MAX_SIZE: int = 10_000
+    """Time in seconds an authenticated API key is kept in the cache."""
+    CACHE_TTL: int = 60
+    """Cache per worker process ("memory") or shared by a host's workers ("shared")."""
+    CACHE_BACKEND: Literal["memory", "shared"] = "memory"
+    """Path prefix of the shared cache file, preferably on a tmpfs."""
+    CACHE_SHARED_PATH: str = "/dev/shm/ergostar-auth-cache"  # noqa: S108
+    """Reject unknown API keys with a Bloom filter before querying the database."""
+    KEY_FILTER_ENABLED: bool = True
+    """Expected number of API keys in the filter."""
+    KEY_FILTER_CAPACITY: int = 1_000_000
+    """False positive rate of the filter at its capacity."""
+    KEY_FILTER_FALSE_POSITIVE_RATE: float = 0.001
+    """Look up principals in the Redis index before querying the database."""
+    INDEX_ENABLED: bool = True
+    """Number of API keys written to Redis per pipeline when rebuilding the index."""
+    INDEX_CHUNK_SIZE: int = 1_000
+    """Lifetime in seconds of access tokens exchanged for API keys."""
+    ACCESS_TOKEN_TTL: int = 300
+    """Interval in seconds between reloads of the access token deny-list."""
+    ACCESS_TOKEN_DENY_LIST_REFRESH_INTERVAL: float = 5.0
+    """Max number of API keys introspected in one request."""
+    INTROSPECT_MAX_KEYS: int = 1_000
+    """Time in seconds gateways may cache API key introspection results."""
+    INTROSPECT_MAX_AGE: int = 30
+    """Max number of introspected API keys looked up at once."""
+    INTROSPECT_CONCURRENCY: int = 32
+    """Users allowed to introspect API keys of any user, the gateways."""
+    INTROSPECT_GATEWAY_USER_IDS: list[UUID] = []
+    """Resolve concurrent API key lookups together in one database query."""
+    BATCH_ENABLED: bool = False
+    """Time in seconds to collect API key lookups into a batch."""
+    BATCH_WINDOW: float = 0.002
+    """Max number of API key lookups in a batch."""
+    BATCH_MAX_SIZE: int = 100
+    """Report authentication stage timings in Server-Timing and response logs."""
+    TIMING_ENABLED: bool = False
+
+
 class VaultSettings(LiteStarSettings):
     """Secret vault settings."""
 
@@ -187,12 +246,59 @@ class VaultSettings(LiteStarSettings):
     TOKEN: str
     """Api Keys mount point path."""
     API_KEYS_MOUNT_POINT: str = "api-keys"
+    """Client: "hvac" in worker threads, or "async" with httpx on the event loop."""
+    CLIENT: Literal["hvac", "async"] = "hvac"
+    """Time in seconds a mount point is trusted to exist after it was checked."""
+    MOUNT_CACHE_TTL: float = 300.0
+    """Create the mount points at startup, so requests do not check them."""
+    PROVISION_ON_STARTUP: bool = True
+    """Max number of Vault operations on different paths run at once on flush."""
+    FLUSH_CONCURRENCY: int = 8
+    """Max number of pooled connections to Vault, shared by all requests."""
+    POOL_SIZE: int = 10
+    """Time in seconds an idle connection is kept alive (async client only)."""
+    POOL_KEEPALIVE: float = 30.0
+    """Time in seconds to wait for a connection to Vault."""
+    CONNECT_TIMEOUT: float = 5.0
+    """Time in seconds to wait for a response from Vault."""
+    TIMEOUT: float = 30.0
+    """Number of threads running Vault calls (hvac client only)."""
+    THREADS: int = 10
+    """Max number of Vault calls waiting for a thread, more are rejected."""
+    QUEUE_SIZE: int = 100
+    """Time in seconds a Vault call waits for a thread before it fails."""
+    QUEUE_TIMEOUT: float = 5.0
+    """Write API keys to Vault through the database outbox, not in the request."""
+    OUTBOX_ENABLED: bool = False
+    """Run the outbox dispatcher in the application processes."""
+    OUTBOX_DISPATCHER_ENABLED: bool = True
+    """Time in seconds between checks of the outbox for due entries."""
+    OUTBOX_DISPATCH_INTERVAL: float = 1.0
+    """Max number of outbox entries claimed and written at once."""
+    OUTBOX_BATCH_SIZE: int = 100
+    """Time in seconds before the first retry of a failed outbox entry."""
+    OUTBOX_RETRY_BACKOFF: float = 1.0
+    """Max time in seconds between retries of a failed outbox entry."""
+    OUTBOX_RETRY_MAX_BACKOFF: float = 300.0
+    """Time in seconds claimed outbox entries are hidden from other dispatchers."""
+    OUTBOX_LEASE: float = 120.0
+    """Cache secrets read from Vault."""
+    READ_CACHE_ENABLED: bool = True
+    """Read cache: "memory" per process, or "redis" encrypted and shared."""
+    READ_CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    """Time in seconds a cached secret is used before its version is checked."""
+    READ_CACHE_TTL: float = 30.0
+    """Max number of secrets in the in-process read cache."""
+    READ_CACHE_MAX_SIZE: int = 10_000
+    """Time in seconds a secret is kept in the Redis read cache."""
+    READ_CACHE_MAX_AGE: float = 3600.0
 
 
 class Settings(LiteStarSettings):
     """Settings for the project."""
 
     app: AppSettings = Field(default_factory=AppSettings)
+    auth: AuthSettings = Field(default_factory=AuthSettings)
     vault: VaultSettings = Field(default_factory=VaultSettings)
     db: DatabaseSettings = Field(default_factory=DatabaseSettings)
     log: LogSettings = Field(default_factory=LogSettings)
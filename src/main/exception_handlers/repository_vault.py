@@ -65,12 +65,12 @@ def repository_vault_exception_handler(
             http_exc = _HTTPConflictException
         case RateLimitExceeded():
             http_exc = TooManyRequestsException
-        case VaultError() | InternalServerError() | UnexpectedError():
-            http_exc = InternalServerException
         case BadGateway():
             http_exc = _HTTPBadGatewayException
         case VaultDown() | VaultNotInitialized() | UnsupportedOperation():
             http_exc = ServiceUnavailableException
+        case VaultError() | InternalServerError() | UnexpectedError():
+            http_exc = InternalServerException
         case _:
             http_exc = InternalServerException
 
@@ -0,0 +1,125 @@
+"""Application startup and shutdown hooks."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextlib import suppress
+
+from dishka import Scope
+from hvac.exceptions import VaultError
+from litestar import Litestar
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.application.interactors.auth.dispatch_vault_outbox import (
+    DispatchVaultOutboxInteractor,
+)
+from src.application.interactors.auth.provision_vault import ProvisionVaultInteractor
+from src.application.interactors.auth.rebuild_api_key_filter import (
+    RebuildApiKeyFilterInteractor,
+)
+from src.application.interactors.auth.rebuild_api_key_filter import (
+    RebuildApiKeyFilterRequestModel,
+)
+from src.application.interfaces.repositories.access_token_deny_list import (
+    IAccessTokenDenyListRepository,
+)
+from src.main.config.settings import AuthSettings
+from src.main.config.settings import VaultSettings
+
+logger = logging.getLogger(__name__)
+
+
+async def build_api_key_filter(app: Litestar) -> None:
+    """Build the API key filter, unless it is already built.
+
+    Lookups fail open while the filter is missing,
+    so a failure here does not stop the application.
+    """
+    async with app.state.dishka_container(scope=Scope.REQUEST) as container:
+        rebuild_api_key_filter = await container.get(RebuildApiKeyFilterInteractor)
+        try:
+            await rebuild_api_key_filter(
+                request_model=RebuildApiKeyFilterRequestModel(only_if_missing=True),
+            )
+        except (RedisError, SQLAlchemyError, OSError):
+            logger.exception("Failed to build the API key filter")
+
+
+async def provision_vault(app: Litestar) -> None:
+    """Create the Vault mount points and cache them as existing.
+
+    Sessions check uncached mount points themselves,
+    so a failure here does not stop the application.
+    """
+    async with app.state.dishka_container(scope=Scope.REQUEST) as container:
+        vault_settings = await container.get(VaultSettings)
+        if not vault_settings.PROVISION_ON_STARTUP:
+            return
+        provision_vault_interactor = await container.get(ProvisionVaultInteractor)
+        try:
+            await provision_vault_interactor()
+        except (VaultError, OSError):
+            logger.exception("Failed to provision Vault")
+
+
+@asynccontextmanager
+async def refresh_access_token_deny_list(app: Litestar) -> AsyncIterator[None]:
+    """Reload the access token deny-list in the background while the app runs.
+
+    Access tokens are verified without any I/O, so revocations made by other
+    processes are picked up here, within the refresh interval.
+    """
+    container = app.state.dishka_container
+    deny_list = await container.get(IAccessTokenDenyListRepository)
+    auth_settings = await container.get(AuthSettings)
+
+    async def _refresh_periodically() -> None:
+        while True:
+            try:
+                await deny_list.refresh()
+            except RedisError:
+                logger.exception("Failed to refresh the access token deny-list")
+            await asyncio.sleep(auth_settings.ACCESS_TOKEN_DENY_LIST_REFRESH_INTERVAL)
+
+    task = asyncio.create_task(_refresh_periodically())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+@asynccontextmanager
+async def dispatch_vault_outbox(app: Litestar) -> AsyncIterator[None]:
+    """Write the API keys waiting in the outbox to Vault while the app runs.
+
+    Entries are leased while they are written, so every worker may run
+    a dispatcher. Any error is logged and the next round runs as usual.
+    """
+    container = app.state.dishka_container
+    vault_settings = await container.get(VaultSettings)
+    if not vault_settings.OUTBOX_DISPATCHER_ENABLED:
+        yield
+        return
+    dispatch_vault_outbox_interactor = await container.get(
+        DispatchVaultOutboxInteractor,
+    )
+
+    async def _dispatch_periodically() -> None:
+        while True:
+            try:
+                await dispatch_vault_outbox_interactor()
+            except Exception:
+                logger.exception("Failed to dispatch the Vault outbox")
+            await asyncio.sleep(vault_settings.OUTBOX_DISPATCH_INTERVAL)
+
+    task = asyncio.create_task(_dispatch_periodically())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
@@ -1,5 +1,6 @@
 """Auth Controller."""
 
+from typing import Annotated
 from typing import Any
 from uuid import UUID
 
@@ -8,7 +9,11 @@ from dishka import FromDishka
 from dishka.integrations.litestar import inject
 from litestar import Controller
 from litestar import Request
+from litestar import Response
 from litestar import post
+from litestar.datastructures import CacheControlHeader
+from litestar.params import Parameter
+from litestar.status_codes import HTTP_200_OK
 
 from src.application.interactors.auth.create_api_key import CreateApiKeyInteractor
 from src.application.interactors.auth.create_api_key import CreateApiKeyRequestModel
@@ -16,8 +21,29 @@ from src.application.interactors.auth.get_user_api_keys import GetUserApiKeysInt
 from src.application.interactors.auth.get_user_api_keys import (
     GetUserApiKeysRequestModel,
 )
-from src.domain.entities.users.user import User
+from src.application.interactors.auth.introspect_api_keys import (
+    IntrospectApiKeysInteractor,
+)
+from src.application.interactors.auth.introspect_api_keys import (
+    IntrospectApiKeysRequestModel,
+)
+from src.application.interactors.auth.issue_access_token import (
+    IssueAccessTokenInteractor,
+)
+from src.application.interactors.auth.issue_access_token import (
+    IssueAccessTokenRequestModel,
+)
+from src.application.interactors.auth.revoke_access_tokens import (
+    RevokeAccessTokensInteractor,
+)
+from src.application.interactors.auth.revoke_access_tokens import (
+    RevokeAccessTokensRequestModel,
+)
+from src.domain.entities.auth.principal import Principal
+from src.presentation.dtos.api_keys import AccessTokenDTO
 from src.presentation.dtos.api_keys import GetUserApiKeysDTO
+from src.presentation.dtos.api_keys import IntrospectApiKeysDTO
+from src.presentation.dtos.api_keys import IntrospectApiKeysResultDTO
 
 
 class AuthController(Controller):
@@ -33,7 +59,7 @@ class AuthController(Controller):
     async def create_api_key(
         self,
         interactor: FromDishka[CreateApiKeyInteractor],
-    ) -> UUID:
+    ) -> str:
         """Create an api key.
 
         Excluded from auth.
@@ -51,13 +77,75 @@ class AuthController(Controller):
     @inject
     async def check_auth(
         self,
-        request: Request[User, str, Any],
+        request: Request[Principal, str, Any],
         interactor: FromDishka[GetUserApiKeysInteractor],
     ) -> GetUserApiKeysDTO:
         """Test auth."""
         response_model = await interactor(
             GetUserApiKeysRequestModel(
-                user_id=UUID(str(request.user.id)),
+                user_id=request.user.user_id,
             ),
         )
         return GetUserApiKeysDTO.model_validate(response_model)
+
+    @post("/token", opt={"exclude_from_auth": True}, security=[{"ApiKeyAuth": []}])
+    @inject
+    async def issue_access_token(
+        self,
+        api_key: Annotated[str, Parameter(header="X-Api-Key")],
+        interactor: FromDishka[IssueAccessTokenInteractor],
+    ) -> AccessTokenDTO:
+        """Exchange an API key for a short-lived access token.
+
+        Send the token as ``Authorization: Bearer <token>``, it is verified
+        without any lookup. Only an API key is accepted here, so a token
+        cannot be used to extend itself.
+        """
+        response_model = await interactor(
+            IssueAccessTokenRequestModel(api_key=api_key),
+        )
+        return AccessTokenDTO.model_validate(response_model)
+
+    @post("/revoke-tokens")
+    @inject
+    async def revoke_access_tokens(
+        self,
+        request: Request[Principal, str, Any],
+        interactor: FromDishka[RevokeAccessTokensInteractor],
+    ) -> None:
+        """Revoke all access tokens issued so far for the caller's API key."""
+        await interactor(
+            RevokeAccessTokensRequestModel(api_key_id=request.user.api_key_id),
+        )
+
+    @post("/introspect")
+    @inject
+    async def introspect_api_keys(
+        self,
+        request: Request[Principal, str, Any],
+        data: IntrospectApiKeysDTO,
+        interactor: FromDishka[IntrospectApiKeysInteractor],
+    ) -> Response[IntrospectApiKeysResultDTO]:
+        """Check many API keys at once.
+
+        For gateways validating the keys of their clients, only the users
+        listed in ``AUTH_INTROSPECT_GATEWAY_USER_IDS`` may call it. Results
+        follow the order of the request and may be cached for the
+        ``Cache-Control`` max-age.
+        """
+        response_model = await interactor(
+            IntrospectApiKeysRequestModel(
+                user_id=request.user.user_id,
+                api_keys=data.api_keys,
+            ),
+        )
+        return Response(
+            IntrospectApiKeysResultDTO.model_validate(response_model),
+            status_code=HTTP_200_OK,
+            headers={
+                "Cache-Control": CacheControlHeader(
+                    private=True,
+                    max_age=response_model.max_age,
+                ).to_header(),
+            },
+        )
@@ -1,9 +1,15 @@
 """Core Controller Module."""
 
+from dataclasses import asdict
+
+from dishka import FromDishka
+from dishka.integrations.litestar import inject
 from litestar import Controller
 from litestar import MediaType
 from litestar import get
 
+from src.infrastructure.vault.client import IVaultClient
+
 
 class HealthController(Controller):
     """Core Controller."""
@@ -17,3 +23,16 @@ class HealthController(Controller):
         return {
             "status": "ok",
         }
+
+    @get(path="/health/vault", media_type=MediaType.JSON)
+    @inject
+    async def vault_health_check(
+        self,
+        vault_client: FromDishka[IVaultClient],
+    ) -> dict:
+        """Vault client health, with the load of its threads if it has any."""
+        stats = vault_client.executor_stats()
+        return {
+            "status": "ok",
+            "executor": None if stats is None else asdict(stats),
+        }
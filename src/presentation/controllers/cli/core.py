@@ -6,9 +6,23 @@ import click
 from dishka import Scope
 from litestar import Litestar
 
+from src.application.interactors.auth.dispatch_vault_outbox import (
+    DispatchVaultOutboxInteractor,
+)
+from src.application.interactors.auth.provision_vault import ProvisionVaultInteractor
+from src.application.interactors.auth.rebuild_api_key_filter import (
+    RebuildApiKeyFilterInteractor,
+)
+from src.application.interactors.auth.rebuild_api_key_filter import (
+    RebuildApiKeyFilterRequestModel,
+)
+from src.application.interactors.auth.rebuild_auth_index import (
+    RebuildAuthIndexInteractor,
+)
 from src.application.interactors.database.drop_database import DropDatabaseInteractor
 from src.application.interactors.database.seed_database import SeedDatabaseInteractor
 from src.application.interactors.database.seed_database import SeedDatabaseRequestModel
+from src.application.interfaces.services.vault_outbox import OutboxDispatchResult
 from src.domain.enums.database import DatabaseSeedingGroups
 
 
@@ -75,5 +89,103 @@ def seed_db(app: Litestar) -> None:
     console.rule("Stopping seed data creation")
 
 
+@click.command(
+    help="Rebuild the filter of issued API keys from the database.",
+)
+@click.pass_obj
+def rebuild_api_key_filter(app: Litestar) -> None:
+    """Rebuild the filter of issued API keys."""
+    from rich import get_console
+
+    # get the console
+    console = get_console()
+
+    async def _rebuild_api_key_filter() -> int:
+        """Rebuild the API key filter."""
+        async with app.state.dishka_container(scope=Scope.REQUEST) as container:
+            rebuild_api_key_filter = await container.get(RebuildApiKeyFilterInteractor)
+            return await rebuild_api_key_filter(
+                request_model=RebuildApiKeyFilterRequestModel(),
+            )
+
+    console.rule("Starting to rebuild the API key filter")
+    count = asyncio.run(_rebuild_api_key_filter())
+    console.rule(f"API key filter rebuilt with {count} keys")
+
+
+@click.command(
+    help="Rebuild the Redis index of principals by API key from the database.",
+)
+@click.pass_obj
+def rebuild_auth_index(app: Litestar) -> None:
+    """Rebuild the authentication index."""
+    from rich import get_console
+
+    # get the console
+    console = get_console()
+
+    async def _rebuild_auth_index() -> int:
+        """Rebuild the authentication index."""
+        async with app.state.dishka_container(scope=Scope.REQUEST) as container:
+            rebuild_auth_index = await container.get(RebuildAuthIndexInteractor)
+            return await rebuild_auth_index()
+
+    console.rule("Starting to rebuild the authentication index")
+    count = asyncio.run(_rebuild_auth_index())
+    console.rule(f"Authentication index rebuilt with {count} keys")
+
+
+@click.command(
+    help="Create the Vault mount points used by the application.",
+)
+@click.pass_obj
+def provision_vault(app: Litestar) -> None:
+    """Create the Vault mount points."""
+    from rich import get_console
+
+    # get the console
+    console = get_console()
+
+    async def _provision_vault() -> list[str]:
+        """Provision Vault."""
+        async with app.state.dishka_container(scope=Scope.REQUEST) as container:
+            provision_vault = await container.get(ProvisionVaultInteractor)
+            return await provision_vault()
+
+    console.rule("Starting to provision Vault")
+    mount_points = asyncio.run(_provision_vault())
+    console.rule(f"Vault mount points ready: {', '.join(mount_points)}")
+
+
+@click.command(
+    help="Write the API keys waiting in the outbox to Vault.",
+)
+@click.pass_obj
+def dispatch_vault_outbox(app: Litestar) -> None:
+    """Write the Vault outbox to Vault."""
+    from rich import get_console
+
+    # get the console
+    console = get_console()
+
+    async def _dispatch_vault_outbox() -> OutboxDispatchResult:
+        """Dispatch the Vault outbox."""
+        async with app.state.dishka_container(scope=Scope.REQUEST) as container:
+            dispatch_vault_outbox = await container.get(DispatchVaultOutboxInteractor)
+            return await dispatch_vault_outbox()
+
+    console.rule("Starting to dispatch the Vault outbox")
+    result = asyncio.run(_dispatch_vault_outbox())
+    console.rule(
+        f"Vault outbox dispatched: {result.written} written, "
+        f"{result.failed} failed and retried later, "
+        f"{result.dead_lettered} dead-lettered",
+    )
+
+
 core_controller.add_command(drop_db)
 core_controller.add_command(seed_db)
+core_controller.add_command(rebuild_api_key_filter)
+core_controller.add_command(rebuild_auth_index)
+core_controller.add_command(provision_vault)
+core_controller.add_command(dispatch_vault_outbox)
@@ -3,6 +3,8 @@
 from datetime import datetime
 from uuid import UUID
 
+from pydantic import Field
+
 from src.application.common.dto import DTO
 
 
@@ -10,7 +12,7 @@ class ApiKeyDTO(DTO):
     """Api key DTO."""
 
     api_key_id: UUID
-    api_key_value: UUID | None
+    api_key_value: str | None
     date_created: datetime
 
 
@@ -19,3 +21,31 @@ class GetUserApiKeysDTO(DTO):
 
     user_id: UUID
     api_keys: list[ApiKeyDTO]
+
+
+class AccessTokenDTO(DTO):
+    """Access token DTO."""
+
+    access_token: str
+    token_type: str
+    expires_in: int
+
+
+class IntrospectApiKeysDTO(DTO):
+    """Introspect API keys request."""
+
+    api_keys: list[str] = Field(min_length=1)
+
+
+class ApiKeyIntrospectionDTO(DTO):
+    """API key introspection result."""
+
+    valid: bool
+    user_id: UUID | None
+    api_key_id: UUID | None
+
+
+class IntrospectApiKeysResultDTO(DTO):
+    """Introspect API keys response, in the order of the request."""
+
+    results: list[ApiKeyIntrospectionDTO]
@@ -0,0 +1,175 @@
+"""Tests of access tokens and their deny-list."""
+
+import time
+from uuid import uuid4
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from src.application.services.auth import access_token_jose
+from src.application.services.auth.access_token_jose import JoseAccessTokenService
+from src.domain.entities.auth.principal import Principal
+from src.infrastructure.redis.repositories import access_token_deny_list
+from src.infrastructure.redis.repositories.access_token_deny_list import (
+    AccessTokenDenyListRepository,
+)
+from src.main.config.settings import AppSettings
+from src.main.config.settings import AuthSettings
+
+LIFETIME = 300
+
+
+class Clock:
+    """Stand-in for the ``time`` module, moved by hand."""
+
+    def __init__(self):
+        """Initialize clock."""
+        self.now = time.time()
+
+    def time(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(access_token_jose, "time", clock)
+    monkeypatch.setattr(access_token_deny_list, "time", clock)
+    return clock
+
+
+def make_service(max_size: int = 10) -> JoseAccessTokenService:
+    return JoseAccessTokenService(
+        app_settings=AppSettings(),
+        auth_settings=AuthSettings(ACCESS_TOKEN_TTL=LIFETIME, CACHE_MAX_SIZE=max_size),
+    )
+
+
+def make_principal() -> Principal:
+    return Principal(user_id=uuid4(), api_key_id=uuid4())
+
+
+def make_deny_list(redis: FakeRedis) -> AccessTokenDenyListRepository:
+    return AccessTokenDenyListRepository(
+        redis_engine=redis,
+        auth_settings=AuthSettings(ACCESS_TOKEN_TTL=LIFETIME),
+    )
+
+
+def test_issued_token_is_verified(clock: Clock):
+    service = make_service()
+    principal = make_principal()
+
+    claims = service.verify(service.issue(principal))
+
+    assert claims is not None
+    assert claims.principal == principal
+    assert claims.expires_at == int(claims.issued_at) + LIFETIME
+
+
+def test_expired_or_foreign_token_is_rejected(clock: Clock):
+    service = make_service()
+    token = service.issue(make_principal())
+    assert service.verify(token) is not None
+
+    clock.now += LIFETIME
+    assert service.verify(token) is None
+    assert service.verify(make_service().issue(make_principal())) is None
+    assert service.verify("not-a-token") is None
+
+
+def test_least_recently_verified_token_is_evicted(
+    clock: Clock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    service = make_service(max_size=2)
+    first, second, third = (service.issue(make_principal()) for _ in range(3))
+    decoded: list[str] = []
+    decode = service._decode  # noqa: SLF001
+
+    def counting_decode(token: str):
+        decoded.append(token)
+        return decode(token)
+
+    monkeypatch.setattr(service, "_decode", counting_decode)
+    for token in (first, second, first, third, first, second):
+        assert service.verify(token) is not None
+
+    # the cache is not dropped when full, only ``second`` was evicted
+    assert decoded == [first, second, third, second]
+
+
+async def test_revocation_covers_tokens_issued_until_then(clock: Clock):
+    deny_list = make_deny_list(FakeRedis())
+    api_key_id = uuid4()
+    issued_at = int(clock.now)
+
+    await deny_list.revoke(api_key_id)
+    clock.now += 1
+
+    assert deny_list.is_revoked(api_key_id, issued_at)
+    assert not deny_list.is_revoked(api_key_id, int(clock.now) + 1)
+    assert not deny_list.is_revoked(uuid4(), issued_at)
+
+
+async def test_token_issued_after_a_revocation_in_the_same_second_is_valid(
+    clock: Clock,
+):
+    service = make_service()
+    deny_list = make_deny_list(FakeRedis())
+    principal = make_principal()
+    second = int(clock.now)
+    clock.now = second + 0.2
+    before = service.verify(service.issue(principal))
+
+    clock.now = second + 0.5
+    await deny_list.revoke(principal.api_key_id)
+    clock.now = second + 0.8
+    after = service.verify(service.issue(principal))
+
+    assert before is not None
+    assert after is not None
+    assert deny_list.is_revoked(principal.api_key_id, before.issued_at)
+    assert not deny_list.is_revoked(principal.api_key_id, after.issued_at)
+
+
+async def test_refresh_loads_revocations_of_other_processes(clock: Clock):
+    redis = FakeRedis()
+    deny_list, other = make_deny_list(redis), make_deny_list(redis)
+    api_key_id = uuid4()
+
+    await other.revoke(api_key_id)
+    assert not deny_list.is_revoked(api_key_id, int(clock.now))
+
+    await deny_list.refresh()
+    assert deny_list.is_revoked(api_key_id, int(clock.now))
+
+
+async def test_refresh_keeps_a_local_revocation_missing_from_redis(clock: Clock):
+    redis = FakeRedis()
+    deny_list = make_deny_list(redis)
+    api_key_id = uuid4()
+
+    await deny_list.revoke(api_key_id)
+    # as if the refresh read the set before the revocation was added
+    await redis.delete(AccessTokenDenyListRepository.key)
+    await deny_list.refresh()
+
+    assert deny_list.is_revoked(api_key_id, int(clock.now))
+
+
+async def test_refresh_drops_revocations_older_than_the_lifetime(clock: Clock):
+    redis = FakeRedis()
+    deny_list, other = make_deny_list(redis), make_deny_list(redis)
+    local_api_key_id, remote_api_key_id = uuid4(), uuid4()
+    issued_at = int(clock.now)
+
+    await deny_list.revoke(local_api_key_id)
+    await other.revoke(remote_api_key_id)
+    clock.now += LIFETIME + 1
+    await deny_list.refresh()
+
+    assert not deny_list.is_revoked(local_api_key_id, issued_at)
+    assert not deny_list.is_revoked(remote_api_key_id, issued_at)
+    assert await redis.zcard(AccessTokenDenyListRepository.key) == 0
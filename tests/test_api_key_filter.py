@@ -0,0 +1,93 @@
+"""Tests of the Redis Bloom filter of API keys."""
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from redis.exceptions import RedisError
+
+from src.infrastructure.redis.repositories.api_key_filter import ApiKeyFilterRepository
+from src.main.config.settings import AuthSettings
+
+
+class BitfieldReadOnlyFakeRedis(FakeRedis):
+    """Fake Redis answering ``BITFIELD_RO``, which fakeredis lacks."""
+
+    async def bitfield_ro(self, key, encoding, offset, items=None):
+        """Read bit fields with a plain ``BITFIELD GET``."""
+        operation = self.bitfield(key).get(encoding, offset)
+        for item_encoding, item_offset in items or []:
+            operation.get(item_encoding, item_offset)
+        return await operation.execute()
+
+
+@pytest.fixture()
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture()
+def repository(server: FakeServer) -> ApiKeyFilterRepository:
+    return ApiKeyFilterRepository(
+        redis_engine=BitfieldReadOnlyFakeRedis(server=server),
+        auth_settings=AuthSettings(KEY_FILTER_CAPACITY=1_000),
+    )
+
+
+async def _rebuild(repository: ApiKeyFilterRepository, *keys: bytes) -> int:
+    async def iterate():
+        for key in keys:
+            yield key
+
+    return await repository.rebuild(iterate())
+
+
+async def test_rebuild_marks_the_filter_built(repository: ApiKeyFilterRepository):
+    assert await _rebuild(repository, b"first", b"second") == 2  # noqa: PLR2004
+    assert await repository.exists()
+
+
+async def test_built_filter_rejects_unknown_keys(repository: ApiKeyFilterRepository):
+    await _rebuild(repository, b"issued")
+
+    assert await repository.might_contain(b"issued")
+    assert not await repository.might_contain(b"unknown")
+
+
+async def test_added_key_is_found_in_a_built_filter(
+    repository: ApiKeyFilterRepository,
+):
+    await _rebuild(repository, b"issued")
+    await repository.add(b"added")
+
+    assert await repository.might_contain(b"added")
+    assert not await repository.might_contain(b"unknown")
+
+
+async def test_missing_filter_might_contain_anything(
+    repository: ApiKeyFilterRepository,
+):
+    assert not await repository.exists()
+    assert await repository.might_contain(b"unknown")
+
+
+async def test_redis_outage_fails_open(
+    repository: ApiKeyFilterRepository,
+    server: FakeServer,
+):
+    await _rebuild(repository, b"issued")
+    server.connected = False
+
+    # lookups may hit the database instead
+    assert await repository.might_contain(b"unknown")
+
+
+async def test_failed_add_raises(
+    repository: ApiKeyFilterRepository,
+    server: FakeServer,
+):
+    await _rebuild(repository, b"issued")
+    server.connected = False
+
+    # the key must not be committed, a built filter would reject it
+    with pytest.raises(RedisError):
+        await repository.add(b"added")
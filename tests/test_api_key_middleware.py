@@ -0,0 +1,83 @@
+"""Tests of the API key authentication middleware."""
+
+from typing import Any
+from uuid import uuid4
+
+from litestar import Litestar
+from litestar import get
+from litestar.connection import ASGIConnection
+from litestar.exceptions import NotAuthorizedException
+from litestar.testing import TestClient
+
+from src.application.interfaces.services.stage_timings import IStageTimings
+from src.application.services.core.stage_timings import StageTimings
+from src.domain.entities.auth.principal import Principal
+from src.infrastructure.framework.security.api_key.config import ApiKeyAuth
+from src.main.config.settings import AuthSettings
+
+API_KEY = "valid-key"
+
+
+class Container:
+    """Application container holding only the stage timings."""
+
+    def __init__(self, stage_timings: IStageTimings):
+        """Initialize container."""
+        self.stage_timings = stage_timings
+
+    async def get(self, dependency_type: type) -> Any:
+        """Get a dependency."""
+        assert dependency_type is IStageTimings
+        return self.stage_timings
+
+
+def make_client(*, timing_enabled: bool) -> TestClient[Litestar]:
+    stage_timings = StageTimings(
+        auth_settings=AuthSettings(TIMING_ENABLED=timing_enabled),
+    )
+
+    async def retrieve_user_handler(
+        api_key: str,
+        connection: ASGIConnection[Any, Any, Any, Any],
+    ) -> Principal:
+        with stage_timings.measure("auth-db-query"):
+            if api_key != API_KEY:
+                raise NotAuthorizedException
+        return Principal(user_id=uuid4(), api_key_id=uuid4())
+
+    @get("/")
+    async def handler() -> str:
+        return "ok"
+
+    auth = ApiKeyAuth[Principal](retrieve_user_handler=retrieve_user_handler)
+    app = Litestar(route_handlers=[handler], on_app_init=[auth.on_app_init])
+    app.state.dishka_container = Container(stage_timings)
+    return TestClient(app)
+
+
+def test_server_timing_reports_auth_stages():
+    with make_client(timing_enabled=True) as client:
+        response = client.get("/", headers={"X-Api-Key": API_KEY})
+
+    stages = dict(
+        metric.strip().split(";dur=")
+        for metric in response.headers["Server-Timing"].split(",")
+    )
+    assert set(stages) == {"auth", "auth-db-query"}
+    assert float(stages["auth"]) >= float(stages["auth-db-query"])
+
+
+def test_rejected_request_has_no_server_timing():
+    with make_client(timing_enabled=True) as client:
+        response = client.get("/", headers={"X-Api-Key": "unknown-key"})
+
+    assert response.status_code == 401  # noqa: PLR2004
+    assert "Server-Timing" not in response.headers
+
+
+def test_server_timing_is_not_sent_when_disabled():
+    with make_client(timing_enabled=False) as client:
+        response = client.get("/", headers={"X-Api-Key": API_KEY})
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert "Server-Timing" not in response.headers
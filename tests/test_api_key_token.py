@@ -0,0 +1,62 @@
+"""Tests of the API key token."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.domain.value_objects.api_key_token import ApiKeyToken
+
+PREFIX = "ergo1"
+
+
+def test_generated_token_is_parsed_back():
+    token = ApiKeyToken.generate(prefix=PREFIX, key_id=uuid4())
+
+    assert ApiKeyToken.parse(str(token), prefix=PREFIX) == token
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "ergo1",
+        "not-a-token",
+        "ergo1_abc_00000000",
+        "ergo1_a_b_c_00000000",
+    ],
+)
+def test_malformed_token_is_rejected(value: str):
+    with pytest.raises(ValueError, match="Malformed"):
+        ApiKeyToken.parse(value, prefix=PREFIX)
+
+
+def test_token_of_another_prefix_is_rejected():
+    token = ApiKeyToken.generate(prefix="other", key_id=uuid4())
+
+    with pytest.raises(ValueError, match="Malformed"):
+        ApiKeyToken.parse(str(token), prefix=PREFIX)
+
+
+def test_tampered_secret_is_rejected():
+    token = str(ApiKeyToken.generate(prefix=PREFIX, key_id=uuid4()))
+    body, separator, checksum = token.rpartition("_")
+    tampered = body[:-1] + ("0" if body[-1] != "0" else "1")
+
+    with pytest.raises(ValueError, match="checksum"):
+        ApiKeyToken.parse(f"{tampered}{separator}{checksum}", prefix=PREFIX)
+
+
+def test_tampered_checksum_is_rejected():
+    token = str(ApiKeyToken.generate(prefix=PREFIX, key_id=uuid4()))
+    checksum = f"{int(token[-8:], 16) ^ 1:08x}"
+
+    with pytest.raises(ValueError, match="checksum"):
+        ApiKeyToken.parse(token[:-8] + checksum, prefix=PREFIX)
+
+
+def test_key_id_that_is_not_hex_is_rejected():
+    body = f"{PREFIX}_{'z' * 32}_{'0' * 32}"
+    value = f"{body}_{ApiKeyToken._checksum(body)}"  # noqa: SLF001
+
+    with pytest.raises(ValueError, match="base 16"):
+        ApiKeyToken.parse(value, prefix=PREFIX)
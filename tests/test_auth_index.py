@@ -0,0 +1,80 @@
+"""Tests of the Redis index of principals by API key."""
+
+from uuid import uuid4
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from redis.exceptions import RedisError
+
+from src.domain.entities.auth.principal import Principal
+from src.infrastructure.redis.repositories.auth_index import AuthIndexRepository
+from src.main.config.settings import AuthSettings
+
+
+@pytest.fixture()
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture()
+def repository(server: FakeServer) -> AuthIndexRepository:
+    return AuthIndexRepository(
+        redis_engine=FakeRedis(server=server),
+        auth_settings=AuthSettings(INDEX_ENABLED=True),
+    )
+
+
+def make_principal() -> Principal:
+    return Principal(user_id=uuid4(), api_key_id=uuid4())
+
+
+async def test_indexed_principal_is_found(repository: AuthIndexRepository):
+    principal = make_principal()
+    await repository.set(b"key", principal)
+
+    assert await repository.get(b"key") == principal
+    assert await repository.get(b"unknown") is None
+
+
+async def test_deleted_key_is_not_found(repository: AuthIndexRepository):
+    await repository.set(b"deleted", make_principal())
+    await repository.set(b"kept", make_principal())
+
+    await repository.delete(b"deleted")
+
+    assert await repository.get(b"deleted") is None
+    assert await repository.get(b"kept") is not None
+
+
+async def test_cleared_index_holds_no_key(repository: AuthIndexRepository):
+    await repository.set(b"key", make_principal())
+
+    await repository.clear()
+
+    assert await repository.get(b"key") is None
+    assert not await repository.exists()
+
+
+async def test_rebuild_drops_keys_not_issued(repository: AuthIndexRepository):
+    principal = make_principal()
+    await repository.set(b"deleted", make_principal())
+
+    async def principals():
+        yield b"issued", principal
+
+    assert await repository.rebuild(principals()) == 1
+    assert await repository.get(b"issued") == principal
+    assert await repository.get(b"deleted") is None
+
+
+async def test_lookups_fail_open_and_deletes_raise(
+    repository: AuthIndexRepository,
+    server: FakeServer,
+):
+    server.connected = False
+
+    assert await repository.get(b"key") is None
+    await repository.set(b"key", make_principal())
+    with pytest.raises(RedisError):
+        await repository.delete(b"key")
@@ -0,0 +1,153 @@
+"""Tests of the API key authentication."""
+
+from collections.abc import AsyncIterable
+from uuid import UUID
+from uuid import uuid4
+
+import pytest
+from litestar.exceptions import NotAuthorizedException
+
+from src.application.interactors.auth.authenticate import AuthenticateApiKeyInteractor
+from src.application.interactors.auth.authenticate import AuthenticateApiKeyRequestModel
+from src.application.interfaces.repositories.api_key import (
+    IGetPrincipalByApiKeyRepository,
+)
+from src.application.interfaces.repositories.api_key_filter import (
+    IApiKeyFilterRepository,
+)
+from src.application.interfaces.repositories.auth_index import IAuthIndexRepository
+from src.application.services.auth.hasher_blake2b import HasherBlake2b
+from src.application.services.core.single_flight import SingleFlight
+from src.application.services.core.stage_timings import StageTimings
+from src.application.services.core.uuid_generator import UUIDGeneratorService
+from src.domain.entities.auth.principal import Principal
+from src.domain.value_objects.api_key_token import ApiKeyToken
+from src.infrastructure.memory.auth_cache import InMemoryAuthCache
+from src.main.config.settings import AppSettings
+from src.main.config.settings import AuthSettings
+
+
+class PrincipalRepository(IGetPrincipalByApiKeyRepository):
+    """Principals by API key hash, kept in memory."""
+
+    def __init__(self, principals: dict[bytes, Principal]):
+        """Initialize repository."""
+        self.principals = principals
+        self.lookups = 0
+
+    async def get_principal_by_api_key_hash(
+        self,
+        api_key_hashed: bytes,
+        api_key_id: UUID | None = None,
+    ) -> Principal | None:
+        """Get principal by API key."""
+        self.lookups += 1
+        return self.principals.get(api_key_hashed)
+
+
+class ApiKeyFilterRepository(IApiKeyFilterRepository):
+    """Filter that might contain every key."""
+
+    async def might_contain(self, api_key_hashed: bytes) -> bool:
+        """Check if the API key hash may have been issued."""
+        return True
+
+    async def add(self, api_key_hashed: bytes) -> None:
+        """Add an issued API key hash."""
+
+    async def exists(self) -> bool:
+        """Check if the filter has been built."""
+        return True
+
+    async def rebuild(self, api_keys_hashed: AsyncIterable[bytes]) -> int:
+        """Build the filter."""
+        return 0
+
+
+class AuthIndexRepository(IAuthIndexRepository):
+    """Index that never holds a key."""
+
+    async def get(self, api_key_hashed: bytes) -> Principal | None:
+        """Get an indexed principal by API key hash."""
+        return None
+
+    async def set(self, api_key_hashed: bytes, principal: Principal) -> None:
+        """Index a principal by API key hash."""
+
+    async def delete(self, api_key_hashed: bytes) -> None:
+        """Remove an API key hash from the index."""
+
+    async def clear(self) -> None:
+        """Remove every API key hash from the index."""
+
+    async def exists(self) -> bool:
+        """Check if the index has been built."""
+        return True
+
+    async def rebuild(
+        self,
+        principals: AsyncIterable[tuple[bytes, Principal]],
+    ) -> int:
+        """Build the index."""
+        return 0
+
+
+def make_interactor(
+    app_settings: AppSettings,
+    principals: PrincipalRepository,
+) -> AuthenticateApiKeyInteractor:
+    return AuthenticateApiKeyInteractor(
+        principal_repository=principals,
+        generate_uuid7_service=UUIDGeneratorService(),
+        hash_service=HasherBlake2b(app_settings=app_settings),
+        auth_cache=InMemoryAuthCache(max_size=100, ttl=60),
+        single_flight=SingleFlight(),
+        api_key_filter_repository=ApiKeyFilterRepository(),
+        auth_index_repository=AuthIndexRepository(),
+        app_settings=app_settings,
+        stage_timings=StageTimings(auth_settings=AuthSettings()),
+    )
+
+
+def issue(
+    app_settings: AppSettings,
+    principals: PrincipalRepository,
+    prefix: str,
+) -> tuple[str, Principal]:
+    principal = Principal(user_id=uuid4(), api_key_id=uuid4())
+    api_key = str(ApiKeyToken.generate(prefix=prefix, key_id=principal.api_key_id))
+    hasher = HasherBlake2b(app_settings=app_settings)
+    principals.principals[hasher.digest(api_key.encode())] = principal
+    return api_key, principal
+
+
+async def test_keys_with_a_previous_prefix_are_accepted():
+    app_settings = AppSettings(API_KEY_PREFIX="new", API_KEY_PREVIOUS_PREFIXES=["old"])
+    principals = PrincipalRepository({})
+    authenticate = make_interactor(app_settings, principals)
+
+    for prefix in ("new", "old"):
+        api_key, principal = issue(app_settings, principals, prefix)
+        assert await authenticate(AuthenticateApiKeyRequestModel(api_key)) == principal
+
+
+async def test_keys_with_an_unknown_prefix_are_rejected_without_lookup():
+    app_settings = AppSettings(API_KEY_PREFIX="new", API_KEY_PREVIOUS_PREFIXES=["old"])
+    principals = PrincipalRepository({})
+    authenticate = make_interactor(app_settings, principals)
+    api_key, _ = issue(app_settings, principals, "other")
+
+    with pytest.raises(NotAuthorizedException):
+        await authenticate(AuthenticateApiKeyRequestModel(api_key))
+    assert principals.lookups == 0
+
+
+async def test_legacy_uuid_keys_are_looked_up():
+    app_settings = AppSettings()
+    principal = Principal(user_id=uuid4(), api_key_id=uuid4())
+    api_key = str(uuid4())
+    hasher = HasherBlake2b(app_settings=app_settings)
+    principals = PrincipalRepository({hasher.digest(api_key.encode()): principal})
+    authenticate = make_interactor(app_settings, principals)
+
+    assert await authenticate(AuthenticateApiKeyRequestModel(api_key)) == principal
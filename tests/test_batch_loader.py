@@ -0,0 +1,84 @@
+"""Tests of the batch loader."""
+
+import asyncio
+from collections.abc import Mapping
+
+import pytest
+
+from src.infrastructure.common.batch_loader import BatchLoader
+
+
+class RecordingLoad:
+    """Batch load recording its batches."""
+
+    def __init__(self, error: Exception | None = None):
+        """Initialize load."""
+        self.batches: list[list[str]] = []
+        self.error = error
+
+    async def __call__(self, keys: list[str]) -> Mapping[str, str]:
+        """Load values of the known keys."""
+        self.batches.append(keys)
+        if self.error is not None:
+            raise self.error
+        return {key: key.upper() for key in keys if key != "missing"}
+
+
+async def test_loads_within_the_window_are_batched():
+    batch_load = RecordingLoad()
+    loader = BatchLoader(batch_load=batch_load, window=0.01, max_batch_size=100)
+
+    results = await asyncio.gather(
+        loader.load("a"),
+        loader.load("b"),
+        loader.load("a"),
+        loader.load("missing"),
+    )
+
+    assert results == ["A", "B", "A", None]
+    assert batch_load.batches == [["a", "b", "missing"]]
+
+
+async def test_full_batch_is_dispatched_before_the_window():
+    batch_load = RecordingLoad()
+    loader = BatchLoader(batch_load=batch_load, window=60, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(loader.load("a"), loader.load("b")),
+        timeout=1,
+    )
+
+    assert results == ["A", "B"]
+    assert batch_load.batches == [["a", "b"]]
+
+
+async def test_batch_failure_reaches_every_waiter():
+    error = RuntimeError("database is down")
+    loader = BatchLoader(
+        batch_load=RecordingLoad(error=error),
+        window=0.01,
+        max_batch_size=100,
+    )
+
+    results = await asyncio.gather(
+        loader.load("a"),
+        loader.load("b"),
+        loader.load("a"),
+        return_exceptions=True,
+    )
+
+    assert results == [error, error, error]
+
+
+async def test_cancelled_caller_does_not_cancel_the_batch():
+    batch_load = RecordingLoad()
+    loader = BatchLoader(batch_load=batch_load, window=0.01, max_batch_size=100)
+
+    cancelled = asyncio.create_task(loader.load("a"))
+    other = asyncio.create_task(loader.load("a"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert await other == "A"
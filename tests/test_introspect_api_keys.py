@@ -0,0 +1,98 @@
+"""Tests of the API key introspection."""
+
+from uuid import uuid4
+
+import pytest
+from litestar.exceptions import PermissionDeniedException
+
+from src.application.interactors.auth.introspect_api_keys import ApiKeyIntrospection
+from src.application.interactors.auth.introspect_api_keys import (
+    IntrospectApiKeysInteractor,
+)
+from src.application.interactors.auth.introspect_api_keys import (
+    IntrospectApiKeysRequestModel,
+)
+from src.main.config.settings import AppSettings
+from src.main.config.settings import AuthSettings
+from tests.test_authenticate_api_key import PrincipalRepository
+from tests.test_authenticate_api_key import issue
+from tests.test_authenticate_api_key import make_interactor
+
+GATEWAY_USER_ID = uuid4()
+
+
+def make_introspect(
+    app_settings: AppSettings,
+    principals: PrincipalRepository,
+) -> IntrospectApiKeysInteractor:
+    return IntrospectApiKeysInteractor(
+        authenticate_api_key_interactor=make_interactor(app_settings, principals),
+        auth_settings=AuthSettings(INTROSPECT_GATEWAY_USER_IDS=[GATEWAY_USER_ID]),
+    )
+
+
+async def test_gateway_introspects_keys_of_any_user():
+    app_settings = AppSettings()
+    principals = PrincipalRepository({})
+    first_key, first = issue(app_settings, principals, app_settings.API_KEY_PREFIX)
+    second_key, second = issue(app_settings, principals, app_settings.API_KEY_PREFIX)
+    introspect = make_introspect(app_settings, principals)
+
+    response = await introspect(
+        IntrospectApiKeysRequestModel(
+            user_id=GATEWAY_USER_ID,
+            api_keys=[first_key, "malformed", second_key, first_key],
+        ),
+    )
+
+    assert response.results == [
+        ApiKeyIntrospection(
+            valid=True,
+            user_id=first.user_id,
+            api_key_id=first.api_key_id,
+        ),
+        ApiKeyIntrospection(valid=False),
+        ApiKeyIntrospection(
+            valid=True,
+            user_id=second.user_id,
+            api_key_id=second.api_key_id,
+        ),
+        ApiKeyIntrospection(
+            valid=True,
+            user_id=first.user_id,
+            api_key_id=first.api_key_id,
+        ),
+    ]
+    # a repeated key is resolved once, a malformed one never
+    assert principals.lookups == 2  # noqa: PLR2004
+
+
+async def test_keys_are_valid_exactly_when_they_authenticate():
+    app_settings = AppSettings(API_KEY_PREFIX="new", API_KEY_PREVIOUS_PREFIXES=["old"])
+    principals = PrincipalRepository({})
+    old_key, _ = issue(app_settings, principals, "old")
+    unknown_prefix_key, _ = issue(app_settings, principals, "other")
+    introspect = make_introspect(app_settings, principals)
+
+    response = await introspect(
+        IntrospectApiKeysRequestModel(
+            user_id=GATEWAY_USER_ID,
+            api_keys=[old_key, unknown_prefix_key],
+        ),
+    )
+
+    assert [result.valid for result in response.results] == [True, False]
+
+
+async def test_only_gateways_can_introspect():
+    app_settings = AppSettings()
+    principals = PrincipalRepository({})
+    api_key, principal = issue(app_settings, principals, app_settings.API_KEY_PREFIX)
+    introspect = make_introspect(app_settings, principals)
+    request_model = IntrospectApiKeysRequestModel(
+        user_id=principal.user_id,
+        api_keys=[api_key],
+    )
+
+    with pytest.raises(PermissionDeniedException):
+        await introspect(request_model)
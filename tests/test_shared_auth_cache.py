@@ -0,0 +1,174 @@
+"""Tests of the shared-memory authentication cache."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.auth.principal import Principal
+from src.infrastructure.memory.shared_auth_cache import HEADER
+from src.infrastructure.memory.shared_auth_cache import SEQUENCE
+from src.infrastructure.memory.shared_auth_cache import SLOT_SIZE
+from src.infrastructure.memory.shared_auth_cache import SharedMemoryAuthCache
+
+SLOTS = 64
+TTL = 60.0
+
+
+class Clock:
+    """Clock moved by hand."""
+
+    def __init__(self):
+        """Initialize clock."""
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture()
+def path(tmp_path: Path) -> str:
+    return str(tmp_path / "auth-cache")
+
+
+@pytest.fixture()
+def cache(path: str, clock: Clock) -> Iterator[SharedMemoryAuthCache]:
+    cache = SharedMemoryAuthCache(path=path, slots=SLOTS, ttl=TTL, clock=clock)
+    yield cache
+    cache.close()
+
+
+def make_principal() -> Principal:
+    return Principal(user_id=uuid4(), api_key_id=uuid4())
+
+
+def key_at(slot: int, index: int) -> bytes:
+    """Get a distinct key whose probing starts at a slot."""
+    return (slot + index * SLOTS).to_bytes(8, "little") + bytes(8)
+
+
+def test_entry_written_by_one_process_is_read_by_another(
+    cache: SharedMemoryAuthCache,
+    path: str,
+    clock: Clock,
+):
+    principal = make_principal()
+    cache.set(b"key", principal)
+
+    other = SharedMemoryAuthCache(path=path, slots=SLOTS, ttl=TTL, clock=clock)
+    try:
+        assert other.get(b"key") == principal
+        other.invalidate(b"key")
+    finally:
+        other.close()
+
+    assert cache.get(b"key") is None
+
+
+def test_file_of_another_size_is_reset(
+    cache: SharedMemoryAuthCache,
+    path: str,
+    clock: Clock,
+):
+    cache.set(b"key", make_principal())
+
+    resized = SharedMemoryAuthCache(path=path, slots=SLOTS * 2, ttl=TTL, clock=clock)
+    try:
+        assert resized.get(b"key") is None
+    finally:
+        resized.close()
+
+
+def test_entry_expires_after_ttl(cache: SharedMemoryAuthCache, clock: Clock):
+    cache.set(b"key", make_principal())
+    clock.now += TTL
+
+    assert cache.get(b"key") is None
+    assert cache.stats().expirations == 1
+    assert cache.stats().size == 0
+
+
+def test_key_is_replaced_in_place(cache: SharedMemoryAuthCache):
+    cache.set(b"key", make_principal())
+    principal = make_principal()
+    cache.set(b"key", principal)
+
+    assert cache.get(b"key") == principal
+    assert cache.stats().size == 1
+
+
+def test_full_probe_window_evicts_the_entry_closest_to_expiry(
+    cache: SharedMemoryAuthCache,
+    clock: Clock,
+):
+    keys = [key_at(3, index) for index in range(cache.probe_length + 1)]
+    principals = [make_principal() for _ in keys]
+    for key, principal in zip(keys, principals, strict=True):
+        cache.set(key, principal)
+        clock.now += 1
+
+    assert cache.get(keys[0]) is None
+    for key, principal in zip(keys[1:], principals[1:], strict=True):
+        assert cache.get(key) == principal
+    assert cache.stats().evictions == 1
+
+
+def test_invalidated_entry_keeps_later_keys_reachable(
+    cache: SharedMemoryAuthCache,
+):
+    first, second = key_at(5, 0), key_at(5, 1)
+    principal = make_principal()
+    cache.set(first, make_principal())
+    cache.set(second, principal)
+
+    cache.invalidate(first)
+
+    assert cache.get(first) is None
+    assert cache.get(second) == principal
+
+
+def test_slot_being_written_is_read_as_a_miss(cache: SharedMemoryAuthCache):
+    cache.set(b"key", make_principal())
+    offset = next(
+        offset
+        for offset in range(HEADER.size, HEADER.size + SLOTS * SLOT_SIZE, SLOT_SIZE)
+        if SEQUENCE.unpack_from(cache._buffer, offset)[0]  # noqa: SLF001
+    )
+    # an odd sequence number marks a write in progress
+    (sequence,) = SEQUENCE.unpack_from(cache._buffer, offset)  # noqa: SLF001
+    SEQUENCE.pack_into(cache._buffer, offset, sequence + 1)  # noqa: SLF001
+
+    assert cache.get(b"key") is None
+
+
+def test_too_long_key_is_not_cached(cache: SharedMemoryAuthCache):
+    key = bytes(65)
+    cache.set(key, make_principal())
+
+    assert cache.get(key) is None
+
+
+def test_symlinked_file_is_refused(tmp_path: Path, path: str):
+    target = tmp_path / "target"
+    target.touch()
+    Path(path).symlink_to(target)
+
+    with pytest.raises(OSError):  # noqa: PT011
+        SharedMemoryAuthCache(path=path, slots=SLOTS, ttl=TTL)
+
+
+@pytest.mark.skipif(os.getuid() != 0, reason="changing the file owner needs root")
+def test_file_of_another_user_is_refused(path: str):
+    Path(path).touch()
+    os.chown(path, 65534, 65534)
+
+    with pytest.raises(PermissionError, match="owned by another user"):
+        SharedMemoryAuthCache(path=path, slots=SLOTS, ttl=TTL)
@@ -0,0 +1,111 @@
+"""Tests of the single-flight service."""
+
+import asyncio
+
+import pytest
+
+from src.application.services.core.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_result():
+    single_flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    tasks = [asyncio.create_task(single_flight.do("key", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [42] * 5
+    assert calls == 1
+
+
+async def test_different_keys_are_not_coalesced():
+    single_flight = SingleFlight()
+
+    async def load(value: str) -> str:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(
+        single_flight.do("a", lambda: load("a")),
+        single_flight.do("b", lambda: load("b")),
+    )
+
+    assert results == ["a", "b"]
+
+
+async def test_failure_reaches_every_waiter():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load() -> int:
+        await release.wait()
+        msg = "lookup failed"
+        raise RuntimeError(msg)
+
+    tasks = [asyncio.create_task(single_flight.do("key", load)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def load_again() -> int:
+        return 1
+
+    # the failed call is forgotten, the next one runs again
+    assert await single_flight.do("key", load_again) == 1
+
+
+async def test_cancelled_leader_lets_a_waiter_retry():
+    single_flight = SingleFlight()
+    calls = 0
+    started = asyncio.Event()
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.Event().wait()
+        return calls
+
+    leader = asyncio.create_task(single_flight.do("key", load))
+    await started.wait()
+    waiter = asyncio.create_task(single_flight.do("key", load))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await waiter == 2  # noqa: PLR2004
+    assert calls == 2  # noqa: PLR2004
+
+
+async def test_cancelled_waiter_does_not_cancel_the_call():
+    single_flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load() -> str:
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(single_flight.do("key", load))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(single_flight.do("key", load))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+
+    assert await leader == "done"
@@ -0,0 +1,101 @@
+"""Tests of the thread pool for blocking Vault calls."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+from hvac.exceptions import VaultDown
+
+from src.infrastructure.vault.executor import VaultExecutor
+
+
+@pytest.fixture()
+def executor() -> Iterator[VaultExecutor]:
+    executor = VaultExecutor(max_workers=1, queue_size=1, queue_timeout=0.05)
+    yield executor
+    executor.close()
+
+
+@pytest.fixture()
+def release() -> Iterator[threading.Event]:
+    release = threading.Event()
+    yield release
+    # never leave a thread blocked
+    release.set()
+
+
+async def start_blocked_call(
+    executor: VaultExecutor,
+    release: threading.Event,
+) -> asyncio.Task[str]:
+    def blocked() -> str:
+        release.wait()
+        return "blocked"
+
+    task = asyncio.create_task(executor.run(blocked))
+    await asyncio.sleep(0)
+    return task
+
+
+async def test_call_runs_on_a_vault_thread(executor: VaultExecutor):
+    name = await executor.run(lambda: threading.current_thread().name)
+
+    assert name.startswith("vault")
+    await asyncio.sleep(0.01)
+    stats = executor.stats()
+    assert (stats.active, stats.queued, stats.completed) == (0, 0, 1)
+
+
+async def test_call_is_rejected_when_the_queue_is_full(
+    executor: VaultExecutor,
+    release: threading.Event,
+):
+    blocked = await start_blocked_call(executor, release)
+    queued = asyncio.create_task(executor.run(lambda: "queued"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(VaultDown, match="queue is full"):
+        await executor.run(lambda: "rejected")
+    stats = executor.stats()
+    assert (stats.active, stats.queued, stats.rejected) == (1, 1, 1)
+
+    release.set()
+    assert await blocked == "blocked"
+    assert await queued == "queued"
+
+
+async def test_call_waiting_too_long_times_out(
+    executor: VaultExecutor,
+    release: threading.Event,
+):
+    blocked = await start_blocked_call(executor, release)
+
+    with pytest.raises(VaultDown, match="Timed out"):
+        await executor.run(lambda: "late")
+    stats = executor.stats()
+    assert (stats.queued, stats.timed_out) == (0, 1)
+
+    release.set()
+    await blocked
+
+
+async def test_slot_is_held_until_the_thread_of_a_cancelled_call_returns(
+    executor: VaultExecutor,
+    release: threading.Event,
+):
+    blocked = await start_blocked_call(executor, release)
+    blocked.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await blocked
+
+    assert executor.stats().active == 1
+    with pytest.raises(VaultDown, match="Timed out"):
+        await executor.run(lambda: "late")
+
+    release.set()
+    assert await executor.run(lambda: "next") == "next"
+    await asyncio.sleep(0.01)
+    stats = executor.stats()
+    assert (stats.active, stats.completed) == (0, 2)
+    assert stats.wait_time_total >= stats.wait_time_max > 0
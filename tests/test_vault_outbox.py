@@ -0,0 +1,383 @@
+"""Tests of the Vault outbox, its repository and its dispatcher."""
+
+from collections.abc import AsyncIterator
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from typing import cast
+from uuid import UUID
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from uuid_utils.compat import uuid7
+
+from scripts.benchmarks.vault_transport import InMemoryVaultTransport
+from src.application.interactors.auth.create_api_key import CreateApiKeyInteractor
+from src.application.interactors.auth.create_api_key import CreateApiKeyRequestModel
+from src.application.interactors.auth.get_user_api_keys import GetUserApiKeysInteractor
+from src.application.interactors.auth.get_user_api_keys import (
+    GetUserApiKeysRequestModel,
+)
+from src.application.interfaces.services.vault_outbox import OutboxDispatchResult
+from src.application.services.auth.hasher_blake2b import HasherBlake2b
+from src.application.services.core.uuid_generator import UUIDGeneratorService
+from src.infrastructure.database.repositories.auth.api_key import ApiKeyRepository
+from src.infrastructure.database.repositories.core.vault_outbox import (
+    VaultOutboxRepository,
+)
+from src.infrastructure.database.tables import api_key_table
+from src.infrastructure.database.tables import user_table
+from src.infrastructure.database.tables import vault_outbox_table
+from src.infrastructure.vault.cache import InMemoryVaultSecretCache
+from src.infrastructure.vault.client import AsyncVaultClient
+from src.infrastructure.vault.outbox import VaultOutboxDispatcher
+from src.infrastructure.vault.repositories.api_key import ApiKeyVaultRepository
+from src.infrastructure.vault.repositories.api_key_outbox import (
+    ApiKeyVaultOutboxRepository,
+)
+from src.infrastructure.vault.session import VaultMountCache
+from src.infrastructure.vault.session import VaultSession
+from src.main.config.settings import AppSettings
+from src.main.config.settings import VaultSettings
+from tests.test_authenticate_api_key import ApiKeyFilterRepository
+from tests.test_authenticate_api_key import AuthIndexRepository
+
+if TYPE_CHECKING:
+    from src.infrastructure.common.interfaces import IDatabaseSession
+
+MOUNT_POINT = "api-keys"
+
+
+@pytest.fixture()
+async def session_maker() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(
+            vault_outbox_table.metadata.create_all,
+            tables=[user_table, api_key_table, vault_outbox_table],
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture()
+def app_settings() -> AppSettings:
+    return AppSettings()
+
+
+@pytest.fixture()
+def vault_settings() -> VaultSettings:
+    return VaultSettings(
+        TOKEN="token",  # noqa: S106
+        API_KEYS_MOUNT_POINT=MOUNT_POINT,
+        OUTBOX_ENABLED=True,
+        OUTBOX_RETRY_BACKOFF=10.0,
+        OUTBOX_RETRY_MAX_BACKOFF=40.0,
+    )
+
+
+@pytest.fixture()
+def transport() -> InMemoryVaultTransport:
+    return InMemoryVaultTransport()
+
+
+@pytest.fixture()
+async def client(transport: InMemoryVaultTransport) -> AsyncIterator[AsyncVaultClient]:
+    client = AsyncVaultClient(
+        url="http://vault.invalid",
+        token="token",  # noqa: S106
+        transport=transport,
+    )
+    yield client
+    await client.close()
+
+
+@pytest.fixture()
+def dispatcher(
+    session_maker: async_sessionmaker[AsyncSession],
+    client: AsyncVaultClient,
+    vault_settings: VaultSettings,
+    app_settings: AppSettings,
+) -> VaultOutboxDispatcher:
+    return VaultOutboxDispatcher(
+        session_maker=session_maker,
+        vault_client=client,
+        vault_mount_cache=VaultMountCache(ttl=300),
+        vault_secret_cache=InMemoryVaultSecretCache(max_size=100),
+        vault_settings=vault_settings,
+        app_settings=app_settings,
+    )
+
+
+def make_vault_session(client: AsyncVaultClient) -> VaultSession:
+    return VaultSession(
+        vault_client=client,
+        mount_cache=VaultMountCache(ttl=300),
+        secret_cache=InMemoryVaultSecretCache(max_size=100),
+    )
+
+
+async def add(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+    *entries: tuple[str, str, str],
+) -> None:
+    async with session_maker() as db_session, db_session.begin():
+        repository = VaultOutboxRepository(db_session, app_settings)
+        for path, key, value in entries:
+            await repository.add(MOUNT_POINT, path, key, value)
+
+
+async def get_rows(session_maker: async_sessionmaker[AsyncSession]) -> list:
+    async with session_maker() as db_session:
+        return list(await db_session.execute(select(vault_outbox_table)))
+
+
+async def read(client: AsyncVaultClient, path: str) -> dict[str, str]:
+    return (await client.read_secret(path=path, mount_point=MOUNT_POINT)).data
+
+
+async def test_values_are_stored_encrypted(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+):
+    await add(session_maker, app_settings, ("user", "key", "secret-value"))
+
+    (row,) = await get_rows(session_maker)
+    assert b"secret-value" not in row.value_encrypted
+    async with session_maker() as db_session:
+        repository = VaultOutboxRepository(db_session, app_settings)
+        (entry,) = await repository.claim(limit=10, lease=60)
+        assert entry.value == "secret-value"
+        assert await repository.get_pending(MOUNT_POINT, "user") == {
+            "key": "secret-value",
+        }
+
+
+async def test_pending_keys_keep_the_latest_value(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+):
+    await add(
+        session_maker,
+        app_settings,
+        ("user", "a", "1"),
+        ("user", "a", "2"),
+        ("user", "b", "3"),
+        ("other", "c", "4"),
+    )
+
+    async with session_maker() as db_session:
+        repository = VaultOutboxRepository(db_session, app_settings)
+        assert await repository.get_pending(MOUNT_POINT, "user") == {
+            "a": "2",
+            "b": "3",
+        }
+
+
+async def test_claimed_entries_are_hidden_until_the_lease_runs_out(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+):
+    await add(session_maker, app_settings, ("user", "a", "1"), ("user", "b", "2"))
+
+    async with session_maker() as db_session, db_session.begin():
+        repository = VaultOutboxRepository(db_session, app_settings)
+        assert len(await repository.claim(limit=1, lease=60)) == 1
+        assert len(await repository.claim(limit=10, lease=60)) == 1
+        assert await repository.claim(limit=10, lease=60) == []
+
+        # the claimer stopped without settling the entries
+        await db_session.execute(
+            update(vault_outbox_table).values(
+                available_at=datetime.now(UTC) - timedelta(seconds=1),
+            ),
+        )
+        assert len(await repository.claim(limit=10, lease=60)) == 2  # noqa: PLR2004
+
+
+async def test_dispatch_writes_each_path_once_and_deletes_entries(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+    dispatcher: VaultOutboxDispatcher,
+    client: AsyncVaultClient,
+    transport: InMemoryVaultTransport,
+):
+    await add(
+        session_maker,
+        app_settings,
+        ("user-1", "a", "1"),
+        ("user-1", "b", "2"),
+        ("user-2", "c", "3"),
+    )
+
+    result = await dispatcher.dispatch()
+
+    assert (result.written, result.failed, result.dead_lettered) == (3, 0, 0)
+    assert transport.requests["POST data"] == 2  # noqa: PLR2004
+    assert await read(client, "user-1") == {"a": "1", "b": "2"}
+    assert await read(client, "user-2") == {"c": "3"}
+    assert await get_rows(session_maker) == []
+
+
+async def test_writing_an_entry_again_leaves_the_same_secret(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+    dispatcher: VaultOutboxDispatcher,
+    client: AsyncVaultClient,
+):
+    # an entry written, then claimed again after its dispatcher crashed
+    await add(session_maker, app_settings, ("user", "a", "1"))
+    await dispatcher.dispatch()
+    await add(session_maker, app_settings, ("user", "a", "1"))
+
+    result = await dispatcher.dispatch()
+
+    assert result.written == 1
+    assert await read(client, "user") == {"a": "1"}
+
+
+async def test_failed_entries_are_retried_after_a_backoff(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+    dispatcher: VaultOutboxDispatcher,
+    transport: InMemoryVaultTransport,
+):
+    await add(session_maker, app_settings, ("user", "a", "1"))
+    transport.error_rate = 1.0
+
+    result = await dispatcher.dispatch()
+
+    assert (result.written, result.failed, result.dead_lettered) == (0, 1, 0)
+    (row,) = await get_rows(session_maker)
+    assert row.attempts == 1
+    assert row.last_error
+    assert row.dead_lettered_at is None
+    # backoff of 10 seconds for the first attempt
+    assert row.available_at > datetime.now(UTC) + timedelta(seconds=5)
+    # not due yet, so the next round has nothing to do
+    assert (await dispatcher.dispatch()).failed == 0
+
+
+async def test_vault_errors_are_retried_at_the_max_backoff_forever(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+    dispatcher: VaultOutboxDispatcher,
+    transport: InMemoryVaultTransport,
+    client: AsyncVaultClient,
+):
+    await add(session_maker, app_settings, ("user", "a", "1"))
+    transport.error_rate = 1.0
+
+    async def dispatch_when_due() -> OutboxDispatchResult:
+        async with session_maker() as db_session, db_session.begin():
+            await db_session.execute(
+                update(vault_outbox_table).values(available_at=datetime.now(UTC)),
+            )
+        return await dispatcher.dispatch()
+
+    # a long outage, the backoff stops growing at 40 seconds
+    for _ in range(10):
+        result = await dispatch_when_due()
+        assert (result.failed, result.dead_lettered) == (1, 0)
+    (row,) = await get_rows(session_maker)
+    assert row.attempts == 10  # noqa: PLR2004
+    assert row.dead_lettered_at is None
+    assert row.available_at < datetime.now(UTC) + timedelta(seconds=41)
+
+    # the key is written once Vault is back
+    transport.error_rate = 0.0
+    assert (await dispatch_when_due()).written == 1
+    assert await read(client, "user") == {"a": "1"}
+
+
+async def test_undecryptable_entries_are_dead_lettered_at_once(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+    dispatcher: VaultOutboxDispatcher,
+    client: AsyncVaultClient,
+):
+    await add(session_maker, app_settings, ("user", "a", "1"), ("user", "b", "2"))
+    async with session_maker() as db_session, db_session.begin():
+        await db_session.execute(
+            update(vault_outbox_table)
+            .where(vault_outbox_table.c.key == "a")
+            .values(value_encrypted=b"not a token"),
+        )
+
+    result = await dispatcher.dispatch()
+
+    assert (result.written, result.failed, result.dead_lettered) == (1, 0, 1)
+    assert await read(client, "user") == {"b": "2"}
+    (row,) = await get_rows(session_maker)
+    assert row.key == "a"
+    assert row.dead_lettered_at is not None
+
+
+async def test_created_key_is_listed_before_it_is_dispatched(
+    session_maker: async_sessionmaker[AsyncSession],
+    app_settings: AppSettings,
+    vault_settings: VaultSettings,
+    dispatcher: VaultOutboxDispatcher,
+    client: AsyncVaultClient,
+    transport: InMemoryVaultTransport,
+):
+    user_id = UUID(str(uuid7()))
+    async with session_maker() as db_session, db_session.begin():
+        await db_session.execute(
+            insert(user_table).values(id=user_id, email="user@example.com"),
+        )
+
+    def make_outbox_repository(
+        db_session: AsyncSession,
+        vault_session: VaultSession,
+    ) -> ApiKeyVaultOutboxRepository:
+        return ApiKeyVaultOutboxRepository(
+            vault_repository=ApiKeyVaultRepository(vault_session, vault_settings),
+            outbox_repository=VaultOutboxRepository(db_session, app_settings),
+            vault_settings=vault_settings,
+        )
+
+    async with session_maker() as db_session:
+        vault_session = make_vault_session(client)
+        api_key = await CreateApiKeyInteractor(
+            # the container provides the session as IDatabaseSession
+            db_session=cast("IDatabaseSession", db_session),
+            vault_session=vault_session,
+            create_api_key_repository=ApiKeyRepository(session=db_session),
+            uuid7_generator_service=UUIDGeneratorService(),
+            hasher_service=HasherBlake2b(app_settings=app_settings),
+            vault_repository=make_outbox_repository(db_session, vault_session),
+            api_key_filter_repository=ApiKeyFilterRepository(),
+            auth_index_repository=AuthIndexRepository(),
+            app_settings=app_settings,
+        )(CreateApiKeyRequestModel(user_id=user_id))
+
+    # nothing is written to Vault yet, the user has no secret there
+    assert transport.requests["POST data"] == 0
+
+    async def get_api_keys() -> list[str]:
+        async with session_maker() as db_session:
+            response = await GetUserApiKeysInteractor(
+                api_key_vault_repository=make_outbox_repository(
+                    db_session,
+                    make_vault_session(client),
+                ),
+                api_key_alchemy_repository=ApiKeyRepository(session=db_session),
+            )(GetUserApiKeysRequestModel(user_id=user_id))
+        return [
+            user_api_key.api_key_value
+            for user_api_key in response.api_keys
+            if user_api_key.api_key_value is not None
+        ]
+
+    assert await get_api_keys() == [api_key]
+    await dispatcher.dispatch()
+    assert await get_api_keys() == [api_key]
@@ -0,0 +1,306 @@
+"""Tests of the Vault unit of work."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+
+import pytest
+from hvac.exceptions import InvalidPath
+from hvac.exceptions import InvalidRequest
+from hvac.exceptions import VaultDown
+
+from scripts.benchmarks.vault_transport import InMemoryVaultTransport
+from src.infrastructure.vault.cache import InMemoryVaultSecretCache
+from src.infrastructure.vault.client import AsyncVaultClient
+from src.infrastructure.vault.session import VaultMountCache
+from src.infrastructure.vault.session import VaultSession
+
+MOUNT_POINT = "api-keys"
+
+SessionFactory = Callable[..., VaultSession]
+
+
+@pytest.fixture()
+def transport() -> InMemoryVaultTransport:
+    return InMemoryVaultTransport()
+
+
+@pytest.fixture()
+async def client(transport: InMemoryVaultTransport) -> AsyncIterator[AsyncVaultClient]:
+    client = AsyncVaultClient(
+        url="http://vault.invalid",
+        token="token",  # noqa: S106
+        transport=transport,
+    )
+    yield client
+    await client.close()
+
+
+@pytest.fixture()
+def make_session(client: AsyncVaultClient) -> SessionFactory:
+    mount_cache = VaultMountCache(ttl=300)
+
+    def make_session(**kwargs) -> VaultSession:
+        return VaultSession(
+            vault_client=client,
+            mount_cache=mount_cache,
+            secret_cache=InMemoryVaultSecretCache(max_size=100),
+            **kwargs,
+        )
+
+    return make_session
+
+
+async def read(client: AsyncVaultClient, path: str) -> dict[str, str]:
+    return (await client.read_secret(path=path, mount_point=MOUNT_POINT)).data
+
+
+async def test_commit_writes_every_path(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+):
+    async with make_session().begin() as session:
+        session.create_or_patch("a", "key", "1", mount_point=MOUNT_POINT)
+        session.create_or_patch("b", "key", "2", mount_point=MOUNT_POINT)
+        await session.commit()
+
+    assert await read(client, "a") == {"key": "1"}
+    assert await read(client, "b") == {"key": "2"}
+
+
+async def test_failed_path_rolls_back_the_paths_already_written(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async with make_session().begin() as session:
+        session.create_or_patch("a", "key", "1", mount_point=MOUNT_POINT)
+        await session.commit()
+
+    write = client.create_or_update_secret
+
+    async def fail_on_c(path: str, **kwargs) -> int:
+        if path == "c":
+            msg = "connection refused"
+            raise VaultDown(msg)
+        return await write(path=path, **kwargs)
+
+    monkeypatch.setattr(client, "create_or_update_secret", fail_on_c)
+    session = make_session()
+    session.create_or_patch("a", "other", "2", mount_point=MOUNT_POINT)
+    session.create_or_patch("b", "key", "3", mount_point=MOUNT_POINT)
+    session.create_or_patch("c", "key", "4", mount_point=MOUNT_POINT)
+    with pytest.raises(VaultDown):
+        await session.commit()
+
+    # the patched secret is restored, the created ones are gone
+    assert await read(client, "a") == {"key": "1"}
+    for path in ("b", "c"):
+        with pytest.raises(InvalidPath):
+            await read(client, path)
+
+
+async def test_no_operation_starts_after_a_failure(make_session: SessionFactory):
+    session = make_session(flush_concurrency=1)
+    events: list[str] = []
+
+    def add(path: str, *, fail: bool = False) -> None:
+        async def execute() -> None:
+            events.append(f"run {path}")
+            if fail:
+                msg = "write failed"
+                raise RuntimeError(msg)
+
+        async def rollback() -> None:
+            events.append(f"undo {path}")
+
+        session.add_operation(MOUNT_POINT, execute, rollback, path=path)
+
+    add("a")
+    add("a")
+    add("b", fail=True)
+    add("c")
+
+    with pytest.raises(RuntimeError):
+        await session.commit()
+
+    # operations of a path run in order, rollback is in reverse
+    assert events == ["run a", "run a", "run b", "undo a", "undo a"]
+
+
+async def test_keys_of_one_path_are_written_as_one_version(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+    transport: InMemoryVaultTransport,
+):
+    session = make_session()
+    session.create_or_patch("a", "first", "1", mount_point=MOUNT_POINT)
+    session.create_or_patch("a", "second", "2", mount_point=MOUNT_POINT)
+    session.create_or_patch("a", "first", "3", mount_point=MOUNT_POINT)
+    await session.flush()
+
+    assert transport.requests["POST data"] == 1
+    secret = await client.read_secret(path="a", mount_point=MOUNT_POINT)
+    assert secret.data == {"first": "3", "second": "2"}
+    assert secret.version == 1
+
+    # a key added after the flush is a new write
+    session.create_or_patch("a", "third", "4", mount_point=MOUNT_POINT)
+    await session.commit()
+
+    assert transport.requests["POST data"] == 2  # noqa: PLR2004
+    assert await read(client, "a") == {"first": "3", "second": "2", "third": "4"}
+
+
+async def test_rollback_of_coalesced_keys_restores_the_secret(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+):
+    async with make_session().begin() as session:
+        session.create_or_patch("a", "key", "1", mount_point=MOUNT_POINT)
+        await session.commit()
+
+    session = make_session()
+    session.create_or_patch("a", "first", "2", mount_point=MOUNT_POINT)
+    session.create_or_patch("a", "second", "3", mount_point=MOUNT_POINT)
+    await session.flush()
+    await session.rollback()
+
+    assert await read(client, "a") == {"key": "1"}
+
+
+async def test_write_is_retried_after_a_conflicting_writer(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    async with make_session().begin() as session:
+        session.create_or_patch("a", "key", "1", mount_point=MOUNT_POINT)
+        await session.commit()
+    write = client.create_or_update_secret
+    conflicts = 0
+
+    async def write_after_another_writer(**kwargs) -> int:
+        # the secret changes after the session read its pre-image
+        nonlocal conflicts
+        if not conflicts:
+            conflicts += 1
+            await write(
+                path="a",
+                secret={"key": "1", "other": "2"},
+                mount_point=MOUNT_POINT,
+            )
+        return await write(**kwargs)
+
+    session = make_session()
+    session.create_or_patch("a", "mine", "3", mount_point=MOUNT_POINT)
+    monkeypatch.setattr(client, "create_or_update_secret", write_after_another_writer)
+    await session.commit()
+
+    secret = await client.read_secret(path="a", mount_point=MOUNT_POINT)
+    assert secret.data == {"key": "1", "other": "2", "mine": "3"}
+    assert secret.version == 3  # noqa: PLR2004
+    assert conflicts == 1
+
+
+async def test_invalid_write_is_not_retried(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls = 0
+
+    async def refuse(**kwargs) -> int:
+        nonlocal calls
+        calls += 1
+        msg = "invalid secret data"
+        raise InvalidRequest(msg)
+
+    monkeypatch.setattr(client, "create_or_update_secret", refuse)
+    session = make_session()
+    session.create_or_patch("a", "key", "1", mount_point=MOUNT_POINT)
+
+    with pytest.raises(InvalidRequest, match="invalid secret data"):
+        await session.commit()
+    assert calls == 1
+
+
+async def test_rollback_keeps_a_later_write_of_another_writer(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+):
+    async with make_session().begin() as session:
+        session.create_or_patch("a", "key", "1", mount_point=MOUNT_POINT)
+        await session.commit()
+
+    session = make_session()
+    session.create_or_patch("a", "mine", "2", mount_point=MOUNT_POINT)
+    await session.flush()
+    await client.create_or_update_secret(
+        path="a",
+        secret={"key": "1", "mine": "2", "other": "3"},
+        mount_point=MOUNT_POINT,
+    )
+    await session.rollback()
+
+    secret = await client.read_secret(path="a", mount_point=MOUNT_POINT)
+    assert secret.data == {"key": "1", "mine": "2", "other": "3"}
+    assert secret.version == 3  # noqa: PLR2004
+
+
+async def test_rollback_destroys_the_version_of_a_created_secret(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+):
+    session = make_session()
+    session.create_or_patch("a", "key", "1", mount_point=MOUNT_POINT)
+    await session.flush()
+    await session.rollback()
+
+    with pytest.raises(InvalidPath):
+        await read(client, "a")
+    assert await client.read_secret_version(path="a", mount_point=MOUNT_POINT) is None
+
+
+async def test_rollback_restores_the_secret_from_the_read_cache(
+    make_session: SessionFactory,
+    client: AsyncVaultClient,
+    transport: InMemoryVaultTransport,
+):
+    session = make_session()
+    async with session.begin():
+        session.create_or_patch("a", "key", "1", mount_point=MOUNT_POINT)
+        await session.commit()
+    transport.requests.clear()
+
+    # the same session keeps its read cache, the pre-image is not read
+    session.create_or_patch("a", "key", "2", mount_point=MOUNT_POINT)
+    await session.flush()
+    await session.rollback()
+
+    assert transport.requests["GET data"] == 0
+    assert await read(client, "a") == {"key": "1"}
+
+
+async def test_sessions_creating_the_mount_at_once_all_succeed(
+    client: AsyncVaultClient,
+    transport: InMemoryVaultTransport,
+):
+    transport.latency = 0.001
+
+    async def commit(path: str) -> None:
+        # every process has its own mount cache
+        session = VaultSession(
+            vault_client=client,
+            mount_cache=VaultMountCache(ttl=300),
+            secret_cache=InMemoryVaultSecretCache(max_size=100),
+        )
+        async with session.begin():
+            session.create_or_patch(path, "key", path, mount_point=MOUNT_POINT)
+            await session.commit()
+
+    await asyncio.gather(*(commit(path) for path in ("a", "b", "c")))
+
+    assert transport.requests["POST sys/mounts"] == 3  # noqa: PLR2004
+    for path in ("a", "b", "c"):
+        assert await read(client, path) == {"key": path}